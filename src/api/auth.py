@@ -9,14 +9,13 @@ Can be extended to support OAuth, JWT, etc.
 import hashlib
 import os
 import secrets
-from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Request, Security
 from fastapi.security import APIKeyHeader, APIKeyQuery
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # ============================================================
 # API KEY AUTH
@@ -211,37 +210,49 @@ async def check_rate_limit(
 # ============================================================
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Authentication middleware for all routes.
 
-    Skips auth for health checks and docs.
+    Skips auth for health checks, docs, and CORS preflights (browsers send
+    OPTIONS without credentials; CORSMiddleware answers them). Pure ASGI (not BaseHTTPMiddleware)
+    so streamed responses such as SSE pass through without being re-buffered
+    chunk by chunk.
     """
 
     SKIP_PATHS = {"/", "/health", "/docs", "/openapi.json", "/redoc"}
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        # Skip auth for certain paths
-        if request.url.path in self.SKIP_PATHS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip auth for non-HTTP traffic, preflights, and certain paths
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in self.SKIP_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
 
         # Check for API key
+        request = Request(scope)
         api_key = request.headers.get("X-API-Key") or request.query_params.get("api_key")
 
         valid_keys = get_api_keys()
 
         # If keys are configured, require auth
         if valid_keys and api_key not in valid_keys:
-            from fastapi.responses import JSONResponse
-
-            return JSONResponse(status_code=401, content={"detail": "Invalid or missing API key"})
+            response = JSONResponse(
+                status_code=401, content={"detail": "Invalid or missing API key"}
+            )
+            await response(scope, receive, send)
+            return
 
-        # Store key in request state for later use
+        # Store key in request state (shared via scope) for later use
         request.state.api_key = api_key or "dev-mode"
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def add_auth_middleware(app: FastAPI) -> None:
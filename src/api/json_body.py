@@ -0,0 +1,109 @@
+"""
+JSON Body Dependency
+====================
+
+Depends() factory that validates a request body straight from bytes with
+model_validate_json, so pydantic-core parses and validates in one pass
+instead of FastAPI's json.loads() + model_validate(dict).
+
+Usage:
+    @router.post("/email", openapi_extra=json_body_openapi(EmailWebhookPayload))
+    async def email_webhook(
+        payload: Annotated[EmailWebhookPayload, Depends(json_body(EmailWebhookPayload))],
+    ) -> ...:
+
+FastAPI can't see a body read inside a dependency, so routes pass
+json_body_openapi() to keep the request body in the OpenAPI schema.
+
+Errors are raised as RequestValidationError in the shape FastAPI gives a
+plain body parameter: "body"-prefixed locations, no pydantic URLs, and
+its own json_invalid/missing errors for malformed or empty bodies.
+"""
+
+import json
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_DEFS_REF_PREFIX = "#/$defs/"
+
+
+def json_body(model: type[ModelT]) -> Callable[[Request], Coroutine[Any, Any, ModelT]]:
+    """Build a dependency that returns model validated from the raw body."""
+
+    async def dependency(request: Request) -> ModelT:
+        body = await request.body()
+        if not body:
+            raise RequestValidationError(
+                [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+            )
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(_body_errors(e, body)) from None
+
+    return dependency
+
+
+def _body_errors(error: ValidationError, body: bytes) -> list[dict[str, Any]]:
+    """Validation errors as FastAPI reports them for a plain body parameter."""
+    errors = error.errors(include_url=False)
+    if errors[0]["type"] == "json_invalid":
+        return [_json_decode_error(body)]
+    return [{**err, "loc": ("body", *err["loc"])} for err in errors]
+
+
+def _json_decode_error(body: bytes) -> dict[str, Any]:
+    """
+    FastAPI's error for a body that isn't JSON.
+
+    Only the error path re-parses with json, to report its position and
+    message; the raw body is never echoed back as input.
+    """
+    try:
+        json.loads(body)
+    except json.JSONDecodeError as e:
+        return {
+            "type": "json_invalid",
+            "loc": ("body", e.pos),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": e.msg},
+        }
+    except ValueError:
+        pass
+    return {"type": "json_invalid", "loc": ("body",), "msg": "JSON decode error", "input": {}}
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """openapi_extra documenting model as a route's required JSON request body."""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": _inline_refs(schema, defs)}},
+            "required": True,
+        }
+    }
+
+
+def _inline_refs(node: Any, defs: dict[str, Any]) -> Any:
+    """Replace $defs references with the definitions (models must not be recursive)."""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_DEFS_REF_PREFIX):
+            siblings = {k: v for k, v in node.items() if k != "$ref"}
+            resolved = defs[ref.removeprefix(_DEFS_REF_PREFIX)]
+            return _inline_refs({**resolved, **siblings}, defs)
+        if "propertyName" in node:
+            # A discriminator's mapping names $defs entries, which no longer exist
+            node = {k: v for k, v in node.items() if k != "mapping"}
+        return {k: _inline_refs(v, defs) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(v, defs) for v in node]
+    return node
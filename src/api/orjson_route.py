@@ -0,0 +1,39 @@
+"""
+orjson Routing
+==============
+
+APIRoute that parses JSON request bodies with orjson instead of the
+stdlib json module. Pair with default_response_class=ORJSONResponse on
+the router so both directions skip stdlib json.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so malformed
+bodies still get FastAPI's usual 422.
+"""
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request whose json() decodes with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands endpoints an ORJSONRequest."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
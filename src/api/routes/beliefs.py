@@ -7,13 +7,14 @@ Per API_CONTRACT_V0.md section 4
 """
 
 import uuid
-from datetime import datetime
+from itertools import islice
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
 from ...graphs.belief_graph_manager import get_org_belief_graph
 from ...observability import get_logger
+from ...utils.clock import now_iso
 from ..schemas.beliefs import (
     BeliefChallengeRequest,
     BeliefChallengeResponse,
@@ -44,16 +45,12 @@ async def list_beliefs(
     """
     try:
         graph = await get_org_belief_graph(org_id)
-        beliefs = graph.get_all_beliefs()
+        # Let the graph filter by category instead of copying every belief first
+        beliefs = graph.get_beliefs_by_category(category) if category else graph.get_all_beliefs()
 
-        # Filter
-        if category:
-            beliefs = [b for b in beliefs if b.get("category") == category]
-        if status:
-            beliefs = [b for b in beliefs if b.get("status", "active") == status]
-
-        # Paginate
-        beliefs = beliefs[offset : offset + limit]
+        # Filter lazily and stop once the page is full
+        matching = (b for b in beliefs if not status or b.get("status", "active") == status)
+        beliefs = list(islice(matching, offset, offset + limit))
 
         return [
             BeliefResponse(
@@ -101,7 +98,7 @@ async def get_belief(org_id: str, belief_id: str) -> BeliefDetailResponse:
             )
 
         # Build version history (placeholder - will be enhanced)
-        created_at_str = str(belief.get("created_at") or datetime.now().isoformat())
+        created_at_str = str(belief.get("created_at") or now_iso())
         versions = [
             BeliefVersion(
                 version=1,
@@ -135,7 +132,7 @@ async def get_belief(org_id: str, belief_id: str) -> BeliefDetailResponse:
             supported_by=belief.get("supported_by", []),
             source=str(belief.get("source") or "system"),
             created_at=created_at_str,
-            updated_at=str(belief.get("updated_at") or datetime.now().isoformat()),
+            updated_at=str(belief.get("updated_at") or now_iso()),
             challenge_count=int(str(belief.get("challenge_count", 0) or 0)),
             active_challenge=str(active_challenge_val) if active_challenge_val else None,
         )
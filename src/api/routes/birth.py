@@ -5,9 +5,9 @@ Birth Routes
 Agent initialization endpoint with first impression psychology.
 """
 
+import asyncio
 import uuid
-from datetime import datetime
-from typing import Optional, cast
+from typing import Any, Optional, cast
 
 from fastapi import APIRouter, HTTPException, Request
 
@@ -17,12 +17,136 @@ from ...observability import get_logger
 from ...persistence.rapport import create_rapport
 from ...scheduler.defaults import seed_org_triggers
 from ...scheduler.message_factory import create_birth_state
+from ...utils.clock import now_iso
 from ..schemas.birth import BirthRequest, BirthResponse
 
 logger = get_logger("baby_mars.api.birth")
 
 router = APIRouter()
 
+_BIRTH_FAILED_ERROR: dict[str, Any] = {
+    "code": "BIRTH_FAILED",
+    "message": "Failed to create agent. Please try again or contact support.",
+    "severity": "error",
+    "recoverable": True,
+    "actions": [
+        {"label": "Try again", "action": "retry"},
+    ],
+}
+
+
+def _new_session(birth_result: dict[str, Any], greeting: Optional[str]) -> dict[str, Any]:
+    """Fresh chat session for a just-born agent."""
+    return {
+        "birth_result": birth_result,
+        "state": None,  # Created on first message
+        "created_at": now_iso(),
+        "message_count": 0,
+        "context_pills": [],  # Active context items
+        "interrupt_event": None,  # For chat interruption
+        "first_impression_delivered": greeting is not None,
+    }
+
+
+def _birth_person(request_data: BirthRequest, person_id: str, org_id: str) -> dict[str, Any]:
+    """
+    Birth the person with all 6 things.
+
+    Runs on the event loop, not in a worker thread: birth_person seeds the
+    process-wide BeliefGraph, which /message and the cognitive loop read
+    from the loop without locking.
+    """
+    return birth_person(
+        person_id=person_id,
+        name=request_data.name,
+        email=request_data.email,
+        role=request_data.role,
+        org_id=org_id,
+        org_name=request_data.org_name,
+        industry=request_data.industry,
+        # org_size and capabilities_override not supported by birth_person yet
+    )
+
+
+async def _seed_triggers(org_id: str, org_timezone: str) -> None:
+    """Seed default triggers for proactive behaviors (SYSTEM_PULSE)."""
+    try:
+        await seed_org_triggers(org_id, org_timezone)
+        logger.info("Seeded default triggers for org %s", org_id)
+    except Exception as e:
+        # Non-fatal: org can still function without triggers
+        logger.warning("Failed to seed triggers for org %s: %s", org_id, e)
+
+
+async def _generate_first_impression(
+    request_data: BirthRequest, org_id: str, org_timezone: str
+) -> Optional[str]:
+    """
+    Generate Aleq's greeting.
+
+    This is the critical first moment of rapport building.
+    Research shows first impressions form in 7 seconds and persist.
+    """
+    try:
+        # Create birth state for first impression
+        birth_state = create_birth_state(
+            org_id=org_id,
+            person_name=request_data.name,
+            person_role=request_data.role,
+            industry=request_data.industry,
+            org_timezone=org_timezone,
+        )
+
+        # Run through cognitive loop for authentic, belief-informed greeting
+        from ...state.schema import BabyMARSState
+
+        graph = create_graph_in_memory()
+        result_state = await invoke_cognitive_loop(cast(BabyMARSState, birth_state), graph)
+
+        # Extract greeting from final response
+        greeting = result_state.get("final_response")
+        if greeting:
+            logger.info("First impression generated for %s", request_data.name)
+        return greeting
+    except Exception as e:
+        # Non-fatal: birth succeeds even if greeting fails
+        logger.warning("Failed to generate first impression: %s", e)
+        return None
+
+
+async def _seed_triggers_and_greet(request_data: BirthRequest, org_id: str) -> Optional[str]:
+    """
+    Seed triggers and generate the greeting concurrently.
+
+    Trigger seeding (DB) and the greeting (LLM) are independent, so their
+    latencies overlap. Both helpers handle their own failures.
+    """
+    _, greeting = await asyncio.gather(
+        _seed_triggers(org_id, request_data.timezone),
+        _generate_first_impression(request_data, org_id, request_data.timezone),
+    )
+    return greeting
+
+
+async def _init_rapport(
+    org_id: str, person_id: str, person_name: str, greeting: Optional[str]
+) -> None:
+    """Initialize relationship tracking."""
+    try:
+        rapport = await create_rapport(
+            org_id=org_id,
+            person_id=person_id,
+            person_name=person_name,
+            first_impression_text=greeting,
+        )
+        if rapport:
+            logger.info("Rapport initialized for %s", person_name)
+        else:
+            logger.warning("Rapport already exists or failed for %s", person_name)
+    except Exception as e:
+        # Non-fatal: we can create rapport later
+        logger.warning("Failed to create rapport: %s", e)
+
 
 @router.post("", response_model=BirthResponse)
 async def birth(request_data: BirthRequest, request: Request) -> BirthResponse:
@@ -39,97 +163,28 @@ async def birth(request_data: BirthRequest, request: Request) -> BirthResponse:
     org_id = request_data.org_id or f"org_{uuid.uuid4().hex[:12]}"
 
     try:
-        # Birth the person with all 6 things
-        birth_result = birth_person(
-            person_id=person_id,
-            name=request_data.name,
-            email=request_data.email,
-            role=request_data.role,
-            org_id=org_id,
-            org_name=request_data.org_name,
-            industry=request_data.industry,
-            # org_size and capabilities_override not supported by birth_person yet
-        )
-
-        # Seed default triggers for proactive behaviors (SYSTEM_PULSE)
-        org_timezone = request_data.timezone
-        try:
-            await seed_org_triggers(org_id, org_timezone)
-            logger.info(f"Seeded default triggers for org {org_id}")
-        except Exception as e:
-            # Non-fatal: org can still function without triggers
-            logger.warning(f"Failed to seed triggers for org {org_id}: {e}")
+        birth_result = _birth_person(request_data, person_id, org_id)
 
         # Create session
         session_id = f"session_{uuid.uuid4().hex[:12]}"
 
-        # ============================================================
-        # FIRST IMPRESSION: Generate Aleq's greeting
-        # ============================================================
-        # This is the critical first moment of rapport building.
-        # Research shows first impressions form in 7 seconds and persist.
-        greeting: Optional[str] = None
-        try:
-            # Create birth state for first impression
-            birth_state = create_birth_state(
-                org_id=org_id,
-                person_name=request_data.name,
-                person_role=request_data.role,
-                industry=request_data.industry,
-                org_timezone=org_timezone,
-            )
-
-            # Run through cognitive loop for authentic, belief-informed greeting
-            from ...state.schema import BabyMARSState
-
-            graph = create_graph_in_memory()
-            result_state = await invoke_cognitive_loop(cast(BabyMARSState, birth_state), graph)
-
-            # Extract greeting from final response
-            greeting = result_state.get("final_response")
-            if greeting:
-                logger.info(f"First impression generated for {request_data.name}")
-        except Exception as e:
-            # Non-fatal: birth succeeds even if greeting fails
-            logger.warning(f"Failed to generate first impression: {e}")
-            greeting = None
-
-        # ============================================================
-        # CREATE RAPPORT: Initialize relationship tracking
-        # ============================================================
-        try:
-            rapport = await create_rapport(
-                org_id=org_id,
-                person_id=person_id,
-                person_name=request_data.name,
-                first_impression_text=greeting,
-            )
-            if rapport:
-                logger.info(f"Rapport initialized for {request_data.name}")
-            else:
-                logger.warning(f"Rapport already exists or failed for {request_data.name}")
-        except Exception as e:
-            # Non-fatal: we can create rapport later
-            logger.warning(f"Failed to create rapport: {e}")
+        greeting = await _seed_triggers_and_greet(request_data, org_id)
+        await _init_rapport(org_id, person_id, request_data.name, greeting)
 
         # Store in app state (will be upgraded to Redis in Phase 2)
-        request.app.state.sessions[session_id] = {
-            "birth_result": birth_result,
-            "state": None,  # Created on first message
-            "created_at": datetime.now().isoformat(),
-            "message_count": 0,
-            "context_pills": [],  # Active context items
-            "interrupt_event": None,  # For chat interruption
-            "first_impression_delivered": greeting is not None,
-        }
+        request.app.state.sessions[session_id] = _new_session(birth_result, greeting)
 
         logger.info(
-            f"Birth complete: person={person_id}, org={org_id}, "
-            f"session={session_id}, mode={birth_result['birth_mode']}, "
-            f"greeting={'generated' if greeting else 'skipped'}"
+            "Birth complete: person=%s, org=%s, session=%s, mode=%s, greeting=%s",
+            person_id,
+            org_id,
+            session_id,
+            birth_result["birth_mode"],
+            "generated" if greeting else "skipped",
         )
 
-        return BirthResponse(
+        # Built from birth_person output and IDs minted above; skip re-validation
+        return BirthResponse.model_construct(
             person_id=person_id,
             org_id=org_id,
             birth_mode=birth_result["birth_mode"],
@@ -140,18 +195,5 @@ async def birth(request_data: BirthRequest, request: Request) -> BirthResponse:
         )
 
     except Exception as e:
-        logger.error(f"Birth failed: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "BIRTH_FAILED",
-                    "message": "Failed to create agent. Please try again or contact support.",
-                    "severity": "error",
-                    "recoverable": True,
-                    "actions": [
-                        {"label": "Try again", "action": "retry"},
-                    ],
-                }
-            },
-        )
+        logger.error("Birth failed: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail={"error": _BIRTH_FAILED_ERROR})
@@ -7,20 +7,21 @@ Per API_CONTRACT_V0.md sections 1.1-1.4
 """
 
 import asyncio
-import json
+import secrets
 import time
-from datetime import datetime
-from typing import Any, AsyncIterator, cast
+from typing import Annotated, Any, AsyncIterator, Optional, cast
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from langchain_core.runnables import RunnableConfig
-from sse_starlette.sse import EventSourceResponse
 
 from ...birth.birth_system import create_initial_state
 from ...cognitive_loop.graph import invoke_cognitive_loop, stream_cognitive_loop
 from ...observability import get_logger
 from ...state.constants import APPROVAL_TIMEOUT_SECONDS
 from ...state.schema import BabyMARSState
+from ...utils.clock import now_iso
+from ..json_body import json_body, json_body_openapi
 from ..schemas.chat import (
     ApprovalRequest,
     ChatInterruptRequest,
@@ -29,11 +30,26 @@ from ..schemas.chat import (
     MessageResponse,
     Reference,
 )
+from ..services.chat_stream import (
+    SSE_HEADERS,
+    batched_sse_events,
+    build_complete_event,
+    is_token_frame,
+    sse_frame,
+)
+from ..services.response_cache import ResponseCache, fingerprint
 
 logger = get_logger("baby_mars.api.chat")
 
 router = APIRouter()
 
+# Turns of history kept in the session's state mirror. The checkpointer holds
+# the full thread, so older messages are trimmed here to bound session memory.
+SESSION_MESSAGE_WINDOW = 64
+
+# Recent send_message responses by (session, client_message_id), for replaying retries
+_response_cache = ResponseCache()
+
 
 def _update_session_state(
     session: dict[str, Any], message: str, birth_result: Any
@@ -48,7 +64,10 @@ def _update_session_state(
         if not thread_id:
             session["thread_id"] = new_state["thread_id"]
     else:
-        session["state"]["messages"].append({"role": "user", "content": message})
+        messages = session["state"]["messages"]
+        messages.append({"role": "user", "content": message})
+        if len(messages) > SESSION_MESSAGE_WINDOW:
+            del messages[:-SESSION_MESSAGE_WINDOW]
         # Handle both turn_number and current_turn for backwards compatibility
         if "turn_number" in session["state"]:
             session["state"]["turn_number"] += 1
@@ -60,55 +79,92 @@ def _update_session_state(
 
 def _extract_references(result: BabyMARSState) -> list[Reference]:
     """Extract references from cognitive loop result."""
-    references: list[Reference] = []
     referenced_objs: list[dict[str, Any]] = cast(
         list[dict[str, Any]], result.get("referenced_objects") or []
     )
-    for ref in referenced_objs:
-        references.append(
-            Reference(
-                type=ref.get("type", "widget"),
-                id=ref.get("id", ""),
-                intensity=ref.get("intensity", "mention"),
-            )
+    if not referenced_objs:
+        return []
+    # referenced_objects is internal cognitive loop state, not client input,
+    # so skip per-field validation with model_construct.
+    return [
+        Reference.model_construct(
+            type=ref.get("type", "widget"),
+            id=ref.get("id", ""),
+            intensity=ref.get("intensity", "mention"),
         )
-    return references
+        for ref in referenced_objs
+    ]
+
+
+# Static error bodies, built once at import. FastAPI only serializes
+# HTTPException.detail, so these are shared and must never be mutated.
+_RETRY_CONFIG: dict[str, Any] = {"after_seconds": 2, "max_attempts": 3, "strategy": "exponential"}
+_RETRY_ACTIONS: list[dict[str, str]] = [{"label": "Try again", "action": "retry"}]
+
+_SESSION_NOT_FOUND_DETAIL: dict[str, Any] = {
+    "error": {
+        "code": "SESSION_NOT_FOUND",
+        "message": "Session not found. Did it expire?",
+        "severity": "error",
+        "recoverable": True,
+        "actions": [
+            {"label": "Start new session", "action": "new_session"},
+        ],
+    }
+}
+
+_APPROVAL_TIMEOUT_DETAIL: dict[str, Any] = {
+    "error": {
+        "code": "APPROVAL_TIMEOUT",
+        "message": "Approval request has expired. Please send a new message.",
+        "severity": "warning",
+        "recoverable": True,
+        "timeout_seconds": APPROVAL_TIMEOUT_SECONDS,
+    }
+}
+
+_NO_ACTIVE_STATE_DETAIL: dict[str, Any] = {
+    "error": {
+        "code": "NO_ACTIVE_STATE",
+        "message": "No conversation state found",
+        "severity": "warning",
+    }
+}
+
+_NO_PENDING_APPROVAL_DETAIL: dict[str, Any] = {
+    "error": {
+        "code": "NO_PENDING_APPROVAL",
+        "message": "No action waiting for approval",
+        "severity": "info",
+    }
+}
 
 
 def _build_error_detail(code: str, message: str, retryable: bool = False) -> dict[str, Any]:
     """Build error detail dict for HTTPException."""
-    detail: dict[str, Any] = {
-        "error": {"code": code, "message": message, "severity": "error", "recoverable": True}
+    error: dict[str, Any] = {
+        "code": code,
+        "message": message,
+        "severity": "error",
+        "recoverable": True,
     }
     if retryable:
-        detail["error"]["retryable"] = True
-        detail["error"]["retry"] = {
-            "after_seconds": 2,
-            "max_attempts": 3,
-            "strategy": "exponential",
-        }
-        detail["error"]["actions"] = [{"label": "Try again", "action": "retry"}]
-    return detail
+        error["retryable"] = True
+        error["retry"] = _RETRY_CONFIG
+        error["actions"] = _RETRY_ACTIONS
+    return {"error": error}
+
+
+_APPROVAL_FAILED_DETAIL = _build_error_detail(
+    "APPROVAL_FAILED", "Failed to process approval", retryable=True
+)
 
 
 def get_session(request: Request, session_id: str) -> dict[str, Any]:
     """Get session or raise 404"""
     session: dict[str, Any] | None = request.app.state.sessions.get(session_id)
     if not session:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": "Session not found. Did it expire?",
-                    "severity": "error",
-                    "recoverable": True,
-                    "actions": [
-                        {"label": "Start new session", "action": "new_session"},
-                    ],
-                }
-            },
-        )
+        raise HTTPException(status_code=404, detail=_SESSION_NOT_FOUND_DETAIL)
     return session
 
 
@@ -130,10 +186,11 @@ def _build_message_response(
     thread_id = result.get("thread_id") or session.get("thread_id", "unknown")
 
     logger.info(
-        f"Message processed: session={session_id}, thread={thread_id}, mode={supervision_mode}"
+        "Message processed: session=%s, thread=%s, mode=%s", session_id, thread_id, supervision_mode
     )
 
-    return MessageResponse(
+    # Every field is built here from loop state, so skip re-validation
+    return MessageResponse.model_construct(
         session_id=session_id,
         thread_id=thread_id,
         response=str(result.get("final_response", "")),
@@ -146,51 +203,79 @@ def _build_message_response(
     )
 
 
-@router.post("", response_model=MessageResponse)
-async def send_message(request_data: MessageRequest, request: Request) -> MessageResponse:
+def _prepare_turn_state(session: dict[str, Any], request_data: MessageRequest) -> BabyMARSState:
+    """Build the input state for a send_message turn."""
+    # Forever conversations: if thread_id provided, use it for checkpoint resume
+    resume_thread_id = request_data.thread_id
+    if resume_thread_id:
+        # Resume from checkpoint: only pass the new message, let LangGraph load the rest
+        session["thread_id"] = resume_thread_id
+        logger.info("Resuming conversation from thread_id=%s", resume_thread_id)
+        # Minimal state - just the new message. LangGraph will merge with checkpoint.
+        return cast(
+            BabyMARSState,
+            {
+                "thread_id": resume_thread_id,
+                "messages": [{"role": "user", "content": request_data.message}],
+            },
+        )
+    # New conversation: create full initial state
+    return _update_session_state(session, request_data.message, session["birth_result"])
+
+
+def _replay_key(request_data: MessageRequest) -> Optional[bytes]:
+    """
+    Cache key identifying a retry of one turn, or None if the client sent no ID.
+
+    Keyed on the client's message ID, never the message text: users repeat
+    short replies ("yes", "continue") and each of those is a new turn.
+    """
+    if not request_data.client_message_id:
+        return None
+    return fingerprint(request_data.session_id, request_data.client_message_id)
+
+
+@router.post("", response_model=MessageResponse, openapi_extra=json_body_openapi(MessageRequest))
+async def send_message(
+    request_data: Annotated[MessageRequest, Depends(json_body(MessageRequest))], request: Request
+) -> MessageResponse:
     """Send a message and run the full cognitive loop."""
     session = get_session(request, request_data.session_id)
+
+    # Client retries of the same turn replay the earlier response (checked
+    # before touching the session, so a replay leaves pending_message intact)
+    replay_key = _replay_key(request_data)
+    if replay_key:
+        cached = _response_cache.get(replay_key)
+        if cached:
+            logger.info("Replaying cached response for retried message")
+            return cast(MessageResponse, cached)
+
     pending_message = session.pop("pending_message", None)
     if pending_message:
         request_data.message = f"{pending_message}\n\n{request_data.message}"
 
     try:
-        # Forever conversations: if thread_id provided, use it for checkpoint resume
-        resume_thread_id = request_data.thread_id
-        if resume_thread_id:
-            # Resume from checkpoint: only pass the new message, let LangGraph load the rest
-            session["thread_id"] = resume_thread_id
-            logger.info(f"Resuming conversation from thread_id={resume_thread_id}")
-            # Minimal state - just the new message. LangGraph will merge with checkpoint.
-            state = cast(
-                BabyMARSState,
-                {
-                    "thread_id": resume_thread_id,
-                    "messages": [{"role": "user", "content": request_data.message}],
-                },
-            )
-        else:
-            # New conversation: create full initial state
-            state = _update_session_state(session, request_data.message, session["birth_result"])
+        state = _prepare_turn_state(session, request_data)
 
         if request_data.context_pills:
             session["context_pills"] = [
                 {"type": p.type, "id": p.id} for p in request_data.context_pills
             ]
 
-        thread_id = resume_thread_id or state["thread_id"]
-        config = cast(RunnableConfig, {"configurable": {"thread_id": thread_id}})
+        thread_id = request_data.thread_id or state["thread_id"]
+        config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
         result = await invoke_cognitive_loop(
             state=state, graph=request.app.state.graph, config=config
         )
         session["state"] = result
-        return _build_message_response(request_data.session_id, result, session)
+        response = _build_message_response(request_data.session_id, result, session)
+        if replay_key:
+            _response_cache.put(replay_key, response)
+        return response
 
     except Exception as e:
-        import traceback
-
-        tb = traceback.format_exc()
-        logger.error(f"Message processing failed: {e!r}\n{tb}")
+        logger.error("Message processing failed: %r", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=_build_error_detail(
@@ -199,92 +284,50 @@ async def send_message(request_data: MessageRequest, request: Request) -> Messag
         )
 
 
-def _process_stream_event(event: dict[str, Any], state: BabyMARSState) -> dict[str, str] | None:
-    """Process a single stream event and return SSE dict or None."""
-    event_type = event.get("event", "")
-    if event_type == "on_chain_start":
-        return {"event": "node_start", "data": json.dumps({"node": event.get("name", "unknown")})}
-    elif event_type == "on_chain_end":
-        output = event.get("data", {}).get("output", {})
-        if isinstance(output, dict):
-            state.update(cast(BabyMARSState, output))
-        return {
-            "event": "node_end",
-            "data": json.dumps(
-                {
-                    "node": event.get("name", "unknown"),
-                    "supervision_mode": state.get("supervision_mode"),
-                }
-            ),
-        }
-    elif event_type == "on_llm_stream":
-        chunk = event.get("data", {}).get("chunk", "")
-        if chunk:
-            return {"event": "token", "data": json.dumps({"text": chunk})}
-    return None
-
-
-def _build_complete_event(state: BabyMARSState, thread_id: str) -> dict[str, str]:
-    """Build the 'complete' SSE event."""
-    return {
-        "event": "complete",
-        "data": json.dumps(
-            {
-                "thread_id": state.get("thread_id", thread_id),
-                "response": state.get("final_response", ""),
-                "supervision_mode": state.get("supervision_mode", ""),
-                "belief_strength": state.get("belief_strength_for_action", 0.0),
-                "approval_needed": state.get("supervision_mode") == "action_proposal",
-            }
-        ),
-    }
-
-
-@router.post("/stream")
+@router.post("/stream", openapi_extra=json_body_openapi(MessageRequest))
 async def send_message_stream(
-    request_data: MessageRequest, request: Request
-) -> EventSourceResponse:
+    request_data: Annotated[MessageRequest, Depends(json_body(MessageRequest))], request: Request
+) -> StreamingResponse:
     """Send a message and stream the response via SSE."""
     session = get_session(request, request_data.session_id)
     session["interrupt_event"] = asyncio.Event()
 
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
+    async def event_generator() -> AsyncIterator[bytes]:
         try:
             resume_thread_id = request_data.thread_id
             if resume_thread_id:
                 session["thread_id"] = resume_thread_id
-                logger.info(f"Resuming stream from thread_id={resume_thread_id}")
+                logger.info("Resuming stream from thread_id=%s", resume_thread_id)
 
             state = _update_session_state(session, request_data.message, session["birth_result"])
             thread_id = resume_thread_id or state["thread_id"]
-            config = cast(RunnableConfig, {"configurable": {"thread_id": thread_id}})
+            config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
 
-            async for event in stream_cognitive_loop(
+            events = stream_cognitive_loop(
                 state=state, graph=request.app.state.graph, config=config
-            ):
+            )
+            streamed_tokens = False
+            async for frame in batched_sse_events(events, state):
                 if session["interrupt_event"].is_set():
-                    yield {
-                        "event": "interrupted",
-                        "data": json.dumps(
-                            {
-                                "partial_response": state.get("final_response", ""),
-                                "will_resume": True,
-                            }
-                        ),
-                    }
+                    yield sse_frame(
+                        "interrupted",
+                        {"partial_response": state.get("final_response", ""), "will_resume": True},
+                    )
                     return
-                sse_event = _process_stream_event(event, state)
-                if sse_event:
-                    yield sse_event
+                if is_token_frame(frame):
+                    streamed_tokens = True
+                yield frame
 
-            yield _build_complete_event(state, thread_id)
+            # Clients already have the response text if it arrived as tokens
+            yield build_complete_event(state, thread_id, include_response=not streamed_tokens)
         except Exception as e:
-            logger.error(f"Stream error: {e}", exc_info=True)
-            yield {"event": "error", "data": json.dumps({"message": str(e)})}
+            logger.error("Stream error: %s", e, exc_info=True)
+            yield sse_frame("error", {"message": str(e)})
         finally:
             session["interrupt_event"] = None
 
-    return EventSourceResponse(event_generator())
+    # Frames are already SSE wire format; no per-event reformatting needed
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @router.post("/interrupt", response_model=ChatInterruptResponse)
@@ -335,18 +378,7 @@ def _check_approval_timeout(session: dict[str, Any]) -> None:
     if timeout_at and time.time() > timeout_at:
         # Clear the timeout to prevent repeated errors
         session.pop("approval_timeout_at", None)
-        raise HTTPException(
-            status_code=408,
-            detail={
-                "error": {
-                    "code": "APPROVAL_TIMEOUT",
-                    "message": "Approval request has expired. Please send a new message.",
-                    "severity": "warning",
-                    "recoverable": True,
-                    "timeout_seconds": APPROVAL_TIMEOUT_SECONDS,
-                }
-            },
-        )
+        raise HTTPException(status_code=408, detail=_APPROVAL_TIMEOUT_DETAIL)
 
 
 def _validate_approval_state(session: dict[str, Any]) -> BabyMARSState:
@@ -356,39 +388,19 @@ def _validate_approval_state(session: dict[str, Any]) -> BabyMARSState:
 
     state = session.get("state")
     if not state:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": {
-                    "code": "NO_ACTIVE_STATE",
-                    "message": "No conversation state found",
-                    "severity": "warning",
-                }
-            },
-        )
+        raise HTTPException(status_code=400, detail=_NO_ACTIVE_STATE_DETAIL)
     if state.get("supervision_mode") != "action_proposal":
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": {
-                    "code": "NO_PENDING_APPROVAL",
-                    "message": "No action waiting for approval",
-                    "severity": "info",
-                }
-            },
-        )
+        raise HTTPException(status_code=400, detail=_NO_PENDING_APPROVAL_DETAIL)
     return cast(BabyMARSState, state)
 
 
 def _add_feedback_note(state: BabyMARSState, feedback: str, approved: bool) -> None:
     """Add approval feedback as a note to state."""
-    import uuid
-
     state["notes"].append(
         {
-            "note_id": f"approval_feedback_{uuid.uuid4().hex[:8]}",
+            "note_id": f"approval_feedback_{secrets.token_hex(4)}",
             "content": feedback,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso(),
             "ttl_hours": 24,
             "priority": 0.8,
             "source": "user",
@@ -411,17 +423,19 @@ async def approve_action(request_data: ApprovalRequest, request: Request) -> Mes
         if request_data.feedback:
             _add_feedback_note(state, request_data.feedback, request_data.approved)
 
-        config = cast(RunnableConfig, {"configurable": {"thread_id": state["thread_id"]}})
+        config: RunnableConfig = {"configurable": {"thread_id": state["thread_id"]}}
         result = await invoke_cognitive_loop(
             state=state, graph=request.app.state.graph, config=config
         )
         session["state"] = result
 
         logger.info(
-            f"Approval processed: session={request_data.session_id}, approved={request_data.approved}"
+            "Approval processed: session=%s, approved=%s",
+            request_data.session_id,
+            request_data.approved,
         )
 
-        return MessageResponse(
+        return MessageResponse.model_construct(
             session_id=request_data.session_id,
             thread_id=result.get("thread_id") or state["thread_id"],
             response=str(result.get("final_response", "")),
@@ -433,10 +447,5 @@ async def approve_action(request_data: ApprovalRequest, request: Request) -> Mes
             context_budget=None,
         )
     except Exception as e:
-        logger.error(f"Approval processing failed: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=_build_error_detail(
-                "APPROVAL_FAILED", "Failed to process approval", retryable=True
-            ),
-        )
+        logger.error("Approval processing failed: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=_APPROVAL_FAILED_DETAIL)
@@ -6,14 +6,17 @@ Decision lifecycle with idempotency and undo.
 Per API_CONTRACT_V0.md section 3
 """
 
-import asyncio
-import uuid
+import secrets
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
 
 from ...observability import get_logger
+from ...utils.clock import now_iso
 from ..schemas.decisions import (
     BeliefSnapshot,
     DecisionDetail,
@@ -21,56 +24,116 @@ from ..schemas.decisions import (
     DecisionExecuteResponse,
     DecisionUndoResponse,
 )
+from ..services.decision_store import DecisionStore
+from ..services.expiry_reaper import ExpiryReaper
 
 logger = get_logger("baby_mars.api.decisions")
 
 router = APIRouter()
 
 # In-memory decision store (will be moved to persistence layer)
-# Structure: {decision_id: DecisionDetail}
-# NOTE: Protected by _decisions_lock for concurrent access in async handlers
-_decisions: dict[str, dict[str, Any]] = {}
+# Structure: {decision_id: DecisionDetail}, sharded with one lock per shard
+_decisions = DecisionStore()
 
-# Idempotency tracking: {idempotency_key: (decision_id, created_at)}
+# Last rendered DecisionDetail per decision: {decision_id: (revision, detail)}
+_detail_cache: dict[str, tuple[int, DecisionDetail]] = {}
+
+# Idempotency tracking: {idempotency_key: (decision_id, created_at_monotonic)}
+# Kept in insertion (= creation time) order so expired keys are always at the front.
 # Keys are cleaned up after 24 hours
-_idempotency_keys: dict[str, tuple[str, datetime]] = {}
+_idempotency_keys: OrderedDict[str, tuple[str, float]] = OrderedDict()
 IDEMPOTENCY_TTL_HOURS = 24
+IDEMPOTENCY_TTL_SECONDS = IDEMPOTENCY_TTL_HOURS * 3600
 
-# Lock for concurrent access protection in async handlers
-# Protects critical read-modify-write operations on _decisions and _idempotency_keys
-_decisions_lock = asyncio.Lock()
+# Sweep expired idempotency keys at most this often (monotonic seconds)
+IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS = 60
+_last_idempotency_cleanup = 0.0
 
 # Soft commit window in seconds
 UNDO_WINDOW_SECONDS = 30
 
 
 def _cleanup_expired_idempotency_keys() -> None:
-    """Remove idempotency keys older than 24 hours."""
-    cutoff = datetime.now() - timedelta(hours=IDEMPOTENCY_TTL_HOURS)
-    expired = [k for k, (_, ts) in _idempotency_keys.items() if ts < cutoff]
-    for key in expired:
-        del _idempotency_keys[key]
+    """Remove idempotency keys older than 24 hours (oldest first, stops at first fresh key)."""
+    cutoff = time.monotonic() - IDEMPOTENCY_TTL_SECONDS
+    expired = 0
+    while _idempotency_keys:
+        _, (_, created_at) = next(iter(_idempotency_keys.items()))
+        if created_at >= cutoff:
+            break
+        _idempotency_keys.popitem(last=False)
+        expired += 1
     if expired:
-        logger.debug(f"Cleaned up {len(expired)} expired idempotency keys")
+        logger.debug("Cleaned up %s expired idempotency keys", expired)
+
+
+def _maybe_cleanup_idempotency_keys() -> None:
+    """Run the expiry sweep if the last one was over a cleanup interval ago."""
+    global _last_idempotency_cleanup
+    now = time.monotonic()
+    if now - _last_idempotency_cleanup < IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS:
+        return
+    _last_idempotency_cleanup = now
+    _cleanup_expired_idempotency_keys()
+
+
+# Static part of the 404 body; only the message varies per ID
+_DECISION_NOT_FOUND_ERROR: dict[str, Any] = {"code": "DECISION_NOT_FOUND", "severity": "warning"}
 
 
 def _get_decision_or_404(decision_id: str) -> dict[str, Any]:
     """Get decision or raise 404"""
     decision = _decisions.get(decision_id)
-    if not decision:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "DECISION_NOT_FOUND",
-                    "message": f"Decision {decision_id} not found",
-                    "severity": "warning",
-                }
-            },
-        )
+    if decision is None:
+        error = {**_DECISION_NOT_FOUND_ERROR, "message": f"Decision {decision_id} not found"}
+        raise HTTPException(status_code=404, detail={"error": error})
     return decision
 
 
+def _touch(decision: dict[str, Any], updated_at: str) -> None:
+    """Record a mutation: set updated_at and bump the revision the detail cache keys on."""
+    decision["updated_at"] = updated_at
+    decision["revision"] += 1
+
+
+def _render_detail(decision: dict[str, Any]) -> DecisionDetail:
+    """
+    Build the DecisionDetail for a decision, reusing the last one if unchanged.
+
+    Every mutation goes through _touch(), so an unchanged revision means the
+    cached detail is current and hot polls skip re-validating belief snapshots.
+    (updated_at alone can't key it: now_iso() is cached for a clock tick.)
+    """
+    decision_id = decision["decision_id"]
+    cached = _detail_cache.get(decision_id)
+    if cached and cached[0] == decision["revision"]:
+        return cached[1]
+
+    staged = decision["status"] == "staged"
+    detail = DecisionDetail(
+        decision_id=decision["decision_id"],
+        type=decision["type"],
+        decision_type=decision["decision_type"],
+        summary=decision["summary"],
+        description=decision.get("description"),
+        status=decision["status"],
+        confidence=decision["confidence"],
+        task_id=decision.get("task_id"),
+        belief_snapshots=[BeliefSnapshot(**b) for b in decision.get("belief_snapshots", [])],
+        reasoning=decision.get("reasoning"),
+        options=decision.get("options", ["approve", "reject"]),
+        executed_at=decision.get("executed_at"),
+        executed_by=decision.get("executed_by"),
+        result=decision.get("result"),
+        undo_available=staged,
+        undo_expires_at=decision["undo_expires_at"] if staged else None,
+        created_at=decision["created_at"],
+        updated_at=decision["updated_at"],
+    )
+    _detail_cache[decision_id] = (decision["revision"], detail)
+    return detail
+
+
 @router.get("/{decision_id}", response_model=DecisionDetail)
 async def get_decision(decision_id: str) -> DecisionDetail:
     """
@@ -79,44 +142,146 @@ async def get_decision(decision_id: str) -> DecisionDetail:
     Shows the beliefs AS THEY WERE when decision was created,
     per API_CONTRACT_V0.md section 4.3.
     """
-    async with _decisions_lock:
+    async with _decisions.lock_for(decision_id):
         decision = _get_decision_or_404(decision_id)
 
-        # Check if undo still available
-        undo_available = False
-        undo_expires_at = None
+        # Undo is available only while staged and inside the window
+        if decision["status"] == "staged" and time.time() >= decision["undo_expires_ts"]:
+            # Window expired, commit the decision
+            decision["status"] = "committed"
+            _touch(decision, now_iso())
+
+        return _render_detail(decision)
+
+
+def _replay_response(idempotency_key: Optional[str]) -> Optional[DecisionExecuteResponse]:
+    """Return the previous result if this idempotency key was already used."""
+    if not idempotency_key:
+        return None
+    existing_entry = _idempotency_keys.get(idempotency_key)
+    if not existing_entry:
+        return None
+    existing_decision_id, _ = existing_entry
+    existing = _decisions.get(existing_decision_id)
+    if not existing:
+        return None
+    return DecisionExecuteResponse.model_construct(
+        decision_id=existing_decision_id,
+        executed=True,
+        was_replay=True,
+        status=existing["status"],
+        undo_available=existing["status"] == "staged",
+        undo_expires_at=existing.get("undo_expires_at"),
+        result=existing.get("result"),
+        message="Duplicate request - returning previous result",
+    )
+
+
+def _already_decided_response(
+    decision_id: str, decision: dict[str, Any]
+) -> DecisionExecuteResponse:
+    """Someone else already decided: report their outcome as a replay."""
+    return DecisionExecuteResponse.model_construct(
+        decision_id=decision_id,
+        executed=True,
+        was_replay=True,
+        status=decision["status"],
+        result=decision.get("result"),
+        message=f"Already {decision['status']} by {decision.get('executed_by', 'unknown')}",
+    )
+
+
+def _validate_choice(decision: dict[str, Any], choice: str) -> None:
+    """Raise 400 if choice is not one of the decision's options."""
+    if choice not in decision.get("options", ["approve", "reject"]):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": {
+                    "code": "INVALID_CHOICE",
+                    "message": f"Invalid choice. Options: {decision['options']}",
+                    "severity": "warning",
+                }
+            },
+        )
+
 
-        if decision["status"] == "staged":
-            expires = datetime.fromisoformat(decision["undo_expires_at"])
-            if datetime.now() < expires:
-                undo_available = True
-                undo_expires_at = decision["undo_expires_at"]
-            else:
-                # Window expired, commit the decision
-                decision["status"] = "committed"
-                decision["updated_at"] = datetime.now().isoformat()
-
-        return DecisionDetail(
-            decision_id=decision["decision_id"],
-            type=decision["type"],
-            decision_type=decision["decision_type"],
-            summary=decision["summary"],
-            description=decision.get("description"),
-            status=decision["status"],
-            confidence=decision["confidence"],
-            task_id=decision.get("task_id"),
-            belief_snapshots=[BeliefSnapshot(**b) for b in decision.get("belief_snapshots", [])],
-            reasoning=decision.get("reasoning"),
-            options=decision.get("options", ["approve", "reject"]),
-            executed_at=decision.get("executed_at"),
-            executed_by=decision.get("executed_by"),
-            result=decision.get("result"),
-            undo_available=undo_available,
-            undo_expires_at=undo_expires_at,
-            created_at=decision["created_at"],
-            updated_at=decision["updated_at"],
+def _mark_executed(decision: dict[str, Any], status: str, now_iso: str) -> None:
+    """Record who executed the decision and when."""
+    decision["status"] = status
+    decision["executed_at"] = now_iso
+    decision["executed_by"] = "user"  # TODO: Get from auth
+    _touch(decision, now_iso)
+
+
+def _stage_decision(
+    decision_id: str, decision: dict[str, Any], choice: str, now: datetime
+) -> DecisionExecuteResponse:
+    """Soft decision: stage with undo window and schedule auto-commit."""
+    _mark_executed(decision, "staged", now.isoformat())
+    decision["undo_expires_at"] = (now + timedelta(seconds=UNDO_WINDOW_SECONDS)).isoformat()
+    # Epoch copy of the expiry so window checks skip ISO parsing
+    decision["undo_expires_ts"] = now.timestamp() + UNDO_WINDOW_SECONDS
+
+    # TODO: Stage the actual change (don't commit to ERPNext yet)
+    decision["result"] = {"staged": True, "action": choice}
+
+    logger.info("Decision staged: %s (undo window: %ss)", decision_id, UNDO_WINDOW_SECONDS)
+
+    # Schedule auto-commit after window
+    auto_commit_reaper.schedule(decision["undo_expires_ts"], decision_id)
+
+    return DecisionExecuteResponse.model_construct(
+        decision_id=decision_id,
+        executed=True,
+        was_replay=False,
+        status="staged",
+        undo_available=True,
+        undo_expires_at=decision["undo_expires_at"],
+        result=decision["result"],
+        message=f"Approved. You can undo within {UNDO_WINDOW_SECONDS} seconds.",
+    )
+
+
+def _apply_choice(
+    decision_id: str, decision: dict[str, Any], choice: str
+) -> DecisionExecuteResponse:
+    """Reject, stage (soft) or commit (hard) a pending decision."""
+    now = datetime.now()
+    now_iso = now.isoformat()
+
+    if choice == "reject":
+        _mark_executed(decision, "rejected", now_iso)
+        logger.info("Decision rejected: %s", decision_id)
+        return DecisionExecuteResponse.model_construct(
+            decision_id=decision_id,
+            executed=True,
+            was_replay=False,
+            status="rejected",
+            message="Decision rejected",
         )
 
+    if decision["decision_type"] == "soft":
+        return _stage_decision(decision_id, decision, choice, now)
+
+    # Hard decision: commit immediately
+    _mark_executed(decision, "committed", now_iso)
+
+    # TODO: Execute the actual change in ERPNext
+    decision["result"] = {"committed": True, "action": choice}
+
+    logger.info("Decision committed: %s", decision_id)
+
+    return DecisionExecuteResponse.model_construct(
+        decision_id=decision_id,
+        executed=True,
+        was_replay=False,
+        status="committed",
+        undo_available=False,
+        result=decision["result"],
+        message="Approved and executed.",
+    )
+
 
 @router.post("/{decision_id}/execute", response_model=DecisionExecuteResponse)
 async def execute_decision(
@@ -136,154 +301,59 @@ async def execute_decision(
     - 30-second undo window
     - Commits automatically after window
 
-    NOTE: Uses _decisions_lock for critical sections to prevent race conditions.
+    NOTE: Holds the decision's shard lock for the read-modify-write. The
+    critical section never awaits, so _idempotency_keys updates are atomic too.
     """
     # Acquire lock to prevent race conditions during read-modify-write
-    async with _decisions_lock:
+    async with _decisions.lock_for(decision_id):
         decision = _get_decision_or_404(decision_id)
 
-        # Cleanup expired keys on each request
-        _cleanup_expired_idempotency_keys()
+        # Cleanup expired keys, amortized to once per interval
+        _maybe_cleanup_idempotency_keys()
 
-        # Check idempotency
-        if request.idempotency_key:
-            existing_entry = _idempotency_keys.get(request.idempotency_key)
-            if existing_entry:
-                existing_decision_id, _ = existing_entry
-                existing = _decisions.get(existing_decision_id)
-                if existing:
-                    return DecisionExecuteResponse(
-                        decision_id=existing_decision_id,
-                        executed=True,
-                        was_replay=True,
-                        status=existing["status"],
-                        undo_available=existing["status"] == "staged",
-                        undo_expires_at=existing.get("undo_expires_at"),
-                        result=existing.get("result"),
-                        message="Duplicate request - returning previous result",
-                    )
+        replay = _replay_response(request.idempotency_key)
+        if replay:
+            return replay
 
         # Check if already decided
         if decision["status"] not in ("pending",):
-            # Someone else already decided
-            return DecisionExecuteResponse(
-                decision_id=decision_id,
-                executed=True,
-                was_replay=True,
-                status=decision["status"],
-                result=decision.get("result"),
-                message=f"Already {decision['status']} by {decision.get('executed_by', 'unknown')}",
-            )
-
-        # Validate choice
-        if request.choice not in decision.get("options", ["approve", "reject"]):
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": {
-                        "code": "INVALID_CHOICE",
-                        "message": f"Invalid choice. Options: {decision['options']}",
-                        "severity": "warning",
-                    }
-                },
-            )
+            return _already_decided_response(decision_id, decision)
 
-        now = datetime.now()
+        _validate_choice(decision, request.choice)
 
         # Track idempotency with timestamp for TTL
         if request.idempotency_key:
-            _idempotency_keys[request.idempotency_key] = (decision_id, datetime.now())
+            _idempotency_keys[request.idempotency_key] = (decision_id, time.monotonic())
+            # A re-used key must move behind the others to keep time order
+            _idempotency_keys.move_to_end(request.idempotency_key)
 
-        # Handle rejection
-        if request.choice == "reject":
-            decision["status"] = "rejected"
-            decision["executed_at"] = now.isoformat()
-            decision["executed_by"] = "user"  # TODO: Get from auth
-            decision["updated_at"] = now.isoformat()
-
-            logger.info(f"Decision rejected: {decision_id}")
-
-            return DecisionExecuteResponse(
-                decision_id=decision_id,
-                executed=True,
-                was_replay=False,
-                status="rejected",
-                message="Decision rejected",
-            )
+        # Parsed from JSON, so not the interned "reject"/"approve" literals; intern it
+        # so the stored result["action"] shares them and comparisons hit identity first
+        return _apply_choice(decision_id, decision, sys.intern(request.choice))
 
-        # Handle approval
-        if decision["decision_type"] == "soft":
-            # Soft decision: stage with undo window
-            decision["status"] = "staged"
-            decision["executed_at"] = now.isoformat()
-            decision["executed_by"] = "user"
-            decision["undo_expires_at"] = (now + timedelta(seconds=UNDO_WINDOW_SECONDS)).isoformat()
-            decision["updated_at"] = now.isoformat()
 
-            # TODO: Stage the actual change (don't commit to ERPNext yet)
-            decision["result"] = {"staged": True, "action": request.choice}
-
-            logger.info(f"Decision staged: {decision_id} (undo window: {UNDO_WINDOW_SECONDS}s)")
-
-            # Schedule auto-commit after window
-            asyncio.create_task(_auto_commit_decision(decision_id, UNDO_WINDOW_SECONDS))
-
-            return DecisionExecuteResponse(
-                decision_id=decision_id,
-                executed=True,
-                was_replay=False,
-                status="staged",
-                undo_available=True,
-                undo_expires_at=decision["undo_expires_at"],
-                result=decision["result"],
-                message=f"Approved. You can undo within {UNDO_WINDOW_SECONDS} seconds.",
-            )
+async def _commit_staged_decision(decision_id: str) -> None:
+    """Auto-commit a staged decision after undo window expires."""
+    async with _decisions.lock_for(decision_id):
+        decision = _decisions.get(decision_id)
+        if not decision:
+            return
 
-        else:
-            # Hard decision: commit immediately
+        # Only commit if still staged
+        if decision["status"] == "staged":
             decision["status"] = "committed"
-            decision["executed_at"] = now.isoformat()
-            decision["executed_by"] = "user"
-            decision["updated_at"] = now.isoformat()
-
-            # TODO: Execute the actual change in ERPNext
-            decision["result"] = {"committed": True, "action": request.choice}
+            _touch(decision, now_iso())
 
-            logger.info(f"Decision committed: {decision_id}")
+            # TODO: Actually commit to ERPNext
+            if decision.get("result") and isinstance(decision["result"], dict):
+                decision["result"]["committed"] = True
 
-            return DecisionExecuteResponse(
-                decision_id=decision_id,
-                executed=True,
-                was_replay=False,
-                status="committed",
-                undo_available=False,
-                result=decision["result"],
-                message="Approved and executed.",
-            )
-
-
-async def _auto_commit_decision(decision_id: str, delay_seconds: int) -> None:
-    """Auto-commit a staged decision after undo window expires."""
-    try:
-        await asyncio.sleep(delay_seconds)
-
-        async with _decisions_lock:
-            decision = _decisions.get(decision_id)
-            if not decision:
-                return
+            logger.info("Decision auto-committed: %s", decision_id)
 
-            # Only commit if still staged
-            if decision["status"] == "staged":
-                decision["status"] = "committed"
-                decision["updated_at"] = datetime.now().isoformat()
 
-                # TODO: Actually commit to ERPNext
-                if decision.get("result") and isinstance(decision["result"], dict):
-                    decision["result"]["committed"] = True
-
-                logger.info(f"Decision auto-committed: {decision_id}")
-    except Exception as e:
-        logger.error(f"Auto-commit failed for {decision_id}: {e}", exc_info=True)
+# Single background task committing staged decisions as their windows close.
+# Started and stopped by the app lifespan.
+auto_commit_reaper = ExpiryReaper(_commit_staged_decision)
 
 
 @router.post("/{decision_id}/undo", response_model=DecisionUndoResponse)
@@ -296,7 +366,7 @@ async def undo_decision(decision_id: str) -> DecisionUndoResponse:
     - Must be within undo window
     - Rollback leaves no trace in books
     """
-    async with _decisions_lock:
+    async with _decisions.lock_for(decision_id):
         decision = _get_decision_or_404(decision_id)
 
         # Check if undoable
@@ -309,11 +379,11 @@ async def undo_decision(decision_id: str) -> DecisionUndoResponse:
             )
 
         # Check window
-        expires = datetime.fromisoformat(decision["undo_expires_at"])
-        if datetime.now() >= expires:
+        now = datetime.now()
+        if now.timestamp() >= decision["undo_expires_ts"]:
             # Window expired, auto-commit happened
             decision["status"] = "committed"
-            decision["updated_at"] = datetime.now().isoformat()
+            _touch(decision, now.isoformat())
 
             return DecisionUndoResponse(
                 decision_id=decision_id,
@@ -324,11 +394,11 @@ async def undo_decision(decision_id: str) -> DecisionUndoResponse:
 
         # Undo the decision
         decision["status"] = "undone"
-        decision["updated_at"] = datetime.now().isoformat()
+        _touch(decision, now.isoformat())
 
         # TODO: Rollback any staged changes
 
-        logger.info(f"Decision undone: {decision_id}")
+        logger.info("Decision undone: %s", decision_id)
 
         return DecisionUndoResponse(
             decision_id=decision_id,
@@ -353,12 +423,11 @@ def create_decision(
 
     Called from action_proposal node when supervision_mode == "action_proposal".
 
-    Note: This is synchronous. Dict key assignment is atomic in Python (GIL protected),
-    so this is safe to call from async contexts. The decision is created with a new UUID,
-    so no read-modify-write race conditions are possible.
+    Note: This is synchronous. The shard insert is a single dict assignment and
+    the decision_id is freshly generated, so no read-modify-write race is possible.
     """
-    decision_id = f"decision_{uuid.uuid4().hex[:12]}"
-    now = datetime.now().isoformat()
+    decision_id = f"decision_{secrets.token_hex(6)}"
+    now = now_iso()
 
     decision = {
         "decision_id": decision_id,
@@ -373,10 +442,11 @@ def create_decision(
         "options": options or ["approve", "reject"],
         "created_at": now,
         "updated_at": now,
+        "revision": 0,
     }
 
-    _decisions[decision_id] = decision
+    _decisions.put(decision_id, decision)
 
-    logger.info(f"Decision created: {decision_id} ({decision_type})")
+    logger.info("Decision created: %s (%s)", decision_id, decision_type)
 
     return decision_id
@@ -7,15 +7,16 @@ Per API_CONTRACT_V0.md section 6
 """
 
 import asyncio
-import json
-from datetime import datetime
 from typing import Any, AsyncIterator, Optional
 
+import orjson
 from fastapi import APIRouter, Query, Request
 from sse_starlette.sse import EventSourceResponse
 
 from ...observability import get_logger
-from ..services.event_bus import get_event_bus
+from ...utils.clock import now_iso
+from ..services.event_batcher import EventBatcher
+from ..services.event_bus import EventRecord, get_event_bus
 
 logger = get_logger("baby_mars.api.events")
 
@@ -23,6 +24,45 @@ router = APIRouter()
 
 # Use the shared event bus from services
 _event_bus = get_event_bus()
+# Batches events from high-rate producers such as webhooks
+event_batcher = EventBatcher(_event_bus)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an SSE data payload with orjson (sse-starlette expects str)."""
+    return orjson.dumps(obj).decode()
+
+
+def _event_frame(event: EventRecord) -> dict[str, str]:
+    """SSE frame for a bus event (synthetic events carry no id)."""
+    frame = {"event": event.type, "data": event.data_json}
+    if event.event_id:
+        frame["id"] = event.event_id
+    return frame
+
+
+def _connected_frame(org_id: str) -> dict[str, str]:
+    """Initial SSE frame confirming the subscription."""
+    return {
+        "event": "connected",
+        "data": _dumps({"org_id": org_id, "timestamp": now_iso()}),
+    }
+
+
+def _keepalive_frame() -> dict[str, str]:
+    """SSE keepalive frame sent when no events arrive in time."""
+    return {
+        "event": "keepalive",
+        "data": _dumps({"timestamp": now_iso()}),
+    }
+
+
+def _parse_types(types: Optional[str]) -> Optional[frozenset[str]]:
+    """Parse the comma-separated types filter (None means all types)."""
+    if not types:
+        return None
+    parsed = frozenset(t.strip() for t in types.split(",") if t.strip())
+    return parsed or None
 
 
 @router.get("")
@@ -30,6 +70,7 @@ async def event_stream(
     request: Request,
     org_id: str = Query(..., description="Organization ID"),
     last_event_id: Optional[str] = Query(None, description="Resume from event ID"),
+    types: Optional[str] = Query(None, description="Comma-separated event types to receive"),
 ) -> EventSourceResponse:
     """
     Real-time event stream via SSE.
@@ -44,46 +85,34 @@ async def event_stream(
     - aleq:message - Aleq proactively communicating
 
     Supports Last-Event-ID header for resume after disconnect.
+    Pass types (e.g. task:updated,decision:made) to receive only those events.
     """
-    queue = _event_bus.subscribe(org_id)
+    subscription = await _event_bus.subscribe(org_id, _parse_types(types))
+    resume_from = last_event_id or request.headers.get("last-event-id")
+    if resume_from and not await _event_bus.resume(subscription, resume_from):
+        logger.debug("Cannot resume org %s from %s; streaming new events", org_id, resume_from)
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         try:
             # Send initial connection event
-            yield {
-                "event": "connected",
-                "data": json.dumps(
-                    {
-                        "org_id": org_id,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                ),
-            }
-
-            # TODO: If last_event_id provided, replay missed events
+            yield _connected_frame(org_id)
 
             while True:
-                try:
-                    # Wait for events with timeout for keepalive
-                    event = await asyncio.wait_for(queue.get(), timeout=30)
+                # Wait for events with timeout for keepalive
+                events = await _event_bus.wait_for_events(subscription, timeout=30)
 
-                    yield {
-                        "event": event["type"],
-                        "id": event["event_id"],
-                        "data": json.dumps(event["data"]),
-                    }
-
-                except asyncio.TimeoutError:
+                if not events:
                     # Send keepalive
-                    yield {
-                        "event": "keepalive",
-                        "data": json.dumps({"timestamp": datetime.now().isoformat()}),
-                    }
+                    yield _keepalive_frame()
+                    continue
+
+                for event in events:
+                    yield _event_frame(event)
 
         except asyncio.CancelledError:
-            logger.debug(f"SSE connection cancelled for org {org_id}")
+            logger.debug("SSE connection cancelled for org %s", org_id)
         finally:
-            _event_bus.unsubscribe(org_id, queue)
+            _event_bus.unsubscribe(subscription)
 
     return EventSourceResponse(event_generator())
 
@@ -104,11 +133,30 @@ async def publish_task_created(org_id: str, task_id: str, task_type: str, summar
     )
 
 
+def can_queue_events(org_id: str, count: int = 1) -> bool:
+    """Whether org_id can queue count more events without exceeding its limit."""
+    return event_batcher.has_capacity(org_id, count)
+
+
+def queue_task_created(org_id: str, task_id: str, task_type: str, summary: str) -> None:
+    """Queue a task:created event for the next batch (for high-rate producers)."""
+    event_batcher.submit(
+        org_id,
+        "task:created",
+        {
+            "task_id": task_id,
+            "type": task_type,
+            "summary": summary,
+        },
+    )
+
+
 async def publish_task_updated(org_id: str, task_id: str, status: str, summary: str) -> None:
-    """Publish task:updated event."""
-    await _event_bus.publish(
+    """Publish task:updated event (rapid updates per task are coalesced)."""
+    _event_bus.publish_coalesced(
         org_id,
         "task:updated",
+        task_id,
         {
             "task_id": task_id,
             "status": status,
@@ -208,6 +256,6 @@ async def publish_aleq_message(
             "message_type": message_type,
             "source": source,
             "metadata": metadata or {},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         },
     )
@@ -5,19 +5,34 @@ Health Routes
 Health check and system info endpoints.
 """
 
-from datetime import datetime, timezone
-from typing import Literal
+import asyncio
+import time
+from collections.abc import Coroutine
+from typing import Any, Literal, Optional
 
 from fastapi import APIRouter
 
 from ...observability import get_logger
 from ...persistence.database import get_pool
+from ...utils.clock import utc_now_iso
 from ..schemas.common import HealthResponse
 
 logger = get_logger("baby_mars.api.health")
 
 router = APIRouter()
 
+# Service checks are reused for this long so frequent probes don't hit the DB
+HEALTH_CACHE_TTL_SECONDS = 2.0
+# A check that hasn't answered by then counts as unavailable
+HEALTH_CHECK_TIMEOUT_SECONDS = 1.0
+# Expired results are served while refreshing, but never once older than this
+HEALTH_MAX_STALE_SECONDS = 5 * HEALTH_CACHE_TTL_SECONDS
+
+# (expires_at_monotonic, services) from the last check
+_services_cache: Optional[tuple[float, dict[str, str]]] = None
+# In-flight refresh shared by every probe, so a burst runs the checks once
+_refresh_task: Optional["asyncio.Task[dict[str, str]]"] = None
+
 
 async def _check_database() -> str:
     """Check database connectivity."""
@@ -27,7 +42,7 @@ async def _check_database() -> str:
             await conn.fetchval("SELECT 1")
         return "healthy"
     except Exception as e:
-        logger.warning(f"Database health check failed: {e}")
+        logger.warning("Database health check failed: %s", e)
         return "unavailable"
 
 
@@ -42,32 +57,99 @@ def _check_claude() -> str:
         return "unavailable"
 
 
-def _determine_capabilities(services: dict[str, str]) -> dict[str, str]:
-    """Determine capabilities based on service status."""
-    capabilities: dict[str, str] = {}
+async def _check_claude_async() -> str:
+    """Run the Claude check off the event loop (first call builds the client)."""
+    return await asyncio.to_thread(_check_claude)
 
-    if services["database"] == "healthy":
-        capabilities["view_tasks"] = "full"
-        capabilities["view_beliefs"] = "full"
-    else:
-        capabilities["view_tasks"] = "cached"
-        capabilities["view_beliefs"] = "cached"
 
-    if services["claude"] == "healthy":
-        capabilities["chat"] = "full"
-    else:
-        capabilities["chat"] = "unavailable"
+async def _timed_check(check: Coroutine[Any, Any, str]) -> str:
+    """Run a check, reporting "unavailable" if it hangs (e.g. pool.acquire())."""
+    try:
+        async with asyncio.timeout(HEALTH_CHECK_TIMEOUT_SECONDS):
+            return await check
+    except TimeoutError:
+        logger.warning("Health check timed out after %ss", HEALTH_CHECK_TIMEOUT_SECONDS)
+        return "unavailable"
 
-    if services["erpnext"] == "healthy":
-        capabilities["execute_decisions"] = "full"
-        capabilities["view_widgets"] = "full"
-        capabilities["drill_down"] = "full"
-    else:
-        capabilities["execute_decisions"] = "queued"
-        capabilities["view_widgets"] = "cached"
-        capabilities["drill_down"] = "unavailable"
 
-    return capabilities
+async def _refresh_services() -> dict[str, str]:
+    """Run the service checks and cache the result."""
+    global _services_cache
+    # Run both checks concurrently: latency is max(db, claude), not the sum,
+    # and bounded by HEALTH_CHECK_TIMEOUT_SECONDS
+    database, claude = await asyncio.gather(
+        _timed_check(_check_database()), _timed_check(_check_claude_async())
+    )
+    services = {
+        "database": database,
+        "baby_mars": "healthy",  # Always healthy if we're responding
+        "claude": claude,
+        "erpnext": "unavailable",  # Stubbed for now
+    }
+    _services_cache = (time.monotonic() + HEALTH_CACHE_TTL_SECONDS, services)
+    return services
+
+
+async def _get_services() -> dict[str, str]:
+    """
+    Service statuses, refreshed at most once per HEALTH_CACHE_TTL_SECONDS.
+
+    An expired result is served while a background refresh replaces it, so
+    probes normally don't wait on the checks. The first probe, and any probe
+    finding a result older than HEALTH_MAX_STALE_SECONDS, waits for the
+    refresh instead (bounded by HEALTH_CHECK_TIMEOUT_SECONDS), so an outage
+    can't hide behind an old "healthy".
+    """
+    global _refresh_task
+    cached = _services_cache
+    now = time.monotonic()
+    if cached and now < cached[0]:
+        return cached[1]
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_refresh_services())
+    stale_for = now - cached[0] + HEALTH_CACHE_TTL_SECONDS if cached else 0.0
+    if cached and stale_for < HEALTH_MAX_STALE_SECONDS:
+        return cached[1]
+    # Shielded so a disconnecting probe doesn't cancel the shared refresh
+    return await asyncio.shield(_refresh_task)
+
+
+# Capabilities each service grants, keyed by whether it is healthy
+_DATABASE_CAPABILITIES = {
+    True: {"view_tasks": "full", "view_beliefs": "full"},
+    False: {"view_tasks": "cached", "view_beliefs": "cached"},
+}
+_CLAUDE_CAPABILITIES = {
+    True: {"chat": "full"},
+    False: {"chat": "unavailable"},
+}
+_ERPNEXT_CAPABILITIES = {
+    True: {"execute_decisions": "full", "view_widgets": "full", "drill_down": "full"},
+    False: {"execute_decisions": "queued", "view_widgets": "cached", "drill_down": "unavailable"},
+}
+
+# Every (database, claude, erpnext) health combination, merged once at import
+_CAPABILITIES: dict[tuple[bool, bool, bool], dict[str, str]] = {
+    (db, claude, erp): {
+        **_DATABASE_CAPABILITIES[db],
+        **_CLAUDE_CAPABILITIES[claude],
+        **_ERPNEXT_CAPABILITIES[erp],
+    }
+    for db in (True, False)
+    for claude in (True, False)
+    for erp in (True, False)
+}
+
+
+def _determine_capabilities(services: dict[str, str]) -> dict[str, str]:
+    """Determine capabilities based on service status (shared; do not mutate)."""
+    return _CAPABILITIES[
+        (
+            services["database"] == "healthy",
+            services["claude"] == "healthy",
+            services["erpnext"] == "healthy",
+        )
+    ]
 
 
 def _determine_status(services: dict[str, str]) -> Literal["healthy", "degraded", "unavailable"]:
@@ -94,17 +176,13 @@ async def root() -> dict[str, str]:
 @router.get("/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
     """Health check with capability matrix. Per API_CONTRACT_V0.md section 8.3"""
-    services = {
-        "database": await _check_database(),
-        "baby_mars": "healthy",  # Always healthy if we're responding
-        "claude": _check_claude(),
-        "erpnext": "unavailable",  # Stubbed for now
-    }
+    services = await _get_services()
 
-    return HealthResponse(
+    # Probed constantly; every field is built here, so skip re-validation
+    return HealthResponse.model_construct(
         status=_determine_status(services),
         version="0.1.0",
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=utc_now_iso(),
         services=services,
         capabilities=_determine_capabilities(services),
     )
@@ -15,26 +15,31 @@ logger = get_logger("baby_mars.api.sessions")
 
 router = APIRouter()
 
+_SESSION_NOT_FOUND_DETAIL: dict[str, Any] = {
+    "error": {
+        "code": "SESSION_NOT_FOUND",
+        "message": "Session not found or expired",
+        "severity": "warning",
+        "recoverable": True,
+        "actions": [
+            {"label": "Start new session", "action": "new_session"},
+        ],
+    }
+}
+
+
+def _get_session_or_404(request: Request, session_id: str) -> dict[str, Any]:
+    """Get session (refreshing its TTL) or raise 404"""
+    session: dict[str, Any] | None = request.app.state.sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=_SESSION_NOT_FOUND_DETAIL)
+    return session
+
 
 @router.get("/{session_id}")
 async def get_session(session_id: str, request: Request) -> dict[str, Any]:
     """Get session information"""
-    session = request.app.state.sessions.get(session_id)
-    if not session:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": "Session not found or expired",
-                    "severity": "warning",
-                    "recoverable": True,
-                    "actions": [
-                        {"label": "Start new session", "action": "new_session"},
-                    ],
-                }
-            },
-        )
+    session = _get_session_or_404(request, session_id)
 
     state = session.get("state")
     birth = session.get("birth_result", {})
@@ -61,18 +66,9 @@ async def delete_session(session_id: str, request: Request) -> dict[str, str]:
     # Use atomic pop to avoid race condition between check and delete
     session = request.app.state.sessions.pop(session_id, None)
     if session is None:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": "Session not found",
-                    "severity": "info",
-                }
-            },
-        )
-
-    logger.info(f"Session deleted: {session_id}")
+        raise HTTPException(status_code=404, detail=_SESSION_NOT_FOUND_DETAIL)
+
+    logger.info("Session deleted: %s", session_id)
 
     return {"status": "deleted", "session_id": session_id}
 
@@ -84,18 +80,7 @@ async def get_session_context(session_id: str, request: Request) -> dict[str, An
 
     Shows what's currently in Aleq's working memory.
     """
-    session = request.app.state.sessions.get(session_id)
-    if not session:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": "Session not found",
-                    "severity": "warning",
-                }
-            },
-        )
+    session = _get_session_or_404(request, session_id)
 
     pills = session.get("context_pills", [])
 
@@ -124,18 +109,7 @@ async def get_session_history(session_id: str, request: Request, limit: int = 20
     - Last 7d: Summarized
     - Last 30d: Key decisions only
     """
-    session = request.app.state.sessions.get(session_id)
-    if not session:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "SESSION_NOT_FOUND",
-                    "message": "Session not found",
-                    "severity": "warning",
-                }
-            },
-        )
+    session = _get_session_or_404(request, session_id)
 
     state = session.get("state")
     if not state:
@@ -6,48 +6,134 @@ Task management endpoints.
 Per API_CONTRACT_V0.md section 2
 """
 
-from datetime import datetime
-from typing import Any, Optional
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Optional, cast
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from ...observability import get_logger
+from ...utils.clock import now_iso
 from ..schemas.tasks import (
     TaskDecision,
     TaskDetail,
     TaskListResponse,
+    TaskSource,
     TaskStatus,
     TaskSummary,
     TaskTimeline,
     TaskTimelineEntry,
 )
+from ..services.task_index import TaskIndex
 
 logger = get_logger("baby_mars.api.tasks")
 
-router = APIRouter()
+# List polls dominate; render the dumped response_model with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    """In-memory task (slotted: thousands of these stay small and fast to read)."""
+
+    task_id: str
+    type: str
+    summary: str
+    status: TaskStatus
+    source: str
+    priority: float
+    difficulty: int
+    created_at: str
+    updated_at: str
+    description: Optional[str] = None
+    parent_id: Optional[str] = None
+    subtasks: list[dict[str, Any]] = field(default_factory=list)
+    decisions: list[dict[str, Any]] = field(default_factory=list)
+    timeline: list[dict[str, Any]] = field(default_factory=list)
+    progress: Optional[float] = None
+    current_step: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    error: Optional[dict[str, Any]] = None
+    recovery_actions: list[dict[str, Any]] = field(default_factory=list)
+    previous_status: Optional[TaskStatus] = None
+    # (cache_key, summary) from the last list_tasks render
+    summary_cache: Optional[tuple[tuple[Any, ...], TaskSummary]] = None
+
 
 # In-memory task store (will be moved to persistence layer)
-# Structure: {task_id: TaskDetail}
-_tasks: dict[str, dict[str, Any]] = {}
+_tasks: dict[str, TaskRecord] = {}
+
+# Listing order and status/source filters over _tasks.
+# Every status change must go through _set_status to keep it in sync.
+_task_index = TaskIndex()
+
+
+def _set_status(task: TaskRecord, status: TaskStatus) -> None:
+    """Change a task's status and update the status index."""
+    _task_index.move_status(task.task_id, task.status, status)
+    task.status = status
+
+
+def _add_timeline(task: TaskRecord, timestamp: str, event: str, actor: str) -> None:
+    """Append a timeline entry and bump updated_at."""
+    task.updated_at = timestamp
+    task.timeline.append({"timestamp": timestamp, "event": event, "actor": actor})
+
+
+def _timeline_entries(task: TaskRecord) -> list[TaskTimelineEntry]:
+    """Timeline entries for responses (built internally, so not re-validated)."""
+    return [TaskTimelineEntry.model_construct(**e) for e in task.timeline]
+
 
+# Static part of the 404 body; only the message varies per ID
+_TASK_NOT_FOUND_ERROR: dict[str, Any] = {"code": "TASK_NOT_FOUND", "severity": "warning"}
 
-def _get_task_or_404(task_id: str) -> dict[str, Any]:
+
+def _get_task_or_404(task_id: str) -> TaskRecord:
     """Get task or raise 404"""
     task = _tasks.get(task_id)
-    if not task:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "TASK_NOT_FOUND",
-                    "message": f"Task {task_id} not found",
-                    "severity": "warning",
-                }
-            },
-        )
+    if task is None:
+        error = {**_TASK_NOT_FOUND_ERROR, "message": f"Task {task_id} not found"}
+        raise HTTPException(status_code=404, detail={"error": error})
     return task
 
 
+def _task_summary(t: TaskRecord) -> TaskSummary:
+    """
+    Build the list-view summary for a task, reusing the last one if unchanged.
+
+    The cache key covers every mutable field the summary reads, so hot list
+    polls skip rebuilding unchanged tasks. TaskRecord fields were validated
+    when the task was created or updated, so the summary is constructed
+    without re-validation.
+    """
+    decision_count = len(t.decisions)
+    subtask_count = len(t.subtasks)
+    cache_key = (t.status, t.updated_at, t.progress, decision_count, subtask_count)
+    cached = t.summary_cache
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
+    summary = TaskSummary.model_construct(
+        task_id=t.task_id,
+        type=t.type,
+        summary=t.summary,
+        status=t.status,
+        source=cast(TaskSource, t.source),
+        priority=t.priority,
+        created_at=t.created_at,
+        updated_at=t.updated_at,
+        has_decisions=decision_count > 0,
+        decision_count=decision_count,
+        subtask_count=subtask_count,
+        progress=t.progress,
+    )
+    t.summary_cache = (cache_key, summary)
+    return summary
+
+
 @router.get("", response_model=TaskListResponse)
 async def list_tasks(
     status: Optional[str] = Query(None, description="Comma-separated statuses"),
@@ -67,41 +153,13 @@ async def list_tasks(
     - failed: Unrecoverable error
     - superseded: Replaced
     """
-    tasks = list(_tasks.values())
-
-    # Filter by status
-    if status:
-        statuses = status.split(",")
-        tasks = [t for t in tasks if t.get("status") in statuses]
-
-    # Filter by source
-    if source:
-        tasks = [t for t in tasks if t.get("source") == source]
-
-    # Sort by priority desc, then created_at desc (newer first within same priority)
-    tasks.sort(key=lambda t: (t.get("priority", 0), t.get("created_at", "")), reverse=True)
-
-    total = len(tasks)
-    tasks = tasks[offset : offset + limit]
+    # Priority desc, then created_at desc (newer first within same priority),
+    # read from the index so only the requested page is visited
+    statuses = status.split(",") if status else []
+    task_ids, total = _task_index.page(statuses, source or None, offset, limit)
 
     return TaskListResponse(
-        tasks=[
-            TaskSummary(
-                task_id=t["task_id"],
-                type=t["type"],
-                summary=t["summary"],
-                status=t["status"],
-                source=t["source"],
-                priority=t["priority"],
-                created_at=t["created_at"],
-                updated_at=t["updated_at"],
-                has_decisions=bool(t.get("decisions")),
-                decision_count=len(t.get("decisions", [])),
-                subtask_count=len(t.get("subtasks", [])),
-                progress=t.get("progress"),
-            )
-            for t in tasks
-        ],
+        tasks=[_task_summary(_tasks[task_id]) for task_id in task_ids],
         total=total,
         limit=limit,
         offset=offset,
@@ -117,26 +175,26 @@ async def get_task(task_id: str) -> TaskDetail:
     task = _get_task_or_404(task_id)
 
     return TaskDetail(
-        task_id=task["task_id"],
-        type=task["type"],
-        summary=task["summary"],
-        description=task.get("description"),
-        status=task["status"],
-        source=task["source"],
-        priority=task["priority"],
-        difficulty=task.get("difficulty", 2),
-        parent_id=task.get("parent_id"),
-        subtasks=[TaskSummary(**st) for st in task.get("subtasks", [])],
-        progress=task.get("progress"),
-        current_step=task.get("current_step"),
-        decisions=[TaskDecision(**d) for d in task.get("decisions", [])],
-        timeline=[TaskTimelineEntry(**e) for e in task.get("timeline", [])],
-        created_at=task["created_at"],
-        updated_at=task["updated_at"],
-        started_at=task.get("started_at"),
-        completed_at=task.get("completed_at"),
-        error=task.get("error"),
-        recovery_actions=task.get("recovery_actions", []),
+        task_id=task.task_id,
+        type=task.type,
+        summary=task.summary,
+        description=task.description,
+        status=task.status,
+        source=cast(TaskSource, task.source),
+        priority=task.priority,
+        difficulty=task.difficulty,
+        parent_id=task.parent_id,
+        subtasks=[TaskSummary(**st) for st in task.subtasks],
+        progress=task.progress,
+        current_step=task.current_step,
+        decisions=[TaskDecision(**d) for d in task.decisions],
+        timeline=_timeline_entries(task),
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        started_at=task.started_at,
+        completed_at=task.completed_at,
+        error=task.error,
+        recovery_actions=task.recovery_actions,
     )
 
 
@@ -149,11 +207,12 @@ async def get_task_timeline(task_id: str) -> TaskTimeline:
     """
     task = _get_task_or_404(task_id)
 
-    return TaskTimeline(
-        task_id=task["task_id"],
-        timeline=[TaskTimelineEntry(**e) for e in task.get("timeline", [])],
-        status=task["status"],
-        progress=task.get("progress"),
+    # Polled often; every field comes from the in-memory task, so skip validation
+    return TaskTimeline.model_construct(
+        task_id=task.task_id,
+        timeline=_timeline_entries(task),
+        status=task.status,
+        progress=task.progress,
     )
 
 
@@ -166,30 +225,23 @@ async def pause_task(task_id: str) -> dict[str, str]:
     """
     task = _get_task_or_404(task_id)
 
-    if task["status"] not in ("pending", "running", "blocked"):
+    if task.status not in ("pending", "running", "blocked"):
         raise HTTPException(
             status_code=400,
             detail={
                 "error": {
                     "code": "CANNOT_PAUSE",
-                    "message": f"Cannot pause task in {task['status']} state",
+                    "message": f"Cannot pause task in {task.status} state",
                     "severity": "info",
                 }
             },
         )
 
-    task["previous_status"] = task["status"]
-    task["status"] = "paused"
-    task["updated_at"] = datetime.now().isoformat()
-    task["timeline"].append(
-        {
-            "timestamp": datetime.now().isoformat(),
-            "event": "Task paused",
-            "actor": "user",
-        }
-    )
+    task.previous_status = task.status
+    _set_status(task, "paused")
+    _add_timeline(task, now_iso(), "Task paused", "user")
 
-    logger.info(f"Task paused: {task_id}")
+    logger.info("Task paused: %s", task_id)
 
     return {"task_id": task_id, "status": "paused"}
 
@@ -201,7 +253,7 @@ async def resume_task(task_id: str) -> dict[str, str]:
     """
     task = _get_task_or_404(task_id)
 
-    if task["status"] != "paused":
+    if task.status != "paused":
         raise HTTPException(
             status_code=400,
             detail={
@@ -213,19 +265,12 @@ async def resume_task(task_id: str) -> dict[str, str]:
             },
         )
 
-    task["status"] = task.get("previous_status", "running")
-    task["updated_at"] = datetime.now().isoformat()
-    task["timeline"].append(
-        {
-            "timestamp": datetime.now().isoformat(),
-            "event": "Task resumed",
-            "actor": "user",
-        }
-    )
+    _set_status(task, task.previous_status or "running")
+    _add_timeline(task, now_iso(), "Task resumed", "user")
 
-    logger.info(f"Task resumed: {task_id}")
+    logger.info("Task resumed: %s", task_id)
 
-    return {"task_id": task_id, "status": task["status"]}
+    return {"task_id": task_id, "status": task.status}
 
 
 # Internal function for creating tasks (called from cognitive loop)
@@ -246,37 +291,28 @@ def create_task(
     - User requests task
     - Aleq proposes task
     """
-    import uuid
-
     task_id = f"task_{uuid.uuid4().hex[:12]}"
-    now = datetime.now().isoformat()
-
-    task = {
-        "task_id": task_id,
-        "type": task_type,
-        "summary": summary,
-        "description": description,
-        "status": "pending",
-        "source": source,
-        "priority": priority,
-        "difficulty": difficulty,
-        "parent_id": parent_id,
-        "subtasks": [],
-        "decisions": [],
-        "timeline": [
-            {
-                "timestamp": now,
-                "event": "Task created",
-                "actor": source,
-            }
-        ],
-        "created_at": now,
-        "updated_at": now,
-    }
+    now = now_iso()
+
+    task = TaskRecord(
+        task_id=task_id,
+        type=task_type,
+        summary=summary,
+        description=description,
+        status="pending",
+        source=source,
+        priority=priority,
+        difficulty=difficulty,
+        parent_id=parent_id,
+        timeline=[{"timestamp": now, "event": "Task created", "actor": source}],
+        created_at=now,
+        updated_at=now,
+    )
 
     _tasks[task_id] = task
+    _task_index.add(task_id, priority, now, "pending", source)
 
-    logger.info(f"Task created: {task_id} ({task_type})")
+    logger.info("Task created: %s (%s)", task_id, task_type)
 
     return task_id
 
@@ -294,26 +330,19 @@ def update_task_status(
     if not task:
         return
 
-    task["status"] = status
-    task["updated_at"] = datetime.now().isoformat()
+    now = now_iso()
+    _set_status(task, status)
 
     if progress is not None:
-        task["progress"] = progress
+        task.progress = progress
     if current_step:
-        task["current_step"] = current_step
-
-    event = message or f"Status changed to {status}"
-    task["timeline"].append(
-        {
-            "timestamp": datetime.now().isoformat(),
-            "event": event,
-            "actor": actor,
-        }
-    )
+        task.current_step = current_step
+
+    _add_timeline(task, now, message or f"Status changed to {status}", actor)
 
     if status == "completed":
-        task["completed_at"] = datetime.now().isoformat()
-    elif status == "running" and not task.get("started_at"):
-        task["started_at"] = datetime.now().isoformat()
+        task.completed_at = now
+    elif status == "running" and not task.started_at:
+        task.started_at = now
 
-    logger.info(f"Task updated: {task_id} -> {status}")
+    logger.info("Task updated: %s -> %s", task_id, status)
@@ -5,9 +5,10 @@ Triggers Routes
 API endpoints for managing proactive triggers.
 """
 
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import ORJSONResponse
 
 from ...observability import get_logger
 from ...scheduler import get_pulse_scheduler
@@ -15,12 +16,17 @@ from ...scheduler.defaults import seed_org_triggers
 from ...scheduler.executor import execute_trigger
 from ...scheduler.persistence import (
     create_trigger,
-    delete_trigger,
-    get_trigger,
-    load_org_triggers,
+    delete_trigger_scoped,
+    get_trigger_scoped,
     save_trigger,
+    update_trigger_scoped,
+)
+from ...scheduler.persistence_cache import (
+    cached_count_active_triggers,
+    cached_load_org_triggers,
 )
 from ..auth import get_current_org
+from ..json_body import json_body, json_body_openapi
 from ..schemas.triggers import (
     CreateTriggerRequest,
     FireTriggerRequest,
@@ -33,7 +39,11 @@ from ..schemas.triggers import (
 
 logger = get_logger("baby_mars.api.triggers")
 
-router = APIRouter()
+# Render the dumped response_model with orjson (list responses can be large)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Missing and other-org triggers get the same response, so IDs can't be probed
+_TRIGGER_NOT_FOUND = "Trigger not found"
 
 
 @router.get("", response_model=TriggerListResponse)
@@ -48,25 +58,25 @@ async def list_triggers(
 
     Optionally filter by user_id, trigger_type, or enabled status.
     """
-    triggers = await load_org_triggers(org_id)
-
-    # Apply filters
-    if user_id is not None:
-        triggers = [t for t in triggers if t.get("user_id") == user_id]
-    if trigger_type is not None:
-        triggers = [t for t in triggers if t["trigger_type"] == trigger_type]
-    if enabled is not None:
-        triggers = [t for t in triggers if t["enabled"] == enabled]
+    # Filters are applied in SQL
+    triggers = await cached_load_org_triggers(
+        org_id, user_id=user_id, trigger_type=trigger_type, enabled=enabled
+    )
 
-    return TriggerListResponse(
-        triggers=[TriggerResponse(**t) for t in triggers],
+    # Rows come from our own table via _row_to_trigger, so skip re-validation
+    return TriggerListResponse.model_construct(
+        triggers=[TriggerResponse.model_construct(**t) for t in triggers],
         total=len(triggers),
     )
 
 
-@router.post("", response_model=TriggerResponse)
+@router.post(
+    "",
+    response_model=TriggerResponse,
+    openapi_extra=json_body_openapi(CreateTriggerRequest),
+)
 async def create_new_trigger(
-    request: CreateTriggerRequest,
+    request: Annotated[CreateTriggerRequest, Depends(json_body(CreateTriggerRequest))],
     org_id: str = Depends(get_current_org),
 ) -> TriggerResponse:
     """
@@ -84,9 +94,9 @@ async def create_new_trigger(
     trigger["enabled"] = request.enabled
 
     await save_trigger(trigger)
-    logger.info(f"Created trigger {trigger['trigger_id']} for org {org_id}")
+    logger.info("Created trigger %s for org %s", trigger["trigger_id"], org_id)
 
-    return TriggerResponse(**trigger)
+    return TriggerResponse.model_construct(**trigger)
 
 
 @router.get("/status", response_model=SchedulerStatusResponse)
@@ -99,9 +109,8 @@ async def get_scheduler_status(
     scheduler = get_pulse_scheduler()
     status = scheduler.get_status()
 
-    # Count active triggers for this org
-    triggers = await load_org_triggers(org_id)
-    active_count = sum(1 for t in triggers if t["enabled"])
+    # Cached per org; trigger writes invalidate it
+    active_count = await cached_count_active_triggers(org_id)
 
     return SchedulerStatusResponse(
         running=status["running"],
@@ -133,14 +142,11 @@ async def get_trigger_by_id(
     """
     Get a specific trigger by ID.
     """
-    trigger = await get_trigger(trigger_id)
+    trigger = await get_trigger_scoped(trigger_id, org_id)
     if not trigger:
-        raise HTTPException(status_code=404, detail="Trigger not found")
-
-    if trigger["org_id"] != org_id:
-        raise HTTPException(status_code=403, detail="Trigger belongs to different org")
+        raise HTTPException(status_code=404, detail=_TRIGGER_NOT_FOUND)
 
-    return TriggerResponse(**trigger)
+    return TriggerResponse.model_construct(**trigger)
 
 
 @router.patch("/{trigger_id}", response_model=TriggerResponse)
@@ -154,25 +160,20 @@ async def update_trigger_by_id(
 
     Can update enabled status, config, or description.
     """
-    trigger = await get_trigger(trigger_id)
+    # Org check and update happen in one scoped UPDATE
+    trigger = await update_trigger_scoped(
+        trigger_id,
+        org_id,
+        enabled=request.enabled,
+        config=request.config,
+        description=request.description,
+    )
     if not trigger:
-        raise HTTPException(status_code=404, detail="Trigger not found")
-
-    if trigger["org_id"] != org_id:
-        raise HTTPException(status_code=403, detail="Trigger belongs to different org")
+        raise HTTPException(status_code=404, detail=_TRIGGER_NOT_FOUND)
 
-    # Apply updates
-    if request.enabled is not None:
-        trigger["enabled"] = request.enabled
-    if request.config is not None:
-        trigger["config"].update(request.config)
-    if request.description is not None:
-        trigger["description"] = request.description
-
-    await save_trigger(trigger)
-    logger.info(f"Updated trigger {trigger_id}")
+    logger.info("Updated trigger %s", trigger_id)
 
-    return TriggerResponse(**trigger)
+    return TriggerResponse.model_construct(**trigger)
 
 
 @router.delete("/{trigger_id}")
@@ -183,15 +184,10 @@ async def delete_trigger_by_id(
     """
     Delete a trigger.
     """
-    trigger = await get_trigger(trigger_id)
-    if not trigger:
-        raise HTTPException(status_code=404, detail="Trigger not found")
-
-    if trigger["org_id"] != org_id:
-        raise HTTPException(status_code=403, detail="Trigger belongs to different org")
+    if not await delete_trigger_scoped(trigger_id, org_id):
+        raise HTTPException(status_code=404, detail=_TRIGGER_NOT_FOUND)
 
-    await delete_trigger(trigger_id)
-    logger.info(f"Deleted trigger {trigger_id}")
+    logger.info("Deleted trigger %s", trigger_id)
 
     return {"deleted": trigger_id}
 
@@ -205,16 +201,14 @@ async def fire_trigger_now(
     """
     Manually fire a trigger (for testing/debugging).
     """
-    trigger = await get_trigger(trigger_id)
+    trigger = await get_trigger_scoped(trigger_id, org_id)
     if not trigger:
-        raise HTTPException(status_code=404, detail="Trigger not found")
-
-    if trigger["org_id"] != org_id:
-        raise HTTPException(status_code=403, detail="Trigger belongs to different org")
+        raise HTTPException(status_code=404, detail=_TRIGGER_NOT_FOUND)
 
     event_data = request.event_data if request else None
-    result = await execute_trigger(trigger_id, event_data)
+    # Hand over the loaded trigger so execution doesn't fetch it again
+    result = await execute_trigger(trigger_id, event_data, trigger=trigger)
 
-    logger.info(f"Manually fired trigger {trigger_id}: success={result['success']}")
+    logger.info("Manually fired trigger %s: success=%s", trigger_id, result["success"])
 
-    return TriggerFireResult(**result)
+    return TriggerFireResult.model_construct(**result)
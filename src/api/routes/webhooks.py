@@ -6,25 +6,127 @@ Email and Slack webhook endpoints for task creation.
 Per planning.md Baby Mars: Webhook Triggers (Email/event → Task creation)
 """
 
-from typing import Any
-
-from fastapi import APIRouter, Header, Request
+import hashlib
+import hmac
+import os
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter, ValidationError
 
 from ...observability import get_logger
+from ..json_body import json_body, json_body_openapi
+from ..orjson_route import ORJSONRoute
 from ..schemas.webhooks import (
     EmailWebhookPayload,
     EmailWebhookResponse,
     GenericWebhookPayload,
     GenericWebhookResponse,
+    SlackCommandPayload,
+    SlackSlashCommand,
+    SlackUrlVerification,
+    SlackWebhookBatch,
+    SlackWebhookBatchResponse,
     SlackWebhookPayload,
     SlackWebhookResponse,
 )
-from .events import publish_task_created
+from .events import can_queue_events, queue_task_created
 from .tasks import create_task
 
 logger = get_logger("baby_mars.api.webhooks")
 
-router = APIRouter()
+# Pure JSON in/out: parse and render with orjson
+router = APIRouter(route_class=ORJSONRoute, default_response_class=ORJSONResponse)
+
+_ORG_BUSY_ERROR: dict[str, Any] = {"code": "ORG_BUSY", "severity": "warning"}
+
+
+def _check_org_capacity(org_id: str, count: int = 1) -> None:
+    """Reject with 429 (before creating count tasks) while an org's burst drains."""
+    if not can_queue_events(org_id, count):
+        error = {**_ORG_BUSY_ERROR, "message": f"Too many pending webhooks for org {org_id}"}
+        raise HTTPException(status_code=429, detail={"error": error}, headers={"Retry-After": "1"})
+
+
+# ============================================================
+# SIGNATURE VERIFICATION
+# ============================================================
+
+# Slack rejects requests older than this to block replays; we do the same
+SLACK_MAX_SKEW_SECONDS = 300
+
+_INVALID_SIGNATURE_ERROR: dict[str, Any] = {
+    "code": "INVALID_SIGNATURE",
+    "message": "Webhook signature missing or invalid",
+    "severity": "error",
+}
+
+
+@lru_cache(maxsize=8)
+def _keyed_hmac(secret: str) -> hmac.HMAC:
+    """HMAC-SHA256 state with the key already absorbed (copy() per message)."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _sign(secret: str, message: bytes) -> str:
+    mac = _keyed_hmac(secret).copy()
+    mac.update(message)
+    return mac.hexdigest()
+
+
+def _reject_signature() -> HTTPException:
+    return HTTPException(status_code=401, detail={"error": _INVALID_SIGNATURE_ERROR})
+
+
+async def verify_email_signature(
+    request: Request,
+    x_webhook_signature: str | None = Header(None, alias="X-Webhook-Signature"),
+) -> None:
+    """
+    Check X-Webhook-Signature (hex HMAC-SHA256 of the raw body).
+
+    Runs as a route dependency, so bad requests are rejected before the
+    payload is validated. Skipped when WEBHOOK_SIGNING_SECRET is unset (dev mode).
+    """
+    secret = os.environ.get("WEBHOOK_SIGNING_SECRET")
+    if not secret:
+        return
+    if not x_webhook_signature:
+        raise _reject_signature()
+    expected = _sign(secret, await request.body())
+    if not hmac.compare_digest(expected, x_webhook_signature.removeprefix("sha256=")):
+        raise _reject_signature()
+
+
+async def verify_slack_signature(
+    request: Request,
+    x_slack_signature: str | None = Header(None, alias="X-Slack-Signature"),
+    x_slack_request_timestamp: str | None = Header(None, alias="X-Slack-Request-Timestamp"),
+) -> None:
+    """
+    Check Slack's v0 signature over "v0:{timestamp}:{body}".
+
+    Skipped when SLACK_SIGNING_SECRET is unset (dev mode).
+    """
+    secret = os.environ.get("SLACK_SIGNING_SECRET")
+    if not secret:
+        return
+    if not x_slack_signature or not x_slack_request_timestamp:
+        raise _reject_signature()
+    try:
+        skew = abs(time.time() - int(x_slack_request_timestamp))
+    except ValueError:
+        raise _reject_signature() from None
+    if skew > SLACK_MAX_SKEW_SECONDS:
+        raise _reject_signature()
+    base = b"v0:" + x_slack_request_timestamp.encode() + b":" + await request.body()
+    if not hmac.compare_digest("v0=" + _sign(secret, base), x_slack_signature):
+        raise _reject_signature()
 
 
 # ============================================================
@@ -34,15 +136,18 @@ router = APIRouter()
 
 def _count_pdf_attachments(payload: EmailWebhookPayload) -> int:
     """Count PDF attachments in email."""
+    # Content type first; the suffix check lowercases only the last 4 chars
     return sum(
         1
         for att in payload.attachments
-        if att.content_type == "application/pdf" or att.filename.lower().endswith(".pdf")
+        if att.content_type == "application/pdf" or att.filename[-4:].lower() == ".pdf"
     )
 
 
+@lru_cache(maxsize=4096)
 def _extract_org_id_from_email(to_address: str) -> str:
     """Extract org_id from email address (e.g., lockbox+org123@aleq.ai)."""
+    # Pure, and each tenant sends from a handful of addresses, so cache it
     local_part = to_address.split("@")[0]
     if "+" in local_part:
         return local_part.split("+")[1]
@@ -56,10 +161,14 @@ def _build_task_summary(payload: EmailWebhookPayload, pdf_count: int) -> str:
     return f"Review email from {payload.from_address}: {payload.subject[:50]}"
 
 
-@router.post("/email", response_model=EmailWebhookResponse)
+@router.post(
+    "/email",
+    response_model=EmailWebhookResponse,
+    dependencies=[Depends(verify_email_signature)],
+    openapi_extra=json_body_openapi(EmailWebhookPayload),
+)
 async def email_webhook(
-    payload: EmailWebhookPayload,
-    x_webhook_signature: str | None = Header(None, alias="X-Webhook-Signature"),
+    payload: Annotated[EmailWebhookPayload, Depends(json_body(EmailWebhookPayload))],
 ) -> EmailWebhookResponse:
     """
     Receive email webhook for lockbox processing.
@@ -67,9 +176,7 @@ async def email_webhook(
     Creates a task for each email with PDF attachments.
     PDFs are queued for OCR extraction.
     """
-    logger.info(f"Email webhook received: {payload.subject} from {payload.from_address}")
-
-    # TODO: Verify webhook signature based on provider
+    logger.info("Email webhook received: %s from %s", payload.subject, payload.from_address)
 
     pdf_count = _count_pdf_attachments(payload)
     org_id = _extract_org_id_from_email(payload.to_address)
@@ -83,6 +190,7 @@ async def email_webhook(
             pdf_count=0,
         )
 
+    _check_org_capacity(org_id)
     # Create lockbox processing task
     summary = _build_task_summary(payload, pdf_count)
     task_id = create_task(
@@ -94,10 +202,10 @@ async def email_webhook(
         description=f"Subject: {payload.subject}\nFrom: {payload.from_address}",
     )
 
-    # Publish event for real-time UI update
-    await publish_task_created(org_id, task_id, "lockbox_processing", summary)
+    # Queue event for real-time UI update; published with the next batch
+    queue_task_created(org_id, task_id, "lockbox_processing", summary)
 
-    logger.info(f"Created lockbox task {task_id} for {pdf_count} PDFs")
+    logger.info("Created lockbox task %s for %s PDFs", task_id, pdf_count)
 
     return EmailWebhookResponse(
         accepted=True,
@@ -113,32 +221,44 @@ async def email_webhook(
 # ============================================================
 
 
-def _handle_url_verification(payload: SlackWebhookPayload) -> SlackWebhookResponse:
-    """Handle Slack URL verification challenge."""
-    return SlackWebhookResponse(challenge=payload.challenge)
+# Tagged union on "type": validation reads the tag, then one variant's fields
+_SLACK_PAYLOAD_ADAPTER: TypeAdapter[SlackWebhookPayload] = TypeAdapter(SlackWebhookPayload)
+
+
+def _parse_slack_payload(
+    body: dict[str, Any],
+) -> SlackUrlVerification | SlackCommandPayload:
+    """Validate the full Slack payload, reporting errors as FastAPI would (422)."""
+    try:
+        return _SLACK_PAYLOAD_ADAPTER.validate_python(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(), body=body) from None
 
 
-def _extract_slack_text(payload: SlackWebhookPayload) -> str:
+def _extract_slack_text(payload: SlackCommandPayload) -> str:
     """Extract text content from Slack payload."""
-    if payload.text:
-        return payload.text
+    if isinstance(payload, SlackSlashCommand):
+        return payload.text or ""
     if payload.event and "text" in payload.event:
         return str(payload.event["text"])
     return ""
 
 
-def _build_slack_task_summary(payload: SlackWebhookPayload, text: str) -> str:
+def _build_slack_task_summary(payload: SlackCommandPayload, text: str) -> str:
     """Build task summary from Slack payload."""
-    prefix = payload.command or "@aleq"
-    truncated = text[:50] + "..." if len(text) > 50 else text
+    command = payload.command if isinstance(payload, SlackSlashCommand) else None
+    prefix = command or "@aleq"
+    # text[50:51] is non-empty exactly when len(text) > 50
+    truncated = text[:50] + "..." if text[50:51] else text
     return f"Slack request: {prefix} {truncated}"
 
 
-async def _process_slack_command(payload: SlackWebhookPayload) -> SlackWebhookResponse:
+async def _process_slack_command(payload: SlackCommandPayload) -> SlackWebhookResponse:
     """Process Slack slash command or mention."""
     text = _extract_slack_text(payload)
     summary = _build_slack_task_summary(payload, text)
     org_id = payload.team_id or "default"
+    _check_org_capacity(org_id)
 
     task_id = create_task(
         task_type="slack_request",
@@ -148,9 +268,9 @@ async def _process_slack_command(payload: SlackWebhookPayload) -> SlackWebhookRe
         difficulty=2,
     )
 
-    await publish_task_created(org_id, task_id, "slack_request", summary)
+    queue_task_created(org_id, task_id, "slack_request", summary)
 
-    logger.info(f"Created Slack task {task_id}")
+    logger.info("Created Slack task %s", task_id)
 
     return SlackWebhookResponse(
         response_type="ephemeral",
@@ -159,11 +279,13 @@ async def _process_slack_command(payload: SlackWebhookPayload) -> SlackWebhookRe
     )
 
 
-@router.post("/slack", response_model=SlackWebhookResponse)
+@router.post(
+    "/slack",
+    response_model=SlackWebhookResponse,
+    dependencies=[Depends(verify_slack_signature)],
+)
 async def slack_webhook(
-    payload: SlackWebhookPayload,
-    x_slack_signature: str | None = Header(None, alias="X-Slack-Signature"),
-    x_slack_request_timestamp: str | None = Header(None, alias="X-Slack-Request-Timestamp"),
+    body: dict[str, Any] = Body(..., description="SlackWebhookPayload"),
 ) -> SlackWebhookResponse:
     """
     Receive Slack webhook for commands and mentions.
@@ -173,32 +295,77 @@ async def slack_webhook(
     - Slash commands (/aleq)
     - App mentions (@Aleq)
     """
-    logger.info(f"Slack webhook received: type={payload.type}")
+    logger.info("Slack webhook received: type=%s", body.get("type"))
 
-    # TODO: Verify Slack signature using signing secret
+    # URL verification only needs the challenge; skip building the full model
+    challenge = body.get("challenge")
+    if body.get("type") == "url_verification" and isinstance(challenge, str):
+        return SlackWebhookResponse.model_construct(challenge=challenge)
 
-    # Handle URL verification challenge
-    if payload.type == "url_verification":
-        return _handle_url_verification(payload)
+    payload = _parse_slack_payload(body)
+    if isinstance(payload, SlackUrlVerification):
+        return SlackWebhookResponse(challenge=payload.challenge)
 
     # Process command or mention
     return await _process_slack_command(payload)
 
 
+@router.post(
+    "/slack/batch",
+    response_model=SlackWebhookBatchResponse,
+    dependencies=[Depends(verify_slack_signature)],
+    openapi_extra=json_body_openapi(SlackWebhookBatch),
+)
+async def slack_webhook_batch(
+    batch: Annotated[SlackWebhookBatch, Depends(json_body(SlackWebhookBatch))],
+) -> SlackWebhookBatchResponse:
+    """
+    Receive a burst of Slack payloads in one request.
+
+    The whole body is validated in one pass, so one bad event rejects the
+    batch (422) before any task is created. For the same reason each org's
+    capacity is checked for all of its events up front: the batch either
+    fits (and nothing below awaits, so it still fits) or gets a 429 with no
+    tasks created.
+    """
+    logger.info("Slack batch received: %d events", len(batch.events))
+
+    per_org = Counter(
+        p.team_id or "default" for p in batch.events if not isinstance(p, SlackUrlVerification)
+    )
+    for org_id, count in per_org.items():
+        _check_org_capacity(org_id, count)
+
+    results = []
+    for payload in batch.events:
+        if isinstance(payload, SlackUrlVerification):
+            results.append(SlackWebhookResponse(challenge=payload.challenge))
+        else:
+            results.append(await _process_slack_command(payload))
+    return SlackWebhookBatchResponse(results=results)
+
+
 # ============================================================
 # GENERIC WEBHOOK
 # ============================================================
 
 
-def _build_generic_task_summary(payload: GenericWebhookPayload) -> str:
-    """Build task summary from generic payload."""
-    return f"Process {payload.event_type} from {payload.source or 'webhook'}"
+# Generic webhook event types -> task types (anything else is generic_task)
+_TASK_TYPE_MAP: dict[str, str] = {
+    "invoice_received": "invoice_processing",
+    "payment_received": "payment_posting",
+    "document_uploaded": "document_processing",
+    "approval_needed": "approval_request",
+}
 
 
-@router.post("/generic", response_model=GenericWebhookResponse)
+@router.post(
+    "/generic",
+    response_model=GenericWebhookResponse,
+    openapi_extra=json_body_openapi(GenericWebhookPayload),
+)
 async def generic_webhook(
-    payload: GenericWebhookPayload,
-    request: Request,
+    payload: Annotated[GenericWebhookPayload, Depends(json_body(GenericWebhookPayload))],
 ) -> GenericWebhookResponse:
     """
     Generic webhook for custom integrations.
@@ -206,18 +373,12 @@ async def generic_webhook(
     Accepts any JSON payload with org_id and event_type.
     Creates appropriate task based on event_type.
     """
-    logger.info(f"Generic webhook: {payload.event_type} for org {payload.org_id}")
-
-    # Map event types to task types
-    task_type_map: dict[str, str] = {
-        "invoice_received": "invoice_processing",
-        "payment_received": "payment_posting",
-        "document_uploaded": "document_processing",
-        "approval_needed": "approval_request",
-    }
+    logger.info("Generic webhook: %s for org %s", payload.event_type, payload.org_id)
 
-    task_type = task_type_map.get(payload.event_type, "generic_task")
-    summary = _build_generic_task_summary(payload)
+    _check_org_capacity(payload.org_id)
+    task_type = _TASK_TYPE_MAP.get(payload.event_type, "generic_task")
+    source = payload.source or "webhook"
+    summary = f"Process {payload.event_type} from {source}"
 
     task_id = create_task(
         task_type=task_type,
@@ -227,7 +388,7 @@ async def generic_webhook(
         difficulty=2,
     )
 
-    await publish_task_created(payload.org_id, task_id, task_type, summary)
+    queue_task_created(payload.org_id, task_id, task_type, summary)
 
     return GenericWebhookResponse(
         accepted=True,
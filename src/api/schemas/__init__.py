@@ -57,7 +57,13 @@ from .webhooks import (
     GenericWebhookPayload,
     GenericWebhookResponse,
     SlackChannel,
+    SlackCommandPayload,
+    SlackEventPayload,
+    SlackSlashCommand,
+    SlackUrlVerification,
     SlackUser,
+    SlackWebhookBatch,
+    SlackWebhookBatchResponse,
     SlackWebhookPayload,
     SlackWebhookResponse,
 )
@@ -108,7 +114,13 @@ __all__ = [
     "SlackUser",
     "SlackChannel",
     "SlackWebhookPayload",
+    "SlackUrlVerification",
+    "SlackSlashCommand",
+    "SlackEventPayload",
+    "SlackCommandPayload",
     "SlackWebhookResponse",
+    "SlackWebhookBatch",
+    "SlackWebhookBatchResponse",
     "GenericWebhookPayload",
     "GenericWebhookResponse",
 ]
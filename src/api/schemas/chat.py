@@ -53,6 +53,11 @@ class MessageRequest(BaseModel):
         default_factory=list, description="Objects to include in context"
     )
     stream: bool = Field(False, description="Stream response via SSE")
+    client_message_id: Optional[str] = Field(
+        None,
+        description="Client-generated ID for this turn. Retries that resend the same ID "
+        "get the original response instead of running the turn again.",
+    )
 
 
 class MessageResponse(BaseModel):
@@ -6,6 +6,8 @@ Shared models for errors, pagination, and base types.
 Per API_CONTRACT_V0.md section 8.1
 """
 
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
@@ -83,6 +85,23 @@ class HealthResponse(BaseModel):
 
 
 # Custom exception for API errors
+@lru_cache(maxsize=256)
+def _simple_error_json(
+    code: str, message: str, severity: str, recoverable: bool, retryable: bool
+) -> str:
+    """Serialized ErrorResponse for errors without details, retry, or actions."""
+    detail = ErrorDetail.model_validate(
+        {
+            "code": code,
+            "message": message,
+            "severity": severity,
+            "recoverable": recoverable,
+            "retryable": retryable,
+        }
+    )
+    return ErrorResponse(error=detail).model_dump_json()
+
+
 class APIError(Exception):
     """
     Raise this to return a structured error response.
@@ -117,11 +136,23 @@ class APIError(Exception):
         self.recoverable = recoverable
         self.retryable = retryable
         self.retry = retry
-        self.actions = actions or []
+        # Most errors have no actions; keep None instead of allocating a list
+        self._actions = actions
+        self._response: Optional[ErrorResponse] = None
         super().__init__(message)
 
+    @property
+    def actions(self) -> Sequence[dict[str, Any]]:
+        """Recovery actions (empty if none were given)."""
+        return self._actions or ()
+
     def to_response(self) -> ErrorResponse:
-        """Convert to ErrorResponse"""
+        """Convert to ErrorResponse (built once per error, then reused)"""
+        if self._response is None:
+            self._response = self._build_response()
+        return self._response
+
+    def _build_response(self) -> ErrorResponse:
         return ErrorResponse(
             error=ErrorDetail(
                 code=self.code,
@@ -134,3 +165,16 @@ class APIError(Exception):
                 actions=[ErrorAction(**a) for a in self.actions],
             )
         )
+
+    def to_json(self) -> str:
+        """
+        Serialized ErrorResponse.
+
+        Errors with only scalar fields repeat with identical content, so
+        their body is cached; details/retry/actions are serialized each time.
+        """
+        if self.details is None and not self.retry and not self.actions:
+            return _simple_error_json(
+                self.code, self.message, self.severity, self.recoverable, self.retryable
+            )
+        return self.to_response().model_dump_json()
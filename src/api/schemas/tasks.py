@@ -8,7 +8,7 @@ Per API_CONTRACT_V0.md section 2
 
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import PaginatedResponse
 
@@ -41,6 +41,10 @@ class TaskTimelineEntry(BaseModel):
 class TaskSummary(BaseModel):
     """Task summary for list views"""
 
+    # Immutable so list_tasks can hand out one cached instance per task revision.
+    # Built with model_construct from in-memory TaskRecords (already validated).
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     type: str = Field(..., description="Task type: lockbox, collection, close, etc.")
     summary: str = Field(..., description="Human-readable summary")
@@ -80,7 +84,7 @@ class TaskDetail(BaseModel):
 
     # Tree structure
     parent_id: Optional[str] = None
-    subtasks: list["TaskSummary"] = Field(default_factory=list)
+    subtasks: list[TaskSummary] = Field(default_factory=list)
 
     # Progress
     progress: Optional[float] = None
@@ -143,7 +147,3 @@ class TaskMilestoneEvent(BaseModel):
     summary: str
     next_stage: Optional[str] = None
     requires_action: bool = False
-
-
-# Allow forward reference for subtasks
-TaskDetail.model_rebuild()
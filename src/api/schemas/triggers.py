@@ -85,7 +85,12 @@ class FireTriggerRequest(BaseModel):
 
 
 class TriggerResponse(BaseModel):
-    """Single trigger response."""
+    """
+    Single trigger response.
+
+    Built with model_construct from _row_to_trigger output (our own table),
+    so constraints here are not re-checked on the way out.
+    """
 
     trigger_id: str
     org_id: str
@@ -7,9 +7,9 @@ Per planning.md Baby Mars capability: Webhook Triggers (Email/event → Task cre
 """
 
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import Annotated, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================
 # EMAIL WEBHOOK (Lockbox notifications)
@@ -17,14 +17,20 @@ from pydantic import BaseModel, Field
 
 
 class EmailAttachment(BaseModel):
-    """Email attachment metadata."""
+    """
+    Email attachment metadata.
+
+    Content stays in the provider's raw-email storage and is fetched by
+    storage_key when a task processes it; inline content is ignored so a
+    large email isn't held in memory as model fields.
+    """
 
     filename: str
     content_type: str
     size_bytes: int
     content_id: Optional[str] = None
-    # Base64 content provided separately for large files
-    content_base64: Optional[str] = None
+    # Key of the stored attachment (e.g. S3 object key)
+    storage_key: Optional[str] = None
 
 
 class EmailWebhookPayload(BaseModel):
@@ -32,6 +38,9 @@ class EmailWebhookPayload(BaseModel):
     Incoming email webhook payload.
 
     Supports common email webhook providers (SendGrid, Mailgun, etc.)
+    Only the fields below are kept; anything else the provider sends
+    (including a raw_payload copy of its whole body) is skipped, not
+    built into Python objects.
     """
 
     # Core fields
@@ -51,10 +60,8 @@ class EmailWebhookPayload(BaseModel):
 
     # Provider-specific
     provider: Optional[str] = None
-    raw_payload: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class EmailWebhookResponse(BaseModel):
@@ -87,36 +94,50 @@ class SlackChannel(BaseModel):
     name: Optional[str] = None
 
 
-class SlackWebhookPayload(BaseModel):
-    """
-    Incoming Slack webhook payload.
+class _SlackPayloadBase(BaseModel):
+    """Fields shared by every Slack payload type."""
 
-    Supports both slash commands and event subscriptions (mentions).
-    """
+    user: Optional[SlackUser] = None
+    channel: Optional[SlackChannel] = None
+    team_id: Optional[str] = None
+    timestamp: Optional[str] = None
+
+    # Verification
+    token: Optional[str] = None
 
-    # Event type
-    type: Literal["slash_command", "app_mention", "message", "url_verification"]
 
-    # For url_verification challenge
+class SlackUrlVerification(_SlackPayloadBase):
+    """Slack URL verification challenge (initial setup)."""
+
+    type: Literal["url_verification"]
     challenge: Optional[str] = None
 
-    # Slash command fields
+
+class SlackSlashCommand(_SlackPayloadBase):
+    """Slash command (/aleq)."""
+
+    type: Literal["slash_command"]
     command: Optional[str] = None
     text: Optional[str] = None
     response_url: Optional[str] = None
     trigger_id: Optional[str] = None
 
-    # Event subscription fields (app_mention, message)
+
+class SlackEventPayload(_SlackPayloadBase):
+    """Event subscription (app_mention, message)."""
+
+    type: Literal["app_mention", "message"]
     event: Optional[dict[str, Any]] = None
 
-    # Common fields
-    user: Optional[SlackUser] = None
-    channel: Optional[SlackChannel] = None
-    team_id: Optional[str] = None
-    timestamp: Optional[str] = None
 
-    # Verification
-    token: Optional[str] = None
+# Slash commands and events become tasks; url_verification does not
+SlackCommandPayload = Union[SlackSlashCommand, SlackEventPayload]
+
+# Incoming Slack webhook payload, dispatched on "type" by a tagged union
+SlackWebhookPayload = Annotated[
+    Union[SlackUrlVerification, SlackSlashCommand, SlackEventPayload],
+    Field(discriminator="type"),
+]
 
 
 class SlackWebhookResponse(BaseModel):
@@ -134,6 +155,22 @@ class SlackWebhookResponse(BaseModel):
     task_id: Optional[str] = None
 
 
+# Upper bound on events per batch request
+SLACK_BATCH_MAX_EVENTS = 100
+
+
+class SlackWebhookBatch(BaseModel):
+    """Burst of Slack payloads relayed in one request."""
+
+    events: list[SlackWebhookPayload] = Field(..., max_length=SLACK_BATCH_MAX_EVENTS)
+
+
+class SlackWebhookBatchResponse(BaseModel):
+    """Per-event responses, in request order."""
+
+    results: list[SlackWebhookResponse]
+
+
 # ============================================================
 # GENERIC WEBHOOK
 # ============================================================
@@ -10,9 +10,14 @@ import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from ..cognitive_loop.checkpointer import cleanup_async_checkpointer
 from ..cognitive_loop.graph import (
@@ -25,7 +30,11 @@ from ..persistence.database import close_pool, init_database
 from ..scheduler import get_pulse_scheduler
 from .auth import add_auth_middleware
 from .routes import register_routes
+from .routes.decisions import auto_commit_reaper
+from .routes.events import event_batcher
 from .schemas.common import APIError
+from .services.event_bus import get_event_bus
+from .services.session_store import SessionStore
 
 # Configure structured logging
 setup_logging(
@@ -59,7 +68,7 @@ async def _startup(app: FastAPI) -> None:
         await init_database()
         logger.info("Database initialized")
     except Exception as e:
-        logger.warning(f"Database init skipped (will use in-memory): {e}")
+        logger.warning("Database init skipped (will use in-memory): %s", e)
 
     try:
         if os.environ.get("DATABASE_URL"):
@@ -69,10 +78,12 @@ async def _startup(app: FastAPI) -> None:
             app.state.graph = create_graph_in_memory()
             logger.info("Using in-memory checkpointer")
     except Exception as e:
-        logger.warning(f"Postgres graph failed, using in-memory: {e}")
+        logger.warning("Postgres graph failed, using in-memory: %s", e)
         app.state.graph = create_graph_in_memory()
 
-    app.state.sessions = {}
+    app.state.sessions = SessionStore()
+    await auto_commit_reaper.start()
+    await get_event_bus().start()
 
     if os.getenv("PULSE_SCHEDULER_ENABLED", "true").lower() == "true":
         try:
@@ -81,11 +92,15 @@ async def _startup(app: FastAPI) -> None:
             app.state.scheduler = scheduler
             logger.info("SYSTEM_PULSE scheduler started")
         except Exception as e:
-            logger.warning(f"Scheduler failed to start: {e}")
+            logger.warning("Scheduler failed to start: %s", e)
 
 
 async def _shutdown(app: FastAPI) -> None:
     """Cleanup all application resources on shutdown."""
+    await auto_commit_reaper.stop()
+    # Flush queued events before the bus goes away
+    await event_batcher.stop()
+    await get_event_bus().stop()
     if hasattr(app.state, "scheduler"):
         try:
             await app.state.scheduler.stop()
@@ -125,6 +140,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    # Every route without its own response class renders with orjson
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -159,35 +176,56 @@ add_auth_middleware(app)
 # ============================================================
 
 
+# The 500 body never changes, so encode it once
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "error": {
+            "code": "INTERNAL_ERROR",
+            "message": "An unexpected error occurred",
+            "severity": "error",
+            "recoverable": True,
+            "retryable": True,
+            "retry": {"after_seconds": 5, "max_attempts": 3, "strategy": "exponential"},
+            "actions": [
+                {"label": "Try again", "action": "retry"},
+            ],
+        }
+    }
+)
+
+
 @app.exception_handler(APIError)
-async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+async def api_error_handler(request: Request, exc: APIError) -> Response:
     """Handle structured API errors"""
-    return JSONResponse(
+    # Serialized in pydantic-core (no dict round-trip), cached for simple errors
+    return Response(
+        content=exc.to_json(),
         status_code=exc.status_code,
-        content=exc.to_response().model_dump(),
+        media_type="application/json",
     )
 
 
+# FastAPI's built-in handlers for these render with stdlib json; most route
+# errors are HTTPException(detail={"error": ...}), so keep them on orjson too
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    """Render HTTPException as {"detail": ...} (same shape as FastAPI's default)"""
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    """Render request validation errors as FastAPI's default 422 body"""
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, status_code=422)
+
+
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions with structured format"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "severity": "error",
-                "recoverable": True,
-                "retryable": True,
-                "retry": {"after_seconds": 5, "max_attempts": 3, "strategy": "exponential"},
-                "actions": [
-                    {"label": "Try again", "action": "retry"},
-                ],
-            }
-        },
-    )
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return Response(content=_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 # ============================================================
@@ -204,6 +242,8 @@ register_routes(app)
 
 def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> None:
     """Run the server"""
+    import sys
+
     import uvicorn
 
     uvicorn.run(
@@ -211,6 +251,12 @@ def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) ->
         host=host,
         port=port,
         reload=reload,
+        # C event loop and HTTP parser (from uvicorn[standard]); no uvloop on Windows
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # In-memory sessions/tasks are per process, so raise only with Redis-backed
+        # state. Ignored by uvicorn when reload is on
+        workers=int(os.environ.get("UVICORN_WORKERS", "1")),
         log_level="info",
     )
 
@@ -5,9 +5,28 @@ API Services
 Business logic and shared services.
 """
 
-from .event_bus import EventBus, get_event_bus
+from .chat_stream import batched_sse_events, build_complete_event, sse_frame
+from .decision_store import DecisionStore
+from .event_batcher import EventBatcher
+from .event_bus import EventBus, Subscription, get_event_bus
+from .expiry_reaper import ExpiryReaper
+from .redis_event_bus import RedisEventBus
+from .response_cache import ResponseCache
+from .session_store import SessionStore
+from .task_index import TaskIndex
 
 __all__ = [
+    "DecisionStore",
+    "EventBatcher",
     "EventBus",
     "get_event_bus",
+    "Subscription",
+    "RedisEventBus",
+    "ExpiryReaper",
+    "ResponseCache",
+    "SessionStore",
+    "TaskIndex",
+    "batched_sse_events",
+    "build_complete_event",
+    "sse_frame",
 ]
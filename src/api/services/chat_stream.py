@@ -0,0 +1,209 @@
+"""
+Chat Stream Service
+===================
+
+Maps cognitive loop stream events to SSE frames for /chat/stream.
+Frames are built once as wire-format bytes (orjson payload), so the route
+can hand them straight to a StreamingResponse.
+LLM token chunks are coalesced so one frame carries many tokens, and an
+idle stream gets periodic ping comments so proxies don't drop it.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any, Optional, cast
+
+import orjson
+
+from ...state.schema import BabyMARSState
+
+# Flush buffered tokens once this many characters are pending...
+TOKEN_FLUSH_CHARS = 256
+# ...or once the oldest buffered token is this old (seconds)
+TOKEN_FLUSH_SECONDS = 0.01
+
+# A comment frame goes out after this long without any other frame, so
+# proxies and load balancers with idle timeouts keep the stream open
+PING_INTERVAL_SECONDS = 15.0
+PING_FRAME = b": ping\n\n"
+
+# Upstream events buffered ahead of a slow client; a full queue pauses the graph
+STREAM_QUEUE_SIZE = 64
+
+# Sentinel marking the end of the upstream event stream
+_STREAM_DONE = object()
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+_TOKEN_FRAME_PREFIX = b"event: token\n"
+
+
+def sse_frame(event: str, payload: Any) -> bytes:
+    """Encode one SSE frame. orjson output has no newlines, so one data line suffices."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+
+def is_token_frame(frame: bytes) -> bool:
+    """Check whether a frame is a 'token' event."""
+    return frame.startswith(_TOKEN_FRAME_PREFIX)
+
+
+def process_stream_event(event: dict[str, Any], state: BabyMARSState) -> bytes | None:
+    """Process a single non-token stream event and return an SSE frame or None."""
+    get = event.get
+    event_type = get("event", "")
+    if event_type == "on_chain_start":
+        return sse_frame("node_start", {"node": get("name", "unknown")})
+    elif event_type == "on_chain_end":
+        output = get("data", {}).get("output", {})
+        if isinstance(output, dict):
+            state.update(cast(BabyMARSState, output))
+        return sse_frame(
+            "node_end",
+            {"node": get("name", "unknown"), "supervision_mode": state.get("supervision_mode")},
+        )
+    return None
+
+
+def build_complete_event(
+    state: BabyMARSState, thread_id: str, include_response: bool = True
+) -> bytes:
+    """
+    Build the 'complete' SSE event.
+
+    Pass include_response=False when the response text already went out as
+    token events, so the (possibly large) body is not sent a second time.
+    """
+    get = state.get  # bound once; this runs for every streamed turn
+    supervision_mode = get("supervision_mode", "")
+    payload: dict[str, Any] = {
+        "thread_id": get("thread_id", thread_id),
+        "supervision_mode": supervision_mode,
+        "belief_strength": get("belief_strength_for_action", 0.0),
+        "approval_needed": supervision_mode == "action_proposal",
+    }
+    if include_response:
+        payload["response"] = get("final_response", "")
+    return sse_frame("complete", payload)
+
+
+def _token_chunk(event: dict[str, Any]) -> str:
+    """Return the text of an LLM stream event, or "" for any other event."""
+    if event.get("event") != "on_llm_stream":
+        return ""
+    chunk = event.get("data", {}).get("chunk", "")
+    return str(chunk) if chunk else ""
+
+
+class _TokenBuffer:
+    """Accumulates token chunks until a size or age threshold is reached."""
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._size = 0
+        self._deadline: Optional[float] = None
+
+    def add(self, chunk: str) -> bool:
+        """Buffer a chunk. Returns True when the buffer should be flushed."""
+        if self._deadline is None:
+            self._deadline = time.monotonic() + TOKEN_FLUSH_SECONDS
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        return self._size >= TOKEN_FLUSH_CHARS
+
+    def timeout(self) -> Optional[float]:
+        """Seconds until the buffered tokens are due, or None when empty."""
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def flush(self) -> list[bytes]:
+        """Drain the buffer into a single 'token' SSE frame (empty list if nothing buffered)."""
+        if not self._chunks:
+            return []
+        text = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        self._deadline = None
+        return [sse_frame("token", {"text": text})]
+
+
+def _frames_for(
+    event: Optional[dict[str, Any]], buffer: _TokenBuffer, state: BabyMARSState
+) -> list[bytes]:
+    """SSE frames to emit for one upstream event (None means the token timer fired)."""
+    if event is None:
+        return buffer.flush()
+    chunk = _token_chunk(event)
+    if chunk:
+        return buffer.flush() if buffer.add(chunk) else []
+    # Any other event flushes pending tokens first to preserve ordering
+    frames = buffer.flush()
+    frame = process_stream_event(event, state)
+    if frame:
+        frames.append(frame)
+    return frames
+
+
+async def _pump_events(source: AsyncIterator[Any], queue: asyncio.Queue[Any]) -> None:
+    """Forward upstream events into a queue, ending with a sentinel or the error."""
+    try:
+        async for event in source:
+            await queue.put(event)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(_STREAM_DONE)
+    finally:
+        # Cancelled mid-put, the source is left suspended; close it so its cleanup runs
+        if isinstance(source, AsyncGenerator):
+            await source.aclose()
+
+
+def _next_timeout(buffer: _TokenBuffer, ping_at: float) -> float:
+    """Seconds until buffered tokens are due or a ping is, whichever comes first."""
+    until_ping = max(ping_at - time.monotonic(), 0.0)
+    until_tokens = buffer.timeout()
+    return until_ping if until_tokens is None else min(until_tokens, until_ping)
+
+
+async def batched_sse_events(
+    source: AsyncIterator[Any], state: BabyMARSState
+) -> AsyncIterator[bytes]:
+    """
+    Convert stream events to SSE frames, coalescing consecutive tokens.
+
+    Tokens are flushed when TOKEN_FLUSH_CHARS accumulate, when the oldest
+    has waited TOKEN_FLUSH_SECONDS, before any other event, and at the end.
+    A ping comment is sent after PING_INTERVAL_SECONDS without a frame.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    pump = asyncio.create_task(_pump_events(source, queue))
+    buffer = _TokenBuffer()
+    ping_at = time.monotonic() + PING_INTERVAL_SECONDS
+    try:
+        while True:
+            try:
+                # Timer on this task rather than wait_for's extra Task per event
+                async with asyncio.timeout(_next_timeout(buffer, ping_at)):
+                    item = await queue.get()
+            except asyncio.TimeoutError:
+                item = None
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            frames = _frames_for(item, buffer, state)
+            if not frames and time.monotonic() >= ping_at:
+                frames = [PING_FRAME]
+            for frame in frames:
+                yield frame
+            if frames:
+                ping_at = time.monotonic() + PING_INTERVAL_SECONDS
+        for frame in buffer.flush():
+            yield frame
+    finally:
+        pump.cancel()
+        # Wait for the pump to close the source (asyncio.wait doesn't raise its cancel)
+        await asyncio.wait([pump])
@@ -0,0 +1,58 @@
+"""
+Decision Store Service
+======================
+
+Sharded in-memory store for pending decisions.
+Each shard has its own lock, so unrelated decisions never contend.
+Will be backed by Redis (one hash per shard) for multi-instance deployments.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any, Optional
+
+# Must be a power of two so the shard index is a mask, not a modulo
+SHARD_COUNT = 16
+
+
+class DecisionStore:
+    """
+    Decisions keyed by decision_id, split across SHARD_COUNT dicts.
+
+    Hold lock_for(decision_id) only around the read-modify-write of a
+    single decision, never across an await.
+    """
+
+    def __init__(self) -> None:
+        self._shards: list[dict[str, dict[str, Any]]] = [{} for _ in range(SHARD_COUNT)]
+        self._locks = [asyncio.Lock() for _ in range(SHARD_COUNT)]
+
+    def _index(self, decision_id: str) -> int:
+        return hash(decision_id) & (SHARD_COUNT - 1)
+
+    def lock_for(self, decision_id: str) -> asyncio.Lock:
+        """Lock guarding the shard that holds decision_id."""
+        return self._locks[self._index(decision_id)]
+
+    def get(self, decision_id: str) -> Optional[dict[str, Any]]:
+        """Get a decision, or None if unknown."""
+        return self._shards[self._index(decision_id)].get(decision_id)
+
+    def put(self, decision_id: str, decision: dict[str, Any]) -> None:
+        """Insert or replace a decision."""
+        self._shards[self._index(decision_id)][decision_id] = decision
+
+    def clear(self) -> None:
+        """Drop every decision."""
+        for shard in self._shards:
+            shard.clear()
+
+    def __getitem__(self, decision_id: str) -> dict[str, Any]:
+        return self._shards[self._index(decision_id)][decision_id]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._shards:
+            yield from shard
@@ -0,0 +1,133 @@
+"""
+Event Batcher Service
+=====================
+
+Bounded queue that batches events from high-rate producers (webhooks)
+into EventBus.publish_batch() calls.
+
+Producers enqueue without awaiting; one worker drains up to
+EVENT_BATCH_MAX_SIZE events, waiting at most EVENT_BATCH_MAX_WAIT_SECONDS
+for a batch to fill, so a burst costs one publish (one Redis round-trip)
+instead of one per request.
+
+Each org may have at most EVENT_ORG_MAX_PENDING events queued or in a
+batch, so one tenant's burst can't fill the shared queue; webhooks check
+has_capacity() and reject with 429 before creating a task.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any, Optional
+
+from ...observability import get_logger
+from .event_bus import EventBus
+
+logger = get_logger("baby_mars.api.services.event_batcher")
+
+EVENT_BATCH_MAX_SIZE = 64
+EVENT_BATCH_MAX_WAIT_SECONDS = 0.01
+EVENT_QUEUE_MAX_SIZE = 10_000
+EVENT_ORG_MAX_PENDING = 256
+
+_QueuedEvent = tuple[str, str, dict[str, Any]]
+
+
+class EventBatcher:
+    """
+    Queue events and publish them in batches from a single worker.
+
+    The worker starts on first submit (on the running loop) and is
+    drained by stop() at shutdown.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        max_batch: int = EVENT_BATCH_MAX_SIZE,
+        max_wait: float = EVENT_BATCH_MAX_WAIT_SECONDS,
+        max_queued: int = EVENT_QUEUE_MAX_SIZE,
+        max_pending_per_org: int = EVENT_ORG_MAX_PENDING,
+    ) -> None:
+        self.bus = bus
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._max_queued = max_queued
+        self._max_pending_per_org = max_pending_per_org
+        # org_id -> events submitted but not yet published
+        self._pending: Counter[str] = Counter()
+        self._queue: Optional[asyncio.Queue[_QueuedEvent]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Events taken off the queue but not yet published
+        self._batch: list[_QueuedEvent] = []
+
+    def _ensure_worker(self) -> asyncio.Queue[_QueuedEvent]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # Queues and tasks belong to one loop; rebuild if it changed (tests)
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._max_queued)
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    def has_capacity(self, org_id: str, count: int = 1) -> bool:
+        """Whether org_id may submit count more events right now."""
+        return self._pending[org_id] + count <= self._max_pending_per_org
+
+    def submit(self, org_id: str, event_type: str, data: dict[str, Any]) -> bool:
+        """Queue an event for the next batch (never blocks; False if dropped)."""
+        if not self.has_capacity(org_id):
+            logger.warning("Org %s has too many pending events; dropping %s", org_id, event_type)
+            return False
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait((org_id, event_type, data))
+        except asyncio.QueueFull:
+            logger.warning("Event queue full; dropping %s for org %s", event_type, org_id)
+            return False
+        self._pending[org_id] += 1
+        return True
+
+    def _release(self, batch: list[_QueuedEvent]) -> None:
+        self._pending.subtract(org_id for org_id, _, _ in batch)
+        # Drop zeroed orgs so the counter doesn't grow with every tenant seen
+        self._pending = +self._pending
+
+    async def _fill_batch(self, queue: asyncio.Queue[_QueuedEvent]) -> None:
+        """Wait for one event, then take more until the batch fills or time runs out."""
+        self._batch.append(await queue.get())
+        try:
+            async with asyncio.timeout(self._max_wait):
+                while len(self._batch) < self._max_batch:
+                    self._batch.append(await queue.get())
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self, queue: asyncio.Queue[_QueuedEvent]) -> None:
+        while True:
+            await self._fill_batch(queue)
+            batch, self._batch = self._batch, []
+            try:
+                await self.bus.publish_batch(batch)
+            except Exception as e:
+                logger.error("Failed to publish batch of %s events: %s", len(batch), e)
+            self._release(batch)
+
+    async def stop(self) -> None:
+        """Stop the worker, publishing anything still queued."""
+        if self._worker is None or self._queue is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        remaining, self._batch = self._batch, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            try:
+                await self.bus.publish_batch(remaining)
+            finally:
+                self._release(remaining)
+        self._queue = self._worker = self._loop = None
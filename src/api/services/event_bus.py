@@ -3,96 +3,367 @@ Event Bus Service
 =================
 
 Pub/sub for real-time SSE events.
-Will be backed by Redis for multi-instance deployments.
+Each org has one shared, bounded event log; subscribers keep their own
+cursor into it, so publishing is O(1) regardless of subscriber count.
+Subscribers may filter by event type; they are only woken by events of
+the types they asked for. Logs of orgs nobody has subscribed to for a
+while are dropped.
+Multi-instance deployments use RedisEventBus (redis_event_bus.py).
 """
 
 import asyncio
-from datetime import datetime
+import os
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Optional
 
+import orjson
+
 from ...observability import get_logger
+from ...utils.clock import now_iso
 
 logger = get_logger("baby_mars.api.services.event_bus")
 
+# Events kept per org. Subscribers that fall further behind skip ahead.
+MAX_LOG_EVENTS = 1024
+
+# Logs of orgs with no subscribers are dropped after this long, bounding
+# memory to orgs that were active recently; new logs trigger the sweep
+ORG_LOG_IDLE_SECONDS = 300.0
+ORG_LOG_SWEEP_SECONDS = 60.0
+
+EVENT_ID_PREFIX = "evt_"
+
+# Coalesced events (e.g. task progress) publish at most once per key per window
+COALESCE_WINDOW_SECONDS = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class EventRecord:
+    """A published event; shared by every subscriber, so immutable."""
+
+    event_id: Optional[str]  # None for synthetic events such as events:dropped
+    seq: int
+    org_id: str
+    type: str
+    data: dict[str, Any]
+    data_json: str  # Serialized once at publish; every SSE frame reuses it
+    timestamp: str
+
+
+def _event_seq(event: EventRecord) -> int:
+    return event.seq
+
+
+def parse_event_id(event_id: str) -> Optional[int]:
+    """Return the sequence number in an event ID, or None if it isn't one of ours."""
+    if not event_id.startswith(EVENT_ID_PREFIX):
+        return None
+    try:
+        return int(event_id[len(EVENT_ID_PREFIX) :])
+    except ValueError:
+        return None
+
+
+class _OrgLog:
+    """Shared event log for one org."""
+
+    def __init__(self) -> None:
+        self.events: deque[EventRecord] = deque(maxlen=MAX_LOG_EVENTS)
+        self.next_index = 0  # Log index the next published event will get
+        self.tip = asyncio.Event()  # Set (then replaced) on every publish
+        # Per type-filter signals, set only by events matching the filter;
+        # an entry lives as long as a subscription with that filter does
+        self.filtered_tips: dict[frozenset[str], asyncio.Event] = {}
+        self.filter_refs: dict[frozenset[str], int] = {}
+        self.subscribers = 0
+        self.idle_since: Optional[float] = time.monotonic()  # None while subscribed
+
+
+class Subscription:
+    """A subscriber's cursor into an org's event log."""
+
+    def __init__(self, org_id: str, cursor: int, types: Optional[frozenset[str]] = None) -> None:
+        self.org_id = org_id
+        self.cursor = cursor
+        self.types = types  # None receives every event type
+
+
+def _dropped_marker(org_id: str, dropped: int) -> EventRecord:
+    """
+    Synthetic event telling a slow client it missed events and should resync.
+
+    It has no event_id, so it does not move the client's Last-Event-ID.
+    """
+    data = {"dropped": dropped}
+    return EventRecord(
+        event_id=None,
+        seq=0,
+        org_id=org_id,
+        type="events:dropped",
+        data=data,
+        data_json=orjson.dumps(data).decode(),
+        timestamp=now_iso(),
+    )
+
 
 class EventBus:
     """
     Simple pub/sub for SSE events.
 
     In-memory implementation for single instance.
-    For multi-instance, replace with Redis pub/sub.
+    For multi-instance, use RedisEventBus (EVENT_BUS_BACKEND=redis).
     """
 
     def __init__(self) -> None:
-        self._subscribers: dict[str, list[asyncio.Queue[dict[str, Any]]]] = {}
-        self._event_counter = 0
-        self._event_history: list[dict[str, Any]] = []  # For replay on reconnect
-        self._max_history = 100
-        self._counter_lock = asyncio.Lock()  # Protect counter from race conditions
-
-    def subscribe(self, org_id: str) -> asyncio.Queue[dict[str, Any]]:
-        """Subscribe to events for an org."""
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        if org_id not in self._subscribers:
-            self._subscribers[org_id] = []
-        self._subscribers[org_id].append(queue)
-        logger.debug(f"New subscriber for org {org_id} (total: {len(self._subscribers[org_id])})")
-        return queue
-
-    def unsubscribe(self, org_id: str, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        self._logs: dict[str, _OrgLog] = {}
+        self._last_seq = 0
+        # (org_id, event_type, key) -> latest data waiting for its window to close
+        self._pending: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._dropped = 0  # Events skipped by subscribers that fell behind
+        self._last_sweep = time.monotonic()
+
+    async def start(self) -> None:
+        """Start background work (nothing to do in memory)."""
+
+    async def stop(self) -> None:
+        """Stop background work (nothing to do in memory)."""
+
+    def _log_for(self, org_id: str) -> _OrgLog:
+        log = self._logs.get(org_id)
+        if log is None:
+            self._evict_idle_logs()
+            log = self._logs[org_id] = _OrgLog()
+        return log
+
+    def _evict_idle_logs(self) -> None:
+        """Drop logs of orgs nobody has subscribed to for ORG_LOG_IDLE_SECONDS."""
+        now = time.monotonic()
+        if now - self._last_sweep < ORG_LOG_SWEEP_SECONDS:
+            return
+        self._last_sweep = now
+        cutoff = now - ORG_LOG_IDLE_SECONDS
+        idle = [
+            org_id
+            for org_id, log in self._logs.items()
+            if log.idle_since is not None and log.idle_since <= cutoff
+        ]
+        for org_id in idle:
+            del self._logs[org_id]
+        if idle:
+            logger.debug("Dropped event logs for %s idle orgs", len(idle))
+
+    async def subscribe(self, org_id: str, types: Optional[frozenset[str]] = None) -> Subscription:
+        """
+        Subscribe to events for an org, starting after the latest event.
+
+        If types is given, only events of those types are delivered.
+        """
+        log = self._log_for(org_id)
+        log.subscribers += 1
+        log.idle_since = None
+        types = types or None
+        if types is not None:
+            log.filter_refs[types] = log.filter_refs.get(types, 0) + 1
+            log.filtered_tips.setdefault(types, asyncio.Event())
+        logger.debug("New subscriber for org %s (total: %s)", org_id, log.subscribers)
+        return Subscription(org_id, log.next_index, types)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
         """Unsubscribe from events."""
-        if org_id in self._subscribers:
-            try:
-                self._subscribers[org_id].remove(queue)
-                logger.debug(f"Subscriber removed for org {org_id}")
-            except ValueError:
-                pass
+        log = self._logs.get(subscription.org_id)
+        if log and log.subscribers > 0:
+            log.subscribers -= 1
+            if log.subscribers == 0:
+                log.idle_since = time.monotonic()
+            self._release_filter(log, subscription.types)
+            logger.debug("Subscriber removed for org %s", subscription.org_id)
+
+    def _release_filter(self, log: _OrgLog, types: Optional[frozenset[str]]) -> None:
+        """Drop a type filter's signal once its last subscription is gone."""
+        if types is None or types not in log.filter_refs:
+            return
+        refs = log.filter_refs[types]
+        if refs > 1:
+            log.filter_refs[types] = refs - 1
+        else:
+            del log.filter_refs[types]
+            log.filtered_tips.pop(types, None)
 
     async def publish(self, org_id: str, event_type: str, data: dict[str, Any]) -> None:
         """Publish an event to all subscribers of an org."""
-        # Use lock to prevent race conditions on counter increment
-        async with self._counter_lock:
-            self._event_counter += 1
-            event_id = f"evt_{self._event_counter}"
-
-        event = {
-            "event_id": event_id,
-            "org_id": org_id,
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        # Store in history for replay
-        self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
-
-        # Publish to subscribers (iterate over copy to avoid race with unsubscribe)
-        if org_id in self._subscribers:
-            for queue in list(self._subscribers[org_id]):
-                try:
-                    await queue.put(event)
-                except Exception as e:
-                    logger.warning(f"Failed to publish event: {e}")
-
-        logger.debug(f"Published {event_type} to org {org_id}")
-
-    def get_events_since(self, org_id: str, last_event_id: str) -> list[dict[str, Any]]:
-        """Get events since a given event ID for replay."""
-        events = []
-        found = False
-        for event in self._event_history:
-            if found and event["org_id"] == org_id:
-                events.append(event)
-            if event["event_id"] == last_event_id:
-                found = True
+        self._append(org_id, event_type, data)
+
+    async def publish_batch(self, events: list[tuple[str, str, dict[str, Any]]]) -> None:
+        """Publish (org_id, event_type, data) events, waking each org's subscribers once."""
+        woken: dict[str, set[str]] = {}
+        for org_id, event_type, data in events:
+            self._append(org_id, event_type, data, wake=False)
+            woken.setdefault(org_id, set()).add(event_type)
+        for org_id, event_types in woken.items():
+            self._wake(self._log_for(org_id), event_types)
+
+    def publish_coalesced(
+        self,
+        org_id: str,
+        event_type: str,
+        key: str,
+        data: dict[str, Any],
+        window: float = COALESCE_WINDOW_SECONDS,
+    ) -> None:
+        """
+        Publish after a short window, keeping only the latest data per key.
+
+        Rapid updates for the same key (e.g. one task's progress) collapse
+        into a single event, so subscribers are woken once per window.
+        """
+        pending_key = (org_id, event_type, key)
+        scheduled = pending_key in self._pending
+        self._pending[pending_key] = data  # Last writer wins
+        if not scheduled:
+            asyncio.get_running_loop().call_later(window, self._flush_pending, pending_key)
+
+    def _flush_pending(self, pending_key: tuple[str, str, str]) -> None:
+        data = self._pending.pop(pending_key, None)
+        if data is not None:
+            org_id, event_type, _ = pending_key
+            self._append(org_id, event_type, data)
+
+    def _append(
+        self, org_id: str, event_type: str, data: dict[str, Any], wake: bool = True
+    ) -> None:
+        """Build an event with the next local ID and deliver it."""
+        # Nanosecond timestamps stay unique across restarts; bumped past the
+        # last one so IDs are strictly increasing within the process
+        seq = max(time.time_ns(), self._last_seq + 1)
+        self._last_seq = seq
+        event = EventRecord(
+            event_id=f"{EVENT_ID_PREFIX}{seq}",
+            seq=seq,
+            org_id=org_id,
+            type=event_type,
+            data=data,
+            data_json=orjson.dumps(data).decode(),
+            timestamp=now_iso(),
+        )
+        self._deliver(event, wake)
+
+    def _deliver(self, event: EventRecord, wake: bool = True) -> None:
+        """Add an event to the org's log and (unless batching) wake its subscribers."""
+        log = self._log_for(event.org_id)
+        log.events.append(event)
+        log.next_index += 1
+        if wake:
+            self._wake(log, (event.type,))
+
+        logger.debug("Published %s to org %s", event.type, event.org_id)
+
+    def _wake(self, log: _OrgLog, event_types: Iterable[str]) -> None:
+        """Wake subscribers waiting on any of the event types."""
+        # Wake every waiting subscriber at once, then arm a fresh signal
+        log.tip.set()
+        log.tip = asyncio.Event()
+        for types, tip in list(log.filtered_tips.items()):
+            if not types.isdisjoint(event_types):
+                tip.set()
+                log.filtered_tips[types] = asyncio.Event()
+
+    def read(self, subscription: Subscription) -> list[EventRecord]:
+        """Return events published since the subscription's cursor and advance it."""
+        log = self._logs.get(subscription.org_id)
+        if log is None or subscription.cursor >= log.next_index:
+            return []
+        first_index = log.next_index - len(log.events)
+        dropped = first_index - subscription.cursor
+        if dropped > 0:
+            logger.warning(
+                "Subscriber for org %s fell behind; skipped %s events",
+                subscription.org_id,
+                dropped,
+            )
+            self._dropped += dropped
+            subscription.cursor = first_index
+        events = list(islice(log.events, subscription.cursor - first_index, None))
+        subscription.cursor = log.next_index
+        if subscription.types is not None:
+            events = [e for e in events if e.type in subscription.types]
+        if dropped > 0:
+            events.insert(0, _dropped_marker(subscription.org_id, dropped))
         return events
 
+    async def wait_for_events(
+        self, subscription: Subscription, timeout: float
+    ) -> list[EventRecord]:
+        """Return new events, waiting up to timeout seconds (empty list on timeout)."""
+        events = self.read(subscription)
+        if events:
+            return events
+        log = self._log_for(subscription.org_id)
+        if subscription.types is None:
+            tip = log.tip
+        else:
+            tip = log.filtered_tips.setdefault(subscription.types, asyncio.Event())
+        try:
+            # asyncio.timeout arms a timer on this task; wait_for would wrap a new Task
+            async with asyncio.timeout(timeout):
+                await tip.wait()
+        except asyncio.TimeoutError:
+            return []
+        return self.read(subscription)
+
+    def _parse_event_id(self, event_id: str) -> Optional[int]:
+        """Sequence number for one of this bus's event IDs."""
+        return parse_event_id(event_id)
+
+    def _position_after(self, log: _OrgLog, last_event_id: str) -> Optional[int]:
+        """Offset in log.events just past last_event_id, or None if it isn't retained."""
+        seq = self._parse_event_id(last_event_id)
+        if seq is None or not log.events or seq < _event_seq(log.events[0]):
+            return None
+        # IDs increase with log order, so the log can be binary-searched
+        return bisect_right(log.events, seq, key=_event_seq)
+
+    async def resume(self, subscription: Subscription, last_event_id: str) -> bool:
+        """
+        Rewind a subscription to just after last_event_id.
+
+        Returns False (leaving the cursor alone) if the event is no longer retained.
+        """
+        log = self._logs.get(subscription.org_id)
+        if log is None:
+            return False
+        position = self._position_after(log, last_event_id)
+        if position is None:
+            return False
+        subscription.cursor = log.next_index - len(log.events) + position
+        return True
+
+    def get_events_since(
+        self, org_id: str, last_event_id: str, types: Optional[frozenset[str]] = None
+    ) -> list[EventRecord]:
+        """Get events since a given event ID for replay, optionally filtered by type."""
+        log = self._logs.get(org_id)
+        if log is None:
+            return []
+        position = self._position_after(log, last_event_id)
+        if position is None:
+            return []
+        events = islice(log.events, position, None)
+        return [e for e in events if types is None or e.type in types]
+
+    @property
+    def dropped_count(self) -> int:
+        """Total events skipped by slow subscribers."""
+        return self._dropped
+
     @property
     def subscriber_count(self) -> int:
         """Total number of active subscribers."""
-        return sum(len(subs) for subs in self._subscribers.values())
+        return sum(log.subscribers for log in self._logs.values())
 
 
 # Global instance
@@ -100,10 +371,20 @@ _event_bus: Optional[EventBus] = None
 
 
 def get_event_bus() -> EventBus:
-    """Get or create the global event bus."""
+    """
+    Get or create the global event bus.
+
+    Set EVENT_BUS_BACKEND=redis to fan out through Redis Streams (REDIS_URL)
+    so every API process sees every event.
+    """
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus()
+        if os.environ.get("EVENT_BUS_BACKEND", "memory").lower() == "redis":
+            from .redis_event_bus import RedisEventBus
+
+            _event_bus = RedisEventBus()
+        else:
+            _event_bus = EventBus()
     return _event_bus
 
 
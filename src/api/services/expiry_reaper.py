@@ -0,0 +1,89 @@
+"""
+Expiry Reaper Service
+=====================
+
+One background task that fires a callback for keys whose deadline passed.
+Replaces a sleeping task per key with a single min-heap and one sleep.
+"""
+
+import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from ...observability import get_logger
+
+logger = get_logger("baby_mars.api.services.expiry_reaper")
+
+
+class ExpiryReaper:
+    """
+    Min-heap of (expires_at, key) drained by a single background loop.
+
+    expires_at is an epoch timestamp (time.time()). on_expire is awaited
+    once per key, in deadline order.
+    """
+
+    def __init__(self, on_expire: Callable[[str], Awaitable[None]]) -> None:
+        self._on_expire = on_expire
+        self._heap: list[tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the reaper loop is currently running."""
+        return self._task is not None
+
+    def schedule(self, expires_at: float, key: str) -> None:
+        """Queue key to expire at the given epoch timestamp."""
+        heapq.heappush(self._heap, (expires_at, key))
+        # Wake the loop in case this deadline is earlier than the one it sleeps on
+        self._wakeup.set()
+
+    def clear(self) -> None:
+        """Drop every scheduled key."""
+        self._heap.clear()
+
+    async def start(self) -> None:
+        """Start the reaper background loop."""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Stop the reaper loop. Keys still scheduled are kept."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def reap_expired(self) -> int:
+        """Fire on_expire for every key that is due. Returns how many fired."""
+        now = time.time()
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, key = heapq.heappop(self._heap)
+            try:
+                await self._on_expire(key)
+            except Exception as e:
+                logger.error("Expiry callback failed for %s: %s", key, e, exc_info=True)
+            fired += 1
+        return fired
+
+    async def _run_loop(self) -> None:
+        """Sleep until the earliest deadline (or a new schedule), then reap."""
+        while True:
+            # Cleared before reaping so schedules made during callbacks wake us again
+            self._wakeup.clear()
+            await self.reap_expired()
+            timeout = max(self._heap[0][0] - time.time(), 0.0) if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,264 @@
+"""
+Redis Event Bus
+===============
+
+EventBus backed by Redis Streams for multi-instance deployments.
+
+Every process XADDs to one stream per org (stream:{org_id}) and runs a
+single XREAD consumer for the orgs it has local subscribers for. Events
+read back are delivered into the in-memory log, so local fanout is the
+same as EventBus and each process holds one Redis connection, not one
+per SSE client. Event IDs are the Redis stream IDs, so a client can
+resume on any process: entries its local log lacks are read with XRANGE.
+"""
+
+import asyncio
+import os
+from typing import Any, Optional
+
+import orjson
+
+from ...observability import get_logger
+from ...utils.clock import now_iso
+from .event_bus import MAX_LOG_EVENTS, EventBus, EventRecord, Subscription
+
+logger = get_logger("baby_mars.api.services.redis_event_bus")
+
+# Approximate cap on entries kept per org stream
+STREAM_MAXLEN = 10_000
+# How long one XREAD waits; also how soon a newly subscribed org is picked up
+XREAD_BLOCK_MS = 1000
+XREAD_COUNT = 100
+# Pause before retrying after a Redis error
+RETRY_DELAY_SECONDS = 1.0
+
+
+def stream_key(org_id: str) -> str:
+    """Redis key of an org's event stream."""
+    return f"stream:{org_id}"
+
+
+def parse_stream_id(stream_id: str) -> Optional[int]:
+    """Order-preserving int for a Redis stream ID ("<ms>-<n>"), or None."""
+    ms, sep, n = stream_id.partition("-")
+    if not sep:
+        return None
+    try:
+        return (int(ms) << 32) | int(n)
+    except ValueError:
+        return None
+
+
+def _entry_record(org_id: str, stream_id: str, fields: dict[str, str]) -> Optional[EventRecord]:
+    """EventRecord for a stream entry, or None if the ID isn't a stream ID."""
+    seq = parse_stream_id(stream_id)
+    if seq is None:
+        return None
+    data_json = fields["data"]
+    return EventRecord(
+        event_id=stream_id,
+        seq=seq,
+        org_id=org_id,
+        type=fields["type"],
+        data=orjson.loads(data_json),
+        data_json=data_json,
+        timestamp=fields.get("ts") or now_iso(),
+    )
+
+
+class RedisEventBus(EventBus):
+    """
+    Redis Streams pub/sub with in-process fanout.
+
+    publish() only writes to Redis; events reach local subscribers (in this
+    and every other process) through the XREAD consumer started by start().
+    """
+
+    def __init__(self, redis_url: Optional[str] = None) -> None:
+        super().__init__()
+        self.redis_url = redis_url or os.environ.get("REDIS_URL", "redis://localhost:6379")
+        self._redis: Any = None
+        self._consumer: Optional[asyncio.Task[None]] = None
+        # Last stream ID read per org; orgs drop out when they lose all subscribers
+        self._stream_ids: dict[str, str] = {}
+        # Keeps coalesced publishes alive until their XADD finishes
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def _client(self) -> Any:
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def start(self) -> None:
+        """Start the per-process stream consumer."""
+        if self._consumer is None:
+            self._consumer = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Stop the consumer and close the Redis connection."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def publish(self, org_id: str, event_type: str, data: dict[str, Any]) -> None:
+        """Append an event to the org's stream (best effort, like the in-memory bus)."""
+        fields = {"type": event_type, "data": orjson.dumps(data).decode(), "ts": now_iso()}
+        try:
+            await self._client().xadd(
+                stream_key(org_id), fields, maxlen=STREAM_MAXLEN, approximate=True
+            )
+        except Exception as e:
+            logger.warning("Failed to publish %s to org %s: %s", event_type, org_id, e)
+
+    async def publish_batch(self, events: list[tuple[str, str, dict[str, Any]]]) -> None:
+        """Append several events in one pipelined round-trip."""
+        ts = now_iso()
+        pipe = self._client().pipeline(transaction=False)
+        for org_id, event_type, data in events:
+            fields = {"type": event_type, "data": orjson.dumps(data).decode(), "ts": ts}
+            pipe.xadd(stream_key(org_id), fields, maxlen=STREAM_MAXLEN, approximate=True)
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to publish batch of %s events: %s", len(events), e)
+
+    def _flush_pending(self, pending_key: tuple[str, str, str]) -> None:
+        data = self._pending.pop(pending_key, None)
+        if data is not None:
+            org_id, event_type, _ = pending_key
+            task = asyncio.create_task(self.publish(org_id, event_type, data))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    def _parse_event_id(self, event_id: str) -> Optional[int]:
+        return parse_stream_id(event_id)
+
+    async def subscribe(self, org_id: str, types: Optional[frozenset[str]] = None) -> Subscription:
+        """
+        Subscribe to events for an org, starting after the stream's latest entry.
+
+        The start ID is read here rather than on the consumer's next sync, so
+        events published while its current XREAD is blocked are not skipped.
+        """
+        latest: Optional[str] = None
+        if org_id not in self._stream_ids:
+            try:
+                newest = await self._client().xrevrange(stream_key(org_id), count=1)
+                latest = newest[0][0] if newest else "0-0"
+            except Exception as e:
+                logger.warning("Failed to read org %s stream position: %s", org_id, e)
+        subscription = await super().subscribe(org_id, types)
+        if latest is not None:
+            self._stream_ids.setdefault(org_id, latest)
+        return subscription
+
+    def deliver_entries(self, org_id: str, entries: list[tuple[str, dict[str, str]]]) -> None:
+        """
+        Deliver XREAD entries for an org to local subscribers.
+
+        Entries the log already holds are skipped: an XREAD issued before a
+        resume() backfill can return entries the backfill delivered.
+        """
+        log = self._log_for(org_id)
+        for stream_id, fields in entries:
+            record = _entry_record(org_id, stream_id, fields)
+            if record is None or (log.events and record.seq <= log.events[-1].seq):
+                continue
+            self._deliver(record)
+            self._stream_ids[org_id] = stream_id
+
+    async def resume(self, subscription: Subscription, last_event_id: str) -> bool:
+        """
+        Rewind a subscription to just after last_event_id.
+
+        If the local log doesn't reach back that far (the client was last
+        connected to another process, or this process only just started
+        reading the org's stream), the missing entries are read from Redis
+        with XRANGE and added to the log first.
+        """
+        org_id = subscription.org_id
+        seq = parse_stream_id(last_event_id)
+        if seq is None:
+            return False
+        log = self._log_for(org_id)
+        if log.events and seq >= log.events[0].seq:
+            return await super().resume(subscription, last_event_id)
+        try:
+            entries = await self._client().xrange(
+                stream_key(org_id), min=f"({last_event_id}", max="+", count=MAX_LOG_EVENTS
+            )
+        except Exception as e:
+            logger.warning("Failed to read org %s stream for resume: %s", org_id, e)
+            return False
+        if not self._backfill(org_id, entries, complete=len(entries) < MAX_LOG_EVENTS):
+            return False
+        # Keep the consumer from skipping past anything published since
+        self._stream_ids.setdefault(org_id, last_event_id)
+        # The log now starts at the first event after last_event_id
+        subscription.cursor = log.next_index - len(log.events)
+        return True
+
+    def _backfill(
+        self, org_id: str, entries: list[tuple[str, dict[str, str]]], complete: bool
+    ) -> bool:
+        """
+        Add XRANGE entries the org's log doesn't hold, keeping it in stream order.
+
+        Entries older than the log are prepended (existing cursors are absolute
+        indices, so they stay put) and newer ones are delivered as usual.
+        Returns False if the entries and the log don't join up or don't fit.
+        """
+        log = self._log_for(org_id)
+        if not log.events:
+            self.deliver_entries(org_id, entries)
+            return True
+        head, tail = log.events[0].seq, log.events[-1].seq
+        records = [r for r in (_entry_record(org_id, *e) for e in entries) if r is not None]
+        if not complete and records and records[-1].seq < head:
+            return False  # XRANGE stopped before reaching the log
+        older = [r for r in records if r.seq < head]
+        if len(older) + len(log.events) > MAX_LOG_EVENTS:
+            return False
+        log.events.extendleft(reversed(older))
+        newer = [e for e in entries if (parse_stream_id(e[0]) or 0) > tail]
+        self.deliver_entries(org_id, newer)
+        return True
+
+    async def _sync_streams(self, client: Any) -> dict[str, str]:
+        """Track streams for orgs with local subscribers; return XREAD arguments."""
+        wanted = {org_id for org_id, log in self._logs.items() if log.subscribers > 0}
+        for org_id in list(self._stream_ids):
+            if org_id not in wanted:
+                del self._stream_ids[org_id]
+        for org_id in wanted - self._stream_ids.keys():
+            # subscribe() couldn't read the stream; start after its newest entry
+            latest = await client.xrevrange(stream_key(org_id), count=1)
+            self._stream_ids[org_id] = latest[0][0] if latest else "0-0"
+        return {stream_key(org_id): last_id for org_id, last_id in self._stream_ids.items()}
+
+    async def _run_loop(self) -> None:
+        """Read every subscribed org's stream on one connection and fan out locally."""
+        while True:
+            try:
+                client = self._client()
+                streams = await self._sync_streams(client)
+                if not streams:
+                    await asyncio.sleep(XREAD_BLOCK_MS / 1000)
+                    continue
+                response = await client.xread(streams, count=XREAD_COUNT, block=XREAD_BLOCK_MS)
+                for key, entries in response or []:
+                    self.deliver_entries(key.removeprefix("stream:"), entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Event stream read failed, retrying: %s", e)
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
@@ -0,0 +1,67 @@
+"""
+Response Cache Service
+======================
+
+Short-lived cache of chat responses keyed by a fingerprint of the
+client-supplied turn ID. Lets client retries of the same turn skip the
+cognitive loop.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+# How long a response can be replayed for an identical input
+RESPONSE_CACHE_TTL_SECONDS = 300
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+
+def fingerprint(*parts: str) -> bytes:
+    """Fingerprint the given input parts (blake2b, 16 bytes; not for security)."""
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).digest()
+
+
+class ResponseCache:
+    """
+    TTL cache ordered by insertion, so expired entries are always at the front.
+
+    Bounded by RESPONSE_CACHE_MAX_ENTRIES; the oldest entry is evicted first.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self._ttl
+        while self._entries:
+            _, (stored_at, _) = next(iter(self._entries.items()))
+            if stored_at >= cutoff:
+                break
+            self._entries.popitem(last=False)
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        self._expire()
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Cache a value, evicting the oldest entry when full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,92 @@
+"""
+Session Store Service
+=====================
+
+In-memory chat sessions with LRU eviction and an idle TTL.
+Abandoned sessions expire instead of living for the life of the process.
+Will be backed by Redis in Phase 2.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+# Sessions idle for longer than this are dropped
+SESSION_TTL_SECONDS = 3600
+SESSION_MAX_ENTRIES = 10_000
+
+
+class SessionStore:
+    """
+    Sessions ordered by last access, so idle ones are always at the front.
+
+    Reads and writes refresh a session's TTL; when full, the least recently
+    used session is evicted. Every operation is O(1) plus expired entries.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_entries: int = SESSION_MAX_ENTRIES,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._expired = 0  # Sessions dropped after sitting idle past the TTL
+        self._evicted = 0  # Sessions dropped to stay under max_entries
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._ttl
+        while self._entries:
+            _, (touched_at, _) = next(iter(self._entries.items()))
+            if touched_at >= cutoff:
+                break
+            self._entries.popitem(last=False)
+            self._expired += 1
+
+    def get(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Return the session and refresh its TTL, or None if missing or expired."""
+        now = time.monotonic()
+        self._expire(now)
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        self._entries[session_id] = (now, entry[1])
+        self._entries.move_to_end(session_id)
+        return entry[1]
+
+    def pop(self, session_id: str, default: Optional[dict[str, Any]] = None) -> Any:
+        """Remove and return the session (default if missing or expired)."""
+        self._expire(time.monotonic())
+        entry = self._entries.pop(session_id, None)
+        return default if entry is None else entry[1]
+
+    def __setitem__(self, session_id: str, session: dict[str, Any]) -> None:
+        now = time.monotonic()
+        self._expire(now)
+        self._entries[session_id] = (now, session)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evicted += 1
+
+    def __contains__(self, session_id: object) -> bool:
+        return self.get(session_id) is not None if isinstance(session_id, str) else False
+
+    def __len__(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._entries)
+
+    @property
+    def expired_count(self) -> int:
+        """Total sessions dropped by the idle TTL."""
+        return self._expired
+
+    @property
+    def evicted_count(self) -> int:
+        """Total sessions evicted because the store was full."""
+        return self._evicted
+
+    def clear(self) -> None:
+        """Drop every session."""
+        self._entries.clear()
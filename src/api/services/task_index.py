@@ -0,0 +1,110 @@
+"""
+Task Index Service
+==================
+
+Secondary indexes over the in-memory task store for /tasks listing.
+Tasks are kept in list order (priority desc, created_at desc) with
+status and source sets, so a page is read without sorting every task.
+The order is stored as parallel columns rather than one tuple per task,
+so a page scan walks a single dense list of IDs.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
+from typing import Optional
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+class TaskIndex:
+    """
+    Ordering and filter indexes keyed by task_id.
+
+    Priority and created_at never change after creation, so the order is
+    maintained on insert only; status moves are O(1) set updates.
+    """
+
+    def __init__(self) -> None:
+        # Parallel columns, ascending by (priority, created_at, task_id);
+        # read back to front
+        self._priorities = array("d")
+        self._created: list[str] = []
+        self._ids: list[str] = []
+        self._by_status: dict[str, set[str]] = {}
+        self._by_source: dict[str, set[str]] = {}
+
+    def add(self, task_id: str, priority: float, created_at: str, status: str, source: str) -> None:
+        """Index a newly created task."""
+        pos = self._insert_position(priority, created_at, task_id)
+        self._priorities.insert(pos, priority)
+        self._created.insert(pos, created_at)
+        self._ids.insert(pos, task_id)
+        self._by_status.setdefault(status, set()).add(task_id)
+        self._by_source.setdefault(source, set()).add(task_id)
+
+    def _insert_position(self, priority: float, created_at: str, task_id: str) -> int:
+        """Bisect each column in turn, narrowing to the run of equal keys."""
+        lo = bisect_left(self._priorities, priority)
+        hi = bisect_right(self._priorities, priority, lo)
+        lo, hi = (
+            bisect_left(self._created, created_at, lo, hi),
+            bisect_right(self._created, created_at, lo, hi),
+        )
+        return bisect_right(self._ids, task_id, lo, hi)
+
+    def move_status(self, task_id: str, old_status: str, new_status: str) -> None:
+        """Record a task's status change."""
+        if old_status == new_status:
+            return
+        self._by_status.get(old_status, set()).discard(task_id)
+        self._by_status.setdefault(new_status, set()).add(task_id)
+
+    def clear(self) -> None:
+        """Drop every index entry."""
+        del self._priorities[:]
+        self._created.clear()
+        self._ids.clear()
+        self._by_status.clear()
+        self._by_source.clear()
+
+    def _matching(
+        self, statuses: Iterable[str], source: Optional[str]
+    ) -> Optional[AbstractSet[str]]:
+        """
+        IDs passing the filters, or None when nothing is filtered.
+
+        A single filter returns the index set itself (read-only) instead of a copy.
+        """
+        matches: Optional[AbstractSet[str]] = None
+        status_sets = [self._by_status.get(s, _EMPTY) for s in statuses]
+        if len(status_sets) == 1:
+            matches = status_sets[0]
+        elif status_sets:
+            matches = set().union(*status_sets)
+        if source is not None:
+            by_source = self._by_source.get(source, _EMPTY)
+            matches = by_source if matches is None else matches & by_source
+        return matches
+
+    def page(
+        self, statuses: Iterable[str], source: Optional[str], offset: int, limit: int
+    ) -> tuple[list[str], int]:
+        """Return (task_ids for the page, total matching) in listing order."""
+        matches = self._matching(statuses, source)
+        total = len(self._ids) if matches is None else len(matches)
+        page: list[str] = []
+        if limit <= 0 or offset >= total:
+            return page, total
+        skipped = 0
+        for task_id in reversed(self._ids):
+            if matches is not None and task_id not in matches:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            page.append(task_id)
+            if len(page) == limit:
+                break
+        return page, total
@@ -65,24 +65,29 @@ class StructuredLogger:
         new_logger._context = {**self._context, **kwargs}
         return new_logger
 
-    def _log(self, level: int, message: str, **kwargs: Any) -> None:
+    def _log(
+        self, level: int, message: str, *args: Any, exc_info: Any = None, **kwargs: Any
+    ) -> None:
+        # %-style args are only interpolated if a handler actually emits the record
+        if not self.logger.isEnabledFor(level):
+            return
         extra = {"extra_data": {**self._context, **kwargs}}
-        self.logger.log(level, message, extra=extra)
+        self.logger.log(level, message, *args, exc_info=exc_info, extra=extra)
 
-    def debug(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.DEBUG, message, **kwargs)
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.INFO, message, **kwargs)
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.WARNING, message, **kwargs)
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.ERROR, message, **kwargs)
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs: Any) -> None:
-        self._log(logging.CRITICAL, message, **kwargs)
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(logging.CRITICAL, message, *args, **kwargs)
 
 
 def setup_logging(
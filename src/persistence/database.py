@@ -22,6 +22,13 @@ try:
 except ImportError:
     pass
 
+# Pool sizing. asyncpg opens min_size connections when the pool is created,
+# so startup pays the connect/auth handshakes instead of the first requests.
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", "10"))
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", "20"))
+# Idle connections above min_size are closed after this many seconds
+DB_POOL_MAX_INACTIVE_SECONDS = 300.0
+
 # Connection pool singleton with lock for thread safety
 _pool: Optional[asyncpg.Pool] = None
 _pool_lock: asyncio.Lock = asyncio.Lock()
@@ -185,6 +192,11 @@ async def init_database() -> None:
             ON scheduled_triggers(org_id, enabled)
         """)
 
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_triggers_org_type
+            ON scheduled_triggers(org_id, trigger_type, enabled)
+        """)
+
         # ============================================================
         # RAPPORT TRACKING
         # ============================================================
@@ -254,8 +266,9 @@ async def get_pool() -> asyncpg.Pool:
             if _pool is None:
                 _pool = await asyncpg.create_pool(
                     get_database_url(),
-                    min_size=2,
-                    max_size=10,
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_SECONDS,
                 )
     return _pool
 
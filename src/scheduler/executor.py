@@ -14,7 +14,7 @@ from zoneinfo import ZoneInfo
 from ..observability import get_logger
 from .message_factory import create_trigger_state
 from .persistence import get_trigger, update_trigger_fired
-from .triggers import TriggerResult
+from .triggers import ScheduledTrigger, TriggerResult
 
 logger = get_logger(__name__)
 
@@ -42,11 +42,13 @@ def _success_result(
 async def execute_trigger(
     trigger_id: str,
     event_data: Optional[dict[str, Any]] = None,
+    trigger: Optional[ScheduledTrigger] = None,
 ) -> TriggerResult:
-    """Execute a trigger by invoking the cognitive loop."""
+    """Execute a trigger by invoking the cognitive loop (pass trigger if already loaded)."""
     start_time = datetime.now(ZoneInfo("UTC"))
 
-    trigger = await get_trigger(trigger_id)
+    if trigger is None:
+        trigger = await get_trigger(trigger_id)
     if not trigger:
         return _error_result(trigger_id, start_time, "Trigger not found")
     if not trigger["enabled"]:
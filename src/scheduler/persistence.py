@@ -6,14 +6,16 @@ Database operations for scheduled triggers.
 Uses Postgres for durable storage.
 """
 
-import json
 import uuid
 from datetime import datetime
 from typing import Any, Optional, cast
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from ..observability import get_logger
 from ..persistence.database import get_connection
+from .persistence_cache import invalidate_org_triggers
 from .triggers import ScheduledTrigger
 
 logger = get_logger(__name__)
@@ -32,20 +34,50 @@ async def load_active_triggers() -> list[ScheduledTrigger]:
         return [_row_to_trigger(row) for row in rows]
 
 
-async def load_org_triggers(org_id: str) -> list[ScheduledTrigger]:
-    """Load all triggers for an organization."""
+async def load_org_triggers(
+    org_id: str,
+    *,
+    user_id: Optional[str] = None,
+    trigger_type: Optional[str] = None,
+    enabled: Optional[bool] = None,
+) -> list[ScheduledTrigger]:
+    """Load triggers for an organization, filtered in SQL by any given fields."""
+    conditions = ["org_id = $1"]
+    params: list[Any] = [org_id]
+    for column, value in (
+        ("trigger_type", trigger_type),
+        ("enabled", enabled),
+        ("user_id", user_id),
+    ):
+        if value is not None:
+            params.append(value)
+            conditions.append(f"{column} = ${len(params)}")
+
     async with get_connection() as conn:
         rows = await conn.fetch(
-            """
+            f"""
             SELECT * FROM scheduled_triggers
-            WHERE org_id = $1
+            WHERE {" AND ".join(conditions)}
             ORDER BY created_at
             """,
-            org_id,
+            *params,
         )
         return [_row_to_trigger(row) for row in rows]
 
 
+async def count_active_triggers(org_id: str) -> int:
+    """Count an organization's enabled triggers without loading them."""
+    async with get_connection() as conn:
+        count = await conn.fetchval(
+            """
+            SELECT COUNT(*) FROM scheduled_triggers
+            WHERE org_id = $1 AND enabled = TRUE
+            """,
+            org_id,
+        )
+        return int(count)
+
+
 async def get_trigger(trigger_id: str) -> Optional[ScheduledTrigger]:
     """Get a specific trigger by ID."""
     async with get_connection() as conn:
@@ -58,6 +90,54 @@ async def get_trigger(trigger_id: str) -> Optional[ScheduledTrigger]:
         return None
 
 
+async def get_trigger_scoped(trigger_id: str, org_id: str) -> Optional[ScheduledTrigger]:
+    """Get a trigger by ID only if it belongs to the org."""
+    async with get_connection() as conn:
+        row = await conn.fetchrow(
+            "SELECT * FROM scheduled_triggers WHERE trigger_id = $1 AND org_id = $2",
+            trigger_id,
+            org_id,
+        )
+        return _row_to_trigger(row) if row else None
+
+
+async def update_trigger_scoped(
+    trigger_id: str,
+    org_id: str,
+    *,
+    enabled: Optional[bool] = None,
+    config: Optional[dict[str, Any]] = None,
+    description: Optional[str] = None,
+) -> Optional[ScheduledTrigger]:
+    """
+    Patch a trigger in one query if it belongs to the org.
+
+    None leaves a field unchanged; config is merged into the stored config.
+    Returns the updated trigger, or None if no trigger matched.
+    """
+    async with get_connection() as conn:
+        row = await conn.fetchrow(
+            """
+            UPDATE scheduled_triggers
+            SET enabled = COALESCE($3, enabled),
+                config = config || COALESCE($4::jsonb, '{}'::jsonb),
+                description = COALESCE($5, description),
+                updated_at = NOW()
+            WHERE trigger_id = $1 AND org_id = $2
+            RETURNING *
+            """,
+            trigger_id,
+            org_id,
+            enabled,
+            orjson.dumps(config).decode() if config is not None else None,
+            description,
+        )
+    if row is None:
+        return None
+    invalidate_org_triggers(org_id)
+    return _row_to_trigger(row)
+
+
 async def save_trigger(trigger: ScheduledTrigger) -> None:
     """Save or update a trigger."""
     now = datetime.now(ZoneInfo("UTC"))
@@ -85,9 +165,9 @@ async def save_trigger(trigger: ScheduledTrigger) -> None:
             trigger["org_id"],
             trigger.get("user_id"),
             trigger["trigger_type"],
-            json.dumps(trigger["config"]),
+            orjson.dumps(trigger["config"]).decode(),
             trigger["action"],
-            json.dumps(trigger.get("action_context", {})),
+            orjson.dumps(trigger.get("action_context", {})).decode(),
             trigger.get("description", ""),
             trigger.get("enabled", True),
             _parse_timestamp(trigger.get("last_fired")),
@@ -97,20 +177,41 @@ async def save_trigger(trigger: ScheduledTrigger) -> None:
             now,
             trigger.get("created_by", "system"),
         )
+    invalidate_org_triggers(trigger["org_id"])
     logger.debug(f"Saved trigger: {trigger['trigger_id']}")
 
 
 async def delete_trigger(trigger_id: str) -> bool:
     """Delete a trigger."""
     async with get_connection() as conn:
-        result = await conn.execute(
-            "DELETE FROM scheduled_triggers WHERE trigger_id = $1",
+        org_id = await conn.fetchval(
+            "DELETE FROM scheduled_triggers WHERE trigger_id = $1 RETURNING org_id",
+            trigger_id,
+        )
+        if org_id is None:
+            return False
+        invalidate_org_triggers(org_id)
+        logger.debug(f"Deleted trigger: {trigger_id}")
+        return True
+
+
+async def delete_trigger_scoped(trigger_id: str, org_id: str) -> bool:
+    """Delete a trigger in one query if it belongs to the org."""
+    async with get_connection() as conn:
+        deleted = await conn.fetchval(
+            """
+            DELETE FROM scheduled_triggers
+            WHERE trigger_id = $1 AND org_id = $2
+            RETURNING trigger_id
+            """,
             trigger_id,
+            org_id,
         )
-        deleted = str(result) == "DELETE 1"
-        if deleted:
-            logger.debug(f"Deleted trigger: {trigger_id}")
-        return deleted
+    if deleted is None:
+        return False
+    invalidate_org_triggers(org_id)
+    logger.debug(f"Deleted trigger: {trigger_id}")
+    return True
 
 
 async def update_trigger_fired(trigger_id: str) -> None:
@@ -118,17 +219,20 @@ async def update_trigger_fired(trigger_id: str) -> None:
     now = datetime.now(ZoneInfo("UTC"))
 
     async with get_connection() as conn:
-        await conn.execute(
+        org_id = await conn.fetchval(
             """
             UPDATE scheduled_triggers
             SET last_fired = $2,
                 fire_count = fire_count + 1,
                 updated_at = $2
             WHERE trigger_id = $1
+            RETURNING org_id
             """,
             trigger_id,
             now,
         )
+    if org_id is not None:
+        invalidate_org_triggers(org_id)
 
 
 async def get_event_triggers(
@@ -207,10 +311,11 @@ def _parse_json_field(value: Any) -> dict[str, Any]:
     if value is None:
         return {}
     if isinstance(value, str):
+        # JSONB columns arrive as text (no asyncpg codec); parsed on every row load
         try:
-            parsed = json.loads(value)
+            parsed = orjson.loads(value)
             return cast(dict[str, Any], parsed) if isinstance(parsed, dict) else {}
-        except (json.JSONDecodeError, TypeError):
+        except orjson.JSONDecodeError:
             return {}
     if isinstance(value, dict):
         return value
@@ -0,0 +1,102 @@
+"""
+Scheduler Persistence Cache
+===========================
+
+Per-org cache of load_org_triggers() for the read-heavy trigger endpoints.
+Each filter combination is cached separately under its org, alongside the
+org's enabled-trigger count for the scheduler status endpoint.
+
+Writes through persistence.py (save, delete, fire) invalidate only the
+touched org. A short TTL bounds staleness from writes made by other
+processes.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Optional
+
+from .triggers import ScheduledTrigger
+
+# How long an org's trigger list is served from memory
+ORG_TRIGGERS_TTL_SECONDS = 30.0
+
+# (user_id, trigger_type, enabled) filters passed to load_org_triggers
+_Filters = tuple[Optional[str], Optional[str], Optional[bool]]
+
+# org_id -> filters -> (expires_at_monotonic, triggers)
+_cache: dict[str, dict[_Filters, tuple[float, list[ScheduledTrigger]]]] = {}
+# org_id -> (expires_at_monotonic, enabled trigger count)
+_counts: dict[str, tuple[float, int]] = {}
+# Serializes loads per org so a burst of requests hits the database once
+_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+# Bumped on invalidation so a load that raced a write isn't cached
+_generations: defaultdict[str, int] = defaultdict(int)
+
+
+def _cached(org_id: str, filters: _Filters) -> list[ScheduledTrigger] | None:
+    entry = _cache.get(org_id, {}).get(filters)
+    if entry and time.monotonic() < entry[0]:
+        return list(entry[1])
+    return None
+
+
+async def cached_load_org_triggers(
+    org_id: str,
+    *,
+    user_id: Optional[str] = None,
+    trigger_type: Optional[str] = None,
+    enabled: Optional[bool] = None,
+) -> list[ScheduledTrigger]:
+    """load_org_triggers() through the cache; returns a new list each call."""
+    from .persistence import load_org_triggers
+
+    filters = (user_id, trigger_type, enabled)
+    triggers = _cached(org_id, filters)
+    if triggers is not None:
+        return triggers
+    async with _locks[org_id]:
+        # Another request may have loaded while we waited for the lock
+        triggers = _cached(org_id, filters)
+        if triggers is not None:
+            return triggers
+        generation = _generations[org_id]
+        triggers = await load_org_triggers(
+            org_id, user_id=user_id, trigger_type=trigger_type, enabled=enabled
+        )
+        if _generations[org_id] == generation:
+            expires_at = time.monotonic() + ORG_TRIGGERS_TTL_SECONDS
+            _cache.setdefault(org_id, {})[filters] = (expires_at, triggers)
+        return list(triggers)
+
+
+async def cached_count_active_triggers(org_id: str) -> int:
+    """count_active_triggers() through the cache."""
+    from .persistence import count_active_triggers
+
+    entry = _counts.get(org_id)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1]
+    # A cached enabled-only listing already knows the answer
+    enabled = _cached(org_id, (None, None, True))
+    if enabled is not None:
+        return len(enabled)
+    generation = _generations[org_id]
+    count = await count_active_triggers(org_id)
+    if _generations[org_id] == generation:
+        _counts[org_id] = (time.monotonic() + ORG_TRIGGERS_TTL_SECONDS, count)
+    return count
+
+
+def invalidate_org_triggers(org_id: str) -> None:
+    """Drop an org's cached triggers after one of them changes."""
+    _generations[org_id] += 1
+    _cache.pop(org_id, None)
+    _counts.pop(org_id, None)
+
+
+def clear_trigger_cache() -> None:
+    """Drop every cached org (for testing)."""
+    _cache.clear()
+    _counts.clear()
+    _generations.clear()
@@ -5,6 +5,7 @@ Baby MARS Utilities
 Shared utilities for retry logic, circuit breakers, and resilience patterns.
 """
 
+from .clock import now_iso
 from .retry import (
     CircuitBreaker,
     CircuitOpenError,
@@ -19,4 +20,5 @@ __all__ = [
     "CircuitOpenError",
     "RetryExhaustedError",
     "retry_async",
+    "now_iso",
 ]
@@ -0,0 +1,47 @@
+"""
+Clock Utilities
+================
+
+Cheap wall-clock timestamps for hot paths.
+
+Usage:
+    from src.utils.clock import now_iso
+
+    task["updated_at"] = now_iso()
+"""
+
+import time
+from datetime import datetime, timezone
+
+# Timestamps within this many seconds of each other share one string
+TIMESTAMP_RESOLUTION_SECONDS = 0.01
+
+_cached_at = 0.0
+_cached_iso = ""
+_cached_utc_at = 0.0
+_cached_utc_iso = ""
+
+
+def now_iso() -> str:
+    """
+    Local time as an ISO 8601 string, same format as datetime.now().isoformat().
+
+    The formatted string is reused for up to TIMESTAMP_RESOLUTION_SECONDS,
+    so bursts of calls pay for one clock read and no formatting.
+    """
+    global _cached_at, _cached_iso
+    now = time.time()
+    if now - _cached_at >= TIMESTAMP_RESOLUTION_SECONDS or now < _cached_at:
+        _cached_at = now
+        _cached_iso = datetime.fromtimestamp(now).isoformat()
+    return _cached_iso
+
+
+def utc_now_iso() -> str:
+    """UTC time as an ISO 8601 string with offset, cached like now_iso()."""
+    global _cached_utc_at, _cached_utc_iso
+    now = time.time()
+    if now - _cached_utc_at >= TIMESTAMP_RESOLUTION_SECONDS or now < _cached_utc_at:
+        _cached_utc_at = now
+        _cached_utc_iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _cached_utc_iso
@@ -0,0 +1,106 @@
+"""
+Auth Middleware Tests
+=====================
+
+Tests for the ASGI auth middleware:
+- Open when no keys are configured, 401 on a bad key otherwise
+- Skip paths and CORS preflights bypass auth
+- The accepted key is visible to routes via request.state
+- Streamed responses pass through
+"""
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    """App with the auth middleware and a couple of probe routes."""
+    from fastapi import FastAPI, Request
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    from src.api.auth import add_auth_middleware
+
+    app = FastAPI()
+    add_auth_middleware(app)
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/whoami")
+    async def whoami(request: Request) -> dict[str, str]:
+        return {"api_key": request.state.api_key}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+class TestAuthMiddleware:
+    """Test API key enforcement."""
+
+    def test_dev_mode_without_keys(self, client, monkeypatch):
+        """Should let requests through as dev-mode when no keys are configured."""
+        monkeypatch.delenv("BABY_MARS_API_KEYS", raising=False)
+
+        response = client.get("/whoami")
+
+        assert response.json() == {"api_key": "dev-mode"}
+
+    def test_rejects_invalid_key(self, client, monkeypatch):
+        """Should return 401 when keys are configured and the key is wrong."""
+        monkeypatch.setenv("BABY_MARS_API_KEYS", "k1")
+
+        response = client.get("/whoami", headers={"X-API-Key": "nope"})
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid or missing API key"}
+
+    def test_accepts_header_or_query_key(self, client, monkeypatch):
+        """Should accept a valid key from the header or the api_key query param."""
+        monkeypatch.setenv("BABY_MARS_API_KEYS", "k1")
+
+        assert client.get("/whoami", headers={"X-API-Key": "k1"}).json()["api_key"] == "k1"
+        assert client.get("/whoami?api_key=k1").json()["api_key"] == "k1"
+
+    def test_skip_paths_bypass_auth(self, client, monkeypatch):
+        """Should serve /health without a key."""
+        monkeypatch.setenv("BABY_MARS_API_KEYS", "k1")
+
+        assert client.get("/health").status_code == 200
+
+    def test_preflight_skips_auth(self, monkeypatch):
+        """Should let CORS answer preflights even when keys are configured."""
+        from fastapi import FastAPI
+        from fastapi.middleware.cors import CORSMiddleware
+        from fastapi.testclient import TestClient
+
+        from src.api.auth import add_auth_middleware
+
+        monkeypatch.setenv("BABY_MARS_API_KEYS", "k1")
+        app = FastAPI()
+        app.add_middleware(CORSMiddleware, allow_origins=["http://app"], allow_methods=["*"])
+        add_auth_middleware(app)
+
+        response = TestClient(app).options(
+            "/chat/message",
+            headers={"Origin": "http://app", "Access-Control-Request-Method": "POST"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://app"
+
+    def test_streams_pass_through(self, client, monkeypatch):
+        """Should deliver every streamed chunk."""
+        monkeypatch.delenv("BABY_MARS_API_KEYS", raising=False)
+
+        response = client.get("/stream")
+
+        assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
@@ -0,0 +1,72 @@
+"""
+Belief Route Tests
+==================
+
+Tests for list_beliefs filtering and pagination.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Belief graph with a few beliefs, returned for any org."""
+    from src.api.routes import beliefs
+    from src.graphs.belief_graph import BeliefGraph
+
+    graph = BeliefGraph()
+    for i, (category, status) in enumerate(
+        [
+            ("moral", "active"),
+            ("competence", "active"),
+            ("moral", "superseded"),
+            ("moral", "active"),
+            ("moral", "active"),
+        ]
+    ):
+        graph.add_belief(
+            {
+                "belief_id": f"b{i}",
+                "statement": f"Belief {i}",
+                "category": category,
+                "strength": 0.5,
+                "status": status,
+            }
+        )
+
+    async def get_graph(org_id):
+        return graph
+
+    monkeypatch.setattr(beliefs, "get_org_belief_graph", get_graph)
+    return graph
+
+
+class TestListBeliefs:
+    """Test category/status filters and paging."""
+
+    @pytest.mark.asyncio
+    async def test_filters_by_category_and_status(self, graph):
+        """Should return only active beliefs in the requested category."""
+        from src.api.routes.beliefs import list_beliefs
+
+        result = await list_beliefs("org_1", category="moral", status="active", limit=50, offset=0)
+
+        assert [b.belief_id for b in result] == ["b0", "b3", "b4"]
+
+    @pytest.mark.asyncio
+    async def test_paginates_after_filtering(self, graph):
+        """Should apply offset and limit to the filtered beliefs."""
+        from src.api.routes.beliefs import list_beliefs
+
+        result = await list_beliefs("org_1", category="moral", status="active", limit=1, offset=1)
+
+        assert [b.belief_id for b in result] == ["b3"]
+
+    @pytest.mark.asyncio
+    async def test_no_filters(self, graph):
+        """Should list every belief when no category or status is given."""
+        from src.api.routes.beliefs import list_beliefs
+
+        result = await list_beliefs("org_1", category=None, status=None, limit=50, offset=0)
+
+        assert len(result) == 5
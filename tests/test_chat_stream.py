@@ -0,0 +1,167 @@
+"""
+Chat Stream Tests
+==================
+
+Tests for SSE frame construction in the chat stream service:
+- Token coalescing
+- Ordering around non-token events
+- Upstream error propagation
+- Backpressure and closing the upstream stream
+- Keepalive pings while the loop is quiet
+"""
+
+import json
+
+import pytest
+
+
+async def _events(*events):
+    """Yield stream events as an async iterator."""
+    for event in events:
+        yield event
+
+
+def _token(text):
+    return {"event": "on_llm_stream", "data": {"chunk": text}}
+
+
+def _parse(frame):
+    """Split an SSE frame into (event, decoded data)."""
+    event_line, data_line = frame.decode().rstrip("\n").split("\n")
+    return event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))
+
+
+async def _collect(source, state):
+    from src.api.services.chat_stream import batched_sse_events
+
+    return [_parse(frame) async for frame in batched_sse_events(source, state)]
+
+
+class TestBatchedSSEEvents:
+    """Test token coalescing in batched_sse_events."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_consecutive_tokens(self):
+        """Should merge adjacent token chunks into one frame."""
+        frames = await _collect(_events(_token("Hel"), _token("lo"), _token("!")), {})
+
+        assert frames == [("token", {"text": "Hello!"})]
+
+    @pytest.mark.asyncio
+    async def test_flushes_tokens_before_node_events(self):
+        """Should emit buffered tokens before the next non-token event."""
+        node_end = {"event": "on_chain_end", "name": "appraisal", "data": {"output": {}}}
+        frames = await _collect(_events(_token("a"), _token("b"), node_end, _token("c")), {})
+
+        assert [event for event, _ in frames] == ["token", "node_end", "token"]
+        assert frames[0][1] == {"text": "ab"}
+        assert frames[2][1] == {"text": "c"}
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_size_threshold_hit(self):
+        """Should emit a frame as soon as TOKEN_FLUSH_CHARS are buffered."""
+        from src.api.services.chat_stream import TOKEN_FLUSH_CHARS
+
+        big = "x" * TOKEN_FLUSH_CHARS
+        frames = await _collect(_events(_token(big), _token("y")), {})
+
+        assert [data["text"] for _, data in frames] == [big, "y"]
+
+    @pytest.mark.asyncio
+    async def test_node_end_updates_state(self):
+        """Should merge node output into the shared state."""
+        state = {}
+        node_end = {
+            "event": "on_chain_end",
+            "name": "action_selection",
+            "data": {"output": {"supervision_mode": "autonomous"}},
+        }
+        frames = await _collect(_events(node_end), state)
+
+        assert state["supervision_mode"] == "autonomous"
+        assert frames[0][1]["supervision_mode"] == "autonomous"
+
+    @pytest.mark.asyncio
+    async def test_propagates_upstream_errors(self):
+        """Should re-raise exceptions from the cognitive loop stream."""
+
+        async def failing():
+            yield _token("partial")
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await _collect(failing(), {})
+
+    @pytest.mark.asyncio
+    async def test_slow_client_bounds_buffering_and_closes_source(self):
+        """Should stop pulling upstream events when the queue is full and close the source."""
+        import asyncio
+
+        from src.api.services.chat_stream import STREAM_QUEUE_SIZE, batched_sse_events
+
+        produced = 0
+        closed = False
+
+        async def endless():
+            nonlocal produced, closed
+            try:
+                while True:
+                    produced += 1
+                    yield {"event": "on_chain_start", "name": f"node_{produced}"}
+            finally:
+                closed = True
+
+        frames = batched_sse_events(endless(), {})
+        await frames.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert produced <= STREAM_QUEUE_SIZE + 2
+        await frames.aclose()
+        assert closed
+
+    @pytest.mark.asyncio
+    async def test_pings_while_upstream_is_quiet(self, monkeypatch):
+        """Should send a ping comment when no frame has gone out for the ping interval."""
+        import asyncio
+
+        from src.api.services import chat_stream
+
+        monkeypatch.setattr(chat_stream, "PING_INTERVAL_SECONDS", 0.01)
+
+        async def slow_step():
+            await asyncio.sleep(0.05)
+            yield {"event": "on_chain_start", "name": "appraisal"}
+
+        frames = [f async for f in chat_stream.batched_sse_events(slow_step(), {})]
+
+        assert frames[0] == b": ping\n\n"
+        assert _parse(frames[-1]) == ("node_start", {"node": "appraisal"})
+
+
+class TestBuildCompleteEvent:
+    """Test the final 'complete' SSE frame."""
+
+    def test_omits_response_when_already_streamed(self):
+        """Should carry only metadata when include_response is False."""
+        from src.api.services.chat_stream import build_complete_event
+
+        state = {"final_response": "Long answer", "supervision_mode": "action_proposal"}
+
+        _, full = _parse(build_complete_event(state, "t1"))
+        _, meta = _parse(build_complete_event(state, "t1", include_response=False))
+
+        assert full["response"] == "Long answer"
+        assert "response" not in meta
+        assert meta["approval_needed"] is True
+        assert meta["thread_id"] == "t1"
+
+    def test_frame_is_sse_wire_format(self):
+        """Should encode event and single-line data terminated by a blank line."""
+        from src.api.services.chat_stream import is_token_frame, sse_frame
+
+        frame = sse_frame("token", {"text": "line one\nline two"})
+
+        assert frame == b'event: token\ndata: {"text":"line one\\nline two"}\n\n'
+        assert is_token_frame(frame)
+        assert not is_token_frame(sse_frame("complete", {}))
@@ -0,0 +1,223 @@
+"""
+Decisions Route Tests
+======================
+
+Tests for the in-memory decision lifecycle including:
+- Idempotent execution
+- Idempotency key expiry
+- Soft-decision undo window
+"""
+
+import pytest
+
+
+@pytest.fixture
+def decisions():
+    """Decisions module with empty stores."""
+    from src.api.routes import decisions as module
+
+    module._decisions.clear()
+    module._detail_cache.clear()
+    module._idempotency_keys.clear()
+    module.auto_commit_reaper.clear()
+    yield module
+    module._decisions.clear()
+    module._detail_cache.clear()
+    module._idempotency_keys.clear()
+    module.auto_commit_reaper.clear()
+
+
+def _execute_request(choice="approve", idempotency_key=None):
+    from src.api.schemas.decisions import DecisionExecuteRequest
+
+    return DecisionExecuteRequest(choice=choice, idempotency_key=idempotency_key)
+
+
+class TestDecisionStore:
+    """Test the sharded decision store."""
+
+    def test_put_get_across_shards(self):
+        """Should find every decision regardless of which shard it lands in."""
+        from src.api.services.decision_store import SHARD_COUNT, DecisionStore
+
+        store = DecisionStore()
+        ids = [f"decision_{i}" for i in range(SHARD_COUNT * 4)]
+        for decision_id in ids:
+            store.put(decision_id, {"decision_id": decision_id})
+
+        assert len(store) == len(ids)
+        assert sorted(store) == sorted(ids)
+        assert store.get("decision_7") == {"decision_id": "decision_7"}
+        assert store.get("missing") is None
+        assert store.lock_for("decision_7") is store.lock_for("decision_7")
+
+
+class TestGetDecision:
+    """Test DecisionDetail rendering in get_decision."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_detail_until_decision_changes(self, decisions):
+        """Should return the cached detail until the decision changes."""
+        decision_id = decisions.create_decision(
+            "payment",
+            "Pay vendor",
+            0.6,
+            belief_snapshots=[
+                {"belief_id": "b1", "statement": "Vendor is trusted", "strength": 0.8, "version": 1}
+            ],
+        )
+
+        first = await decisions.get_decision(decision_id)
+        second = await decisions.get_decision(decision_id)
+        await decisions.execute_decision(decision_id, _execute_request())
+        staged = await decisions.get_decision(decision_id)
+
+        assert second is first
+        assert staged is not first
+        assert staged.status == "staged"
+        assert staged.undo_available is True
+        assert first.undo_available is False
+
+    @pytest.mark.asyncio
+    async def test_same_tick_mutation_invalidates_detail(self, decisions):
+        """Should re-render after a mutation that keeps status and updated_at."""
+        decision_id = decisions.create_decision("payment", "Pay vendor", 0.6)
+        first = await decisions.get_decision(decision_id)
+        decision = decisions._decisions[decision_id]
+
+        decision["result"] = {"note": "changed"}
+        decisions._touch(decision, decision["updated_at"])
+        second = await decisions.get_decision(decision_id)
+
+        assert second.status == first.status
+        assert second.updated_at == first.updated_at
+        assert second.result == {"note": "changed"}
+        assert "_detail_cache" not in decision
+
+
+class TestIdempotency:
+    """Test idempotency key handling in execute_decision."""
+
+    @pytest.mark.asyncio
+    async def test_replays_duplicate_request(self, decisions):
+        """Should return was_replay=True for a repeated idempotency key."""
+        decision_id = decisions.create_decision("payment", "Pay vendor", 0.6, is_soft=False)
+
+        first = await decisions.execute_decision(
+            decision_id, _execute_request(idempotency_key="k1")
+        )
+        second = await decisions.execute_decision(
+            decision_id, _execute_request(idempotency_key="k1")
+        )
+
+        assert first.was_replay is False
+        assert second.was_replay is True
+        assert second.status == "committed"
+
+    def test_cleanup_drops_only_expired_keys(self, decisions):
+        """Should pop expired keys from the front and keep fresh ones."""
+        now = decisions.time.monotonic()
+        stale = now - decisions.IDEMPOTENCY_TTL_SECONDS - 1
+        decisions._idempotency_keys["old-1"] = ("decision_a", stale)
+        decisions._idempotency_keys["old-2"] = ("decision_b", stale)
+        decisions._idempotency_keys["fresh"] = ("decision_c", now)
+
+        decisions._cleanup_expired_idempotency_keys()
+
+        assert list(decisions._idempotency_keys) == ["fresh"]
+
+    def test_cleanup_runs_at_most_once_per_interval(self, decisions, monkeypatch):
+        """Should skip the sweep until the cleanup interval has elapsed."""
+        clock = [decisions.IDEMPOTENCY_TTL_SECONDS + 1000.0]
+        monkeypatch.setattr(decisions.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(decisions, "_last_idempotency_cleanup", clock[0])
+        decisions._idempotency_keys["old"] = ("decision_a", 0.0)
+
+        decisions._maybe_cleanup_idempotency_keys()
+        assert "old" in decisions._idempotency_keys
+
+        clock[0] += decisions.IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS
+        decisions._maybe_cleanup_idempotency_keys()
+        assert "old" not in decisions._idempotency_keys
+
+
+class TestSoftDecisions:
+    """Test the soft-commit undo window."""
+
+    @pytest.mark.asyncio
+    async def test_undo_within_window(self, decisions):
+        """Should undo a staged soft decision inside the window."""
+        decision_id = decisions.create_decision("categorization", "Recode txn", 0.5)
+
+        executed = await decisions.execute_decision(decision_id, _execute_request())
+        undone = await decisions.undo_decision(decision_id)
+
+        assert executed.status == "staged"
+        assert undone.undone is True
+        assert decisions._decisions[decision_id]["status"] == "undone"
+
+    @pytest.mark.asyncio
+    async def test_undo_after_window_commits(self, decisions):
+        """Should refuse undo and commit once undo_expires_ts has passed."""
+        decision_id = decisions.create_decision("categorization", "Recode txn", 0.5)
+        await decisions.execute_decision(decision_id, _execute_request())
+        decisions._decisions[decision_id]["undo_expires_ts"] = decisions.time.time() - 1
+
+        undone = await decisions.undo_decision(decision_id)
+
+        assert undone.undone is False
+        assert undone.reason == "WINDOW_EXPIRED"
+        assert decisions._decisions[decision_id]["status"] == "committed"
+
+    @pytest.mark.asyncio
+    async def test_reject(self, decisions):
+        """Should mark the decision rejected."""
+        decision_id = decisions.create_decision("payment", "Pay vendor", 0.6)
+
+        result = await decisions.execute_decision(decision_id, _execute_request(choice="reject"))
+
+        assert result.status == "rejected"
+        assert decisions._decisions[decision_id]["status"] == "rejected"
+
+
+class TestAutoCommitReaper:
+    """Test the single-task auto-commit reaper."""
+
+    @pytest.mark.asyncio
+    async def test_reaps_due_staged_decision(self, decisions):
+        """Should commit a staged decision once its deadline is due."""
+        decision_id = decisions.create_decision("categorization", "Recode txn", 0.5)
+        await decisions.execute_decision(decision_id, _execute_request())
+
+        assert await decisions.auto_commit_reaper.reap_expired() == 0
+        decisions.auto_commit_reaper.schedule(0.0, decision_id)
+        assert await decisions.auto_commit_reaper.reap_expired() == 1
+
+        assert decisions._decisions[decision_id]["status"] == "committed"
+        assert decisions._decisions[decision_id]["result"]["committed"] is True
+
+    @pytest.mark.asyncio
+    async def test_loop_wakes_for_earlier_deadline(self):
+        """Should fire in deadline order, waking early for a new, sooner key."""
+        import asyncio
+        import time
+
+        from src.api.services.expiry_reaper import ExpiryReaper
+
+        fired = []
+
+        async def on_expire(key):
+            fired.append(key)
+
+        reaper = ExpiryReaper(on_expire)
+        await reaper.start()
+        try:
+            reaper.schedule(time.time() + 60, "late")
+            await asyncio.sleep(0)
+            reaper.schedule(time.time() + 0.01, "soon")
+            await asyncio.sleep(0.1)
+        finally:
+            await reaper.stop()
+
+        assert fired == ["soon"]
+        assert reaper.is_running is False
@@ -0,0 +1,102 @@
+"""
+Error Handler Tests
+===================
+
+Tests for the app-wide exception handlers:
+- APIError renders its structured ErrorResponse
+- HTTPException and validation errors keep FastAPI's default shape
+- Unhandled exceptions get the fixed INTERNAL_ERROR body
+"""
+
+import json
+
+import pytest
+
+
+class TestErrorHandlers:
+    """Test the server's exception handlers."""
+
+    @pytest.mark.asyncio
+    async def test_api_error_renders_error_response(self):
+        """Should return the APIError's status and structured body."""
+        from src.api.schemas.common import APIError
+        from src.api.server import api_error_handler
+
+        exc = APIError(code="NOT_READY", message="Not ready", status_code=409)
+
+        response = await api_error_handler(None, exc)  # type: ignore[arg-type]
+
+        body = json.loads(response.body)
+        assert response.status_code == 409
+        assert response.media_type == "application/json"
+        assert body["error"]["code"] == "NOT_READY"
+        assert body == exc.to_response().model_dump(mode="json")
+
+    def test_simple_error_body_is_cached(self):
+        """Should reuse the body for repeat simple errors and match to_response()."""
+        from src.api.schemas.common import APIError
+
+        first = APIError(code="RATE_LIMITED", message="Slow down", retryable=True)
+        second = APIError(code="RATE_LIMITED", message="Slow down", retryable=True)
+
+        assert first.to_json() is second.to_json()
+        assert json.loads(first.to_json()) == first.to_response().model_dump(mode="json")
+
+    def test_detailed_error_not_cached(self):
+        """Should serialize errors with details fresh each time."""
+        from src.api.schemas.common import APIError
+
+        exc = APIError(code="INVOICE_ALREADY_PAID", message="Paid", details={"id": "inv_1"})
+
+        assert json.loads(exc.to_json())["error"]["details"] == {"id": "inv_1"}
+
+    def test_to_response_built_once(self):
+        """Should reuse the ErrorResponse across to_response() calls."""
+        from src.api.schemas.common import APIError
+
+        exc = APIError(code="NOT_READY", message="Not ready")
+
+        assert exc.to_response() is exc.to_response()
+        assert exc.actions == ()
+        assert exc.to_response().error.actions == []
+
+    @pytest.mark.asyncio
+    async def test_http_exception_keeps_detail_and_headers(self):
+        """Should render HTTPException detail and headers like FastAPI's default."""
+        from fastapi import HTTPException
+
+        from src.api.server import http_exception_handler
+
+        exc = HTTPException(
+            status_code=429, detail={"error": {"code": "ORG_BUSY"}}, headers={"Retry-After": "1"}
+        )
+        response = await http_exception_handler(None, exc)
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+        assert json.loads(response.body) == {"detail": {"error": {"code": "ORG_BUSY"}}}
+
+    @pytest.mark.asyncio
+    async def test_validation_error_is_422(self):
+        """Should render validation errors under detail with status 422."""
+        from fastapi.exceptions import RequestValidationError
+
+        from src.api.server import validation_exception_handler
+
+        exc = RequestValidationError([{"loc": ("body", "org_id"), "msg": "Field required"}])
+        response = await validation_exception_handler(None, exc)
+
+        assert response.status_code == 422
+        assert json.loads(response.body)["detail"][0]["loc"] == ["body", "org_id"]
+
+    @pytest.mark.asyncio
+    async def test_unhandled_exception_is_internal_error(self):
+        """Should return a 500 with the INTERNAL_ERROR body."""
+        from src.api.server import general_exception_handler
+
+        response = await general_exception_handler(None, RuntimeError("boom"))  # type: ignore[arg-type]
+
+        body = json.loads(response.body)
+        assert response.status_code == 500
+        assert body["error"]["code"] == "INTERNAL_ERROR"
+        assert body["error"]["retry"]["strategy"] == "exponential"
@@ -0,0 +1,116 @@
+"""
+Event Batcher Tests
+===================
+
+Tests for EventBatcher and EventBus.publish_batch:
+- A burst is published in batches of at most max_batch
+- Events keep their submission order
+- stop() flushes anything still queued
+"""
+
+import asyncio
+
+import pytest
+
+
+class TestPublishBatch:
+    """Test EventBus.publish_batch."""
+
+    @pytest.mark.asyncio
+    async def test_appends_in_order_and_wakes_waiters(self):
+        """Should append every event in order and wake each org's waiters."""
+        from src.api.services.event_bus import EventBus
+
+        bus = EventBus()
+        subscription = await bus.subscribe("org_1")
+        waiter = asyncio.create_task(bus.wait_for_events(subscription, timeout=1.0))
+        await asyncio.sleep(0)
+
+        await bus.publish_batch(
+            [
+                ("org_1", "task:created", {"n": 1}),
+                ("org_2", "task:created", {"n": 2}),
+                ("org_1", "task:created", {"n": 3}),
+            ]
+        )
+
+        events = await waiter
+        assert [e.data["n"] for e in events] == [1, 3]
+
+
+class TestEventBatcher:
+    """Test batching and shutdown flush."""
+
+    @pytest.mark.asyncio
+    async def test_burst_split_into_bounded_batches(self):
+        """Should publish a burst in batches no larger than max_batch."""
+        from src.api.services.event_batcher import EventBatcher
+        from src.api.services.event_bus import EventBus
+
+        bus = EventBus()
+        sizes: list[int] = []
+        publish_batch = bus.publish_batch
+
+        async def recording(events):
+            sizes.append(len(events))
+            await publish_batch(events)
+
+        bus.publish_batch = recording  # type: ignore[method-assign]
+        subscription = await bus.subscribe("org_1")
+        batcher = EventBatcher(bus, max_batch=4, max_wait=0.01)
+
+        for n in range(10):
+            batcher.submit("org_1", "task:created", {"n": n})
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+
+        assert sum(sizes) == 10
+        assert max(sizes) <= 4
+        assert [e.data["n"] for e in bus.read(subscription)] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_events(self):
+        """Should publish queued events on stop even if the worker never ran."""
+        from src.api.services.event_batcher import EventBatcher
+        from src.api.services.event_bus import EventBus
+
+        bus = EventBus()
+        subscription = await bus.subscribe("org_1")
+        batcher = EventBatcher(bus)
+
+        batcher.submit("org_1", "task:created", {"n": 1})
+        await batcher.stop()
+
+        assert [e.data["n"] for e in bus.read(subscription)] == [1]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_event(self):
+        """Should drop rather than block when the queue is full."""
+        from src.api.services.event_batcher import EventBatcher
+        from src.api.services.event_bus import EventBus
+
+        bus = EventBus()
+        subscription = await bus.subscribe("org_1")
+        batcher = EventBatcher(bus, max_queued=1)
+
+        batcher.submit("org_1", "task:created", {"n": 1})
+        batcher.submit("org_1", "task:created", {"n": 2})
+        await batcher.stop()
+
+        assert [e.data["n"] for e in bus.read(subscription)] == [1]
+
+    @pytest.mark.asyncio
+    async def test_per_org_pending_limit(self):
+        """Should cap pending events per org without affecting other orgs."""
+        from src.api.services.event_batcher import EventBatcher
+        from src.api.services.event_bus import EventBus
+
+        batcher = EventBatcher(EventBus(), max_pending_per_org=2)
+
+        accepted = [batcher.submit("org_1", "task:created", {"n": n}) for n in range(3)]
+
+        assert accepted == [True, True, False]
+        assert batcher.has_capacity("org_1") is False
+        assert batcher.has_capacity("org_2") is True
+        await batcher.stop()
+        assert batcher.has_capacity("org_1") is True
@@ -0,0 +1,213 @@
+"""
+Event Bus Tests
+================
+
+Tests for the shared-log event bus:
+- Fanout to multiple subscribers
+- Cursor reads and overflow
+- Keepalive timeout and replay
+- Type-filter signals freed with their subscriptions
+- Idle org logs dropped
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def bus():
+    """Fresh event bus."""
+    from src.api.services.event_bus import EventBus
+
+    return EventBus()
+
+
+class TestEventBus:
+    """Test publish/subscribe on the shared event log."""
+
+    @pytest.mark.asyncio
+    async def test_fanout_to_all_subscribers(self, bus):
+        """Should deliver each event once to every subscriber of the org."""
+        first = await bus.subscribe("org_1")
+        second = await bus.subscribe("org_1")
+        other_org = await bus.subscribe("org_2")
+
+        await bus.publish("org_1", "task:created", {"task_id": "t1"})
+        await bus.publish("org_1", "task:updated", {"task_id": "t1"})
+
+        assert [e.type for e in bus.read(first)] == ["task:created", "task:updated"]
+        assert [e.type for e in bus.read(second)] == ["task:created", "task:updated"]
+        assert bus.read(first) == []
+        assert bus.read(other_org) == []
+        assert bus.subscriber_count == 3
+
+    @pytest.mark.asyncio
+    async def test_publish_serializes_data_once(self, bus):
+        """Should store the JSON payload on the event for SSE frames to reuse."""
+        import json
+
+        subscription = await bus.subscribe("org_1")
+        await bus.publish("org_1", "task:created", {"task_id": "t1", "summary": "Pay"})
+
+        (event,) = bus.read(subscription)
+
+        assert json.loads(event.data_json) == event.data
+
+    @pytest.mark.asyncio
+    async def test_waiting_subscriber_wakes_on_publish(self, bus):
+        """Should wake a blocked wait_for_events when an event is published."""
+        subscription = await bus.subscribe("org_1")
+        waiter = asyncio.create_task(bus.wait_for_events(subscription, timeout=5))
+        await asyncio.sleep(0)
+
+        await bus.publish("org_1", "decision:made", {"decision_id": "d1"})
+        events = await asyncio.wait_for(waiter, timeout=1)
+
+        assert [e.data["decision_id"] for e in events] == ["d1"]
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_with_no_events(self, bus):
+        """Should return an empty list when nothing is published in time."""
+        subscription = await bus.subscribe("org_1")
+
+        assert await bus.wait_for_events(subscription, timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_skips_overflowed_events(self, bus, monkeypatch):
+        """Should flag dropped events and resume at the oldest retained one."""
+        from src.api.services import event_bus
+
+        monkeypatch.setattr(event_bus, "MAX_LOG_EVENTS", 3)
+        bus = event_bus.EventBus()
+        subscription = await bus.subscribe("org_1")
+        for i in range(5):
+            await bus.publish("org_1", "data:changed", {"n": i})
+
+        events = bus.read(subscription)
+
+        assert events[0].type == "events:dropped"
+        assert events[0].data == {"dropped": 2}
+        assert events[0].event_id is None
+        assert [e.data["n"] for e in events[1:]] == [2, 3, 4]
+        assert bus.dropped_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_events_since(self, bus):
+        """Should replay events after the given event ID."""
+        subscription = await bus.subscribe("org_1")
+        await bus.publish("org_1", "a", {})
+        await bus.publish("org_1", "b", {})
+        await bus.publish("org_1", "c", {})
+        first_id = bus.read(subscription)[0].event_id
+
+        replay = bus.get_events_since("org_1", first_id)
+
+        assert [e.type for e in replay] == ["b", "c"]
+        assert bus.get_events_since("org_1", "evt_bogus") == []
+
+    @pytest.mark.asyncio
+    async def test_event_ids_strictly_increase(self, bus, monkeypatch):
+        """Should keep IDs unique even when the clock doesn't advance."""
+        from src.api.services import event_bus
+
+        monkeypatch.setattr(event_bus.time, "time_ns", lambda: 1000)
+        subscription = await bus.subscribe("org_1")
+        for _ in range(3):
+            await bus.publish("org_1", "a", {})
+
+        ids = [e.event_id for e in bus.read(subscription)]
+
+        assert ids == ["evt_1000", "evt_1001", "evt_1002"]
+
+    @pytest.mark.asyncio
+    async def test_resume_rewinds_to_last_event_id(self, bus):
+        """Should redeliver events after last_event_id to a new subscription."""
+        first = await bus.subscribe("org_1")
+        await bus.publish("org_1", "a", {})
+        await bus.publish("org_1", "b", {})
+        seen_id = bus.read(first)[0].event_id
+
+        resumed = await bus.subscribe("org_1")
+
+        assert await bus.resume(resumed, seen_id) is True
+        assert [e.type for e in bus.read(resumed)] == ["b"]
+        assert await bus.resume(resumed, "evt_1") is False
+
+    @pytest.mark.asyncio
+    async def test_type_filter_delivers_only_matching_events(self, bus):
+        """Should deliver only the subscribed event types."""
+        subscription = await bus.subscribe("org_1", frozenset({"decision:made"}))
+
+        await bus.publish("org_1", "presence:update", {"users": []})
+        await bus.publish("org_1", "decision:made", {"decision_id": "d1"})
+
+        assert [e.type for e in bus.read(subscription)] == ["decision:made"]
+
+    @pytest.mark.asyncio
+    async def test_type_filter_ignores_other_wakeups(self, bus):
+        """Should stay asleep on events outside the subscription's types."""
+        subscription = await bus.subscribe("org_1", frozenset({"decision:made"}))
+        waiter = asyncio.create_task(bus.wait_for_events(subscription, timeout=5))
+        await asyncio.sleep(0)
+
+        await bus.publish("org_1", "presence:update", {"users": []})
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await bus.publish("org_1", "decision:made", {"decision_id": "d1"})
+        events = await asyncio.wait_for(waiter, timeout=1)
+
+        assert [e.type for e in events] == ["decision:made"]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_publish_keeps_latest_per_key(self, bus):
+        """Should publish one event per key per window with the latest data."""
+        subscription = await bus.subscribe("org_1")
+        for progress in (0.1, 0.2, 0.3):
+            bus.publish_coalesced("org_1", "task:updated", "t1", {"p": progress}, window=0.01)
+        bus.publish_coalesced("org_1", "task:updated", "t2", {"p": 1.0}, window=0.01)
+
+        assert bus.read(subscription) == []
+        await asyncio.sleep(0.05)
+
+        assert [e.data for e in bus.read(subscription)] == [{"p": 0.3}, {"p": 1.0}]
+
+    @pytest.mark.asyncio
+    async def test_type_filter_signals_freed_on_unsubscribe(self, bus):
+        """Should keep one signal per filter while subscribed and drop it after the last leaves."""
+        types = frozenset({"decision:made"})
+        first = await bus.subscribe("org_1", types)
+        second = await bus.subscribe("org_1", types)
+        log = bus._logs["org_1"]
+        for i in range(3):
+            other = await bus.subscribe("org_1", frozenset({f"custom:{i}"}))
+            await bus.wait_for_events(other, timeout=0)
+            bus.unsubscribe(other)
+
+        assert set(log.filtered_tips) == {types}
+
+        bus.unsubscribe(first)
+        assert set(log.filtered_tips) == {types}
+
+        bus.unsubscribe(second)
+        assert log.filtered_tips == {}
+        assert log.filter_refs == {}
+
+    @pytest.mark.asyncio
+    async def test_idle_org_logs_dropped(self, bus):
+        """Should drop logs of orgs without subscribers once they've been idle long enough."""
+        from src.api.services import event_bus
+
+        watched = await bus.subscribe("org_watched")
+        bus.unsubscribe(await bus.subscribe("org_left"))
+        recent = await bus.subscribe("org_recent")
+
+        # Age everything as if the idle period and a sweep interval had passed
+        bus._logs["org_left"].idle_since -= event_bus.ORG_LOG_IDLE_SECONDS
+        bus._last_sweep -= event_bus.ORG_LOG_SWEEP_SECONDS
+        bus.unsubscribe(recent)
+        await bus.subscribe("org_new")
+
+        assert set(bus._logs) == {"org_watched", "org_recent", "org_new"}
+        assert bus.read(watched) == []
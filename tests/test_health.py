@@ -0,0 +1,157 @@
+"""
+Health Route Tests
+===================
+
+Tests for /health service-check caching.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def db_calls():
+    """Records each database check."""
+    return []
+
+
+@pytest.fixture
+def health(monkeypatch, db_calls):
+    """Health module with an empty cache and a counting database check."""
+    from src.api.routes import health as module
+
+    async def fake_check_database():
+        db_calls.append(1)
+        await asyncio.sleep(0)
+        return "healthy"
+
+    monkeypatch.setattr(module, "_services_cache", None)
+    monkeypatch.setattr(module, "_refresh_task", None)
+    monkeypatch.setattr(module, "_check_database", fake_check_database)
+    monkeypatch.setattr(module, "_check_claude", lambda: "healthy")
+    return module
+
+
+class TestHealthCache:
+    """Test TTL caching of service checks."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_probes_checks_database_once(self, health, db_calls):
+        """Should collapse concurrent probes into a single database check."""
+        results = await asyncio.gather(*(health.health() for _ in range(5)))
+
+        assert len(db_calls) == 1
+        assert all(r.services["database"] == "healthy" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_rechecks_after_ttl(self, health, db_calls, monkeypatch):
+        """Should run the checks again once the cache has expired."""
+        clock = [100.0]
+        monkeypatch.setattr(health.time, "monotonic", lambda: clock[0])
+
+        await health.health()
+        await health.health()
+        clock[0] += health.HEALTH_CACHE_TTL_SECONDS
+
+        await health.health()
+        await health._refresh_task
+
+        assert len(db_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_result_while_refreshing(self, health, db_calls, monkeypatch):
+        """Should answer from the expired cache instead of waiting on the checks."""
+        clock = [100.0]
+        monkeypatch.setattr(health.time, "monotonic", lambda: clock[0])
+        await health.health()
+        clock[0] += health.HEALTH_CACHE_TTL_SECONDS
+
+        async def down():
+            db_calls.append(1)
+            return "unavailable"
+
+        monkeypatch.setattr(health, "_check_database", down)
+        stale = await health.health()
+        await health._refresh_task
+        fresh = await health.health()
+
+        assert stale.services["database"] == "healthy"
+        assert fresh.services["database"] == "unavailable"
+
+
+class TestHealthTimeouts:
+    """Test that hung checks and old results can't mask an outage."""
+
+    @pytest.mark.asyncio
+    async def test_hung_database_check_reports_unavailable(self, health, monkeypatch):
+        """Should time out a database check that never returns."""
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(health, "_check_database", hang)
+        monkeypatch.setattr(health, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.01)
+
+        result = await health.health()
+
+        assert result.services["database"] == "unavailable"
+        assert health._refresh_task.done()
+
+    @pytest.mark.asyncio
+    async def test_too_stale_result_waits_for_refresh(self, health, monkeypatch):
+        """Should not serve a cached result older than HEALTH_MAX_STALE_SECONDS."""
+        import time
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(health, "_check_database", hang)
+        monkeypatch.setattr(health, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.01)
+        services = {"database": "healthy", "baby_mars": "healthy", "claude": "healthy"}
+        services["erpnext"] = "unavailable"
+        expired_at = time.monotonic() - health.HEALTH_MAX_STALE_SECONDS
+        monkeypatch.setattr(health, "_services_cache", (expired_at, services))
+
+        result = await health.health()
+
+        assert result.services["database"] == "unavailable"
+
+
+class TestHealthRoute:
+    """Test /health route registration."""
+
+    def test_single_health_route(self):
+        """Should register exactly one /health route on the app."""
+        from src.api.server import app
+
+        paths = [getattr(route, "path", None) for route in app.routes]
+
+        assert paths.count("/health") == 1
+
+
+class TestDetermineCapabilities:
+    """Test the capability lookup table."""
+
+    def test_all_healthy(self):
+        """Should grant full capabilities when every service is healthy."""
+        from src.api.routes.health import _determine_capabilities
+
+        services = {"database": "healthy", "claude": "healthy", "erpnext": "healthy"}
+
+        assert set(_determine_capabilities(services).values()) == {"full"}
+
+    def test_degraded_services(self):
+        """Should fall back per service when dependencies are down."""
+        from src.api.routes.health import _determine_capabilities
+
+        services = {"database": "unavailable", "claude": "healthy", "erpnext": "unavailable"}
+
+        assert _determine_capabilities(services) == {
+            "view_tasks": "cached",
+            "view_beliefs": "cached",
+            "chat": "full",
+            "execute_decisions": "queued",
+            "view_widgets": "cached",
+            "drill_down": "unavailable",
+        }
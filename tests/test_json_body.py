@@ -0,0 +1,95 @@
+"""
+JSON Body Tests
+===============
+
+Tests for the json_body dependency:
+- 422 bodies match a plain FastAPI body parameter
+- Malformed bodies are not echoed back
+- The request body stays in the OpenAPI schema
+"""
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    """App with the same model taken as a plain body and through json_body."""
+    from typing import Annotated, Optional
+
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+    from pydantic import BaseModel
+
+    from src.api.json_body import json_body, json_body_openapi
+
+    class Item(BaseModel):
+        name: str
+        count: int = 1
+
+    class Order(BaseModel):
+        item: Item
+        note: Optional[str] = None
+
+    app = FastAPI()
+
+    @app.post("/plain")
+    async def plain(order: Order) -> dict[str, str]:
+        return {"name": order.item.name}
+
+    @app.post("/fast", openapi_extra=json_body_openapi(Order))
+    async def fast(order: Annotated[Order, Depends(json_body(Order))]) -> dict[str, str]:
+        return {"name": order.item.name}
+
+    return TestClient(app)
+
+
+BODIES = [
+    b'{"item": {"name": "a", "count": "many"}}',
+    b'{"note": 3}',
+    b'{"item": ',
+    b"not json",
+    b"",
+]
+
+
+class TestJsonBody:
+    """Test json_body against FastAPI's own body handling."""
+
+    @pytest.mark.parametrize("body", BODIES)
+    def test_errors_match_plain_body(self, client, body):
+        """Should return the same 422 as a plain body parameter."""
+        headers = {"Content-Type": "application/json"}
+
+        plain = client.post("/plain", content=body, headers=headers)
+        fast = client.post("/fast", content=body, headers=headers)
+
+        assert fast.status_code == plain.status_code == 422
+        assert fast.json() == plain.json()
+
+    def test_malformed_body_not_echoed(self, client):
+        """Should not send a large malformed body back as the error input."""
+        body = b'{"item": "' + b"x" * 100_000
+
+        response = client.post("/fast", content=body, headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 422
+        assert len(response.content) < 1000
+
+    def test_valid_body(self, client):
+        """Should pass the validated model to the route."""
+        response = client.post("/fast", json={"item": {"name": "a"}})
+
+        assert response.json() == {"name": "a"}
+
+    def test_openapi_documents_body(self, client):
+        """Should document the model as a required JSON request body without $defs."""
+        schema = client.app.openapi()
+        body = schema["paths"]["/fast"]["post"]["requestBody"]
+
+        assert body["required"] is True
+        order = body["content"]["application/json"]["schema"]
+        assert order["properties"]["item"]["properties"]["name"] == {
+            "title": "Name",
+            "type": "string",
+        }
+        assert "$defs" not in str(schema)
@@ -0,0 +1,203 @@
+"""
+Redis Event Bus Tests
+======================
+
+Tests for the Redis Streams event bus that don't need a Redis server:
+- Stream ID ordering
+- Local fanout of XREAD entries and resume by stream ID
+- Resume backfilling from the stream with XRANGE
+- Subscriptions starting from the stream position at subscribe()
+"""
+
+import pytest
+
+from src.api.services.redis_event_bus import parse_stream_id
+
+
+class FakeRedis:
+    """Just enough of a Redis client to serve one in-memory stream."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    def _after(self, stream_id):
+        after = parse_stream_id(stream_id)
+        return [e for e in self.entries if parse_stream_id(e[0]) > after]
+
+    async def xrange(self, key, min, max, count):
+        self.calls.append((key, min, max))
+        return self._after(min.lstrip("("))[:count]
+
+    async def xrevrange(self, key, count):
+        return self.entries[::-1][:count]
+
+    async def xadd(self, key, fields, maxlen, approximate):
+        last_ms = parse_stream_id(self.entries[-1][0]) >> 32 if self.entries else 0
+        self.entries.append((f"{last_ms + 1}-0", fields))
+
+    async def xread(self, streams, count, block):
+        return [(key, self._after(last_id)[:count]) for key, last_id in streams.items()]
+
+
+def _entry(stream_id, event_type):
+    return (stream_id, {"type": event_type, "data": "{}"})
+
+
+class TestParseStreamId:
+    """Test mapping Redis stream IDs to sortable ints."""
+
+    def test_preserves_order(self):
+        """Should order by milliseconds, then by sequence within a millisecond."""
+        from src.api.services.redis_event_bus import parse_stream_id
+
+        ids = ["1700000000000-0", "1700000000000-7", "1700000000001-0"]
+
+        assert sorted(ids, key=parse_stream_id) == ids
+
+    def test_rejects_non_stream_ids(self):
+        """Should return None for IDs that aren't stream IDs."""
+        from src.api.services.redis_event_bus import parse_stream_id
+
+        assert parse_stream_id("evt_123") is None
+        assert parse_stream_id("abc-def") is None
+
+
+class TestDeliverEntries:
+    """Test fanout of entries read from Redis."""
+
+    @pytest.mark.asyncio
+    async def test_fans_out_to_local_subscribers(self):
+        """Should deliver stream entries to every local subscriber of the org."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = FakeRedis([])
+        first = await bus.subscribe("org_1")
+        second = await bus.subscribe("org_1", frozenset({"decision:made"}))
+
+        bus.deliver_entries(
+            "org_1",
+            [
+                ("1700000000000-0", {"type": "task:created", "data": '{"task_id":"t1"}'}),
+                ("1700000000000-1", {"type": "decision:made", "data": '{"decision_id":"d1"}'}),
+            ],
+        )
+
+        assert [e.event_id for e in bus.read(first)] == ["1700000000000-0", "1700000000000-1"]
+        assert [e.data for e in bus.read(second)] == [{"decision_id": "d1"}]
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_stream_id(self):
+        """Should resume a subscription after a stream ID it has seen."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = FakeRedis([])
+        await bus.subscribe("org_1")
+        bus.deliver_entries(
+            "org_1",
+            [
+                ("1700000000000-0", {"type": "a", "data": "{}"}),
+                ("1700000000001-0", {"type": "b", "data": "{}"}),
+            ],
+        )
+        resumed = await bus.subscribe("org_1")
+
+        assert await bus.resume(resumed, "1700000000000-0") is True
+        assert [e.type for e in bus.read(resumed)] == ["b"]
+
+
+class TestResumeFromStream:
+    """Test resuming from stream IDs the local log doesn't hold."""
+
+    @pytest.mark.asyncio
+    async def test_backfills_empty_log(self):
+        """Should XRANGE entries after last_event_id and replay them."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = FakeRedis([_entry("1-0", "a"), _entry("2-0", "b"), _entry("3-0", "c")])
+        subscription = await bus.subscribe("org_1")
+
+        assert await bus.resume(subscription, "1-0") is True
+        assert [e.type for e in bus.read(subscription)] == ["b", "c"]
+        assert bus._redis.calls == [("stream:org_1", "(1-0", "+")]
+        assert bus._stream_ids["org_1"] == "3-0"
+
+    @pytest.mark.asyncio
+    async def test_prepends_entries_older_than_log(self):
+        """Should fill the gap before the local log without disturbing live cursors."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = FakeRedis(
+            [_entry("1-0", "a"), _entry("2-0", "b"), _entry("3-0", "c"), _entry("4-0", "d")]
+        )
+        live = await bus.subscribe("org_1")
+        bus.deliver_entries("org_1", [_entry("3-0", "c")])
+        resumed = await bus.subscribe("org_1")
+
+        assert await bus.resume(resumed, "1-0") is True
+        assert [e.type for e in bus.read(resumed)] == ["b", "c", "d"]
+        assert [e.type for e in bus.read(live)] == ["c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_overlapping_xread_not_redelivered(self):
+        """Should skip entries from an in-flight XREAD that the backfill already delivered."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = FakeRedis([_entry("1-0", "a"), _entry("2-0", "b"), _entry("3-0", "c")])
+        live = await bus.subscribe("org_1")
+        bus.deliver_entries("org_1", [_entry("1-0", "a")])
+        resumed = await bus.subscribe("org_1")
+        await bus.resume(resumed, "0-1")
+
+        # The consumer's XREAD was issued from 1-0 before the backfill ran
+        bus.deliver_entries("org_1", [_entry("2-0", "b"), _entry("3-0", "c"), _entry("4-0", "d")])
+
+        assert [e.type for e in bus.read(resumed)] == ["a", "b", "c", "d"]
+        assert [e.type for e in bus.read(live)] == ["a", "b", "c", "d"]
+        seqs = [e.seq for e in bus._logs["org_1"].events]
+        assert seqs == sorted(seqs)
+
+    @pytest.mark.asyncio
+    async def test_unreachable_stream_leaves_cursor(self):
+        """Should report that it couldn't resume when Redis fails."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        class BrokenRedis:
+            async def xrange(self, *args, **kwargs):
+                raise ConnectionError("down")
+
+            xrevrange = xrange
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = BrokenRedis()
+        subscription = await bus.subscribe("org_1")
+
+        assert await bus.resume(subscription, "1-0") is False
+        assert subscription.cursor == 0
+
+
+class TestSubscribeStartPosition:
+    """Test where a new org's stream reading starts."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_events_published_before_first_xread(self):
+        """Should deliver events published after subscribe() but before the consumer syncs."""
+        from src.api.services.redis_event_bus import RedisEventBus
+
+        bus = RedisEventBus("redis://unused")
+        bus._redis = FakeRedis([_entry("1-0", "old")])
+        subscription = await bus.subscribe("org_1")
+
+        # Published while the consumer was still blocked on its previous XREAD
+        await bus.publish("org_1", "new", {})
+        streams = await bus._sync_streams(bus._redis)
+        for key, entries in await bus._redis.xread(streams, count=100, block=1000):
+            bus.deliver_entries(key.removeprefix("stream:"), entries)
+
+        assert streams == {"stream:org_1": "1-0"}
+        assert [e.type for e in bus.read(subscription)] == ["new"]
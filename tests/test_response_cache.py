@@ -0,0 +1,122 @@
+"""
+Response Cache Tests
+=====================
+
+Tests for the chat response fingerprint cache:
+- TTL expiry and size bound
+- Replay of retried send_message turns (by client_message_id only)
+"""
+
+import pytest
+
+
+class TestResponseCache:
+    """Test ResponseCache TTL and eviction."""
+
+    def test_get_returns_value_until_expired(self, monkeypatch):
+        """Should return cached values only within the TTL."""
+        from src.api.services import response_cache
+
+        clock = [1000.0]
+        monkeypatch.setattr(response_cache.time, "monotonic", lambda: clock[0])
+        cache = response_cache.ResponseCache(ttl_seconds=10)
+        key = response_cache.fingerprint("session", "thread", "hello")
+
+        cache.put(key, "response")
+        assert cache.get(key) == "response"
+
+        clock[0] += 11
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        """Should drop the oldest entry once max_entries is exceeded."""
+        from src.api.services.response_cache import ResponseCache, fingerprint
+
+        cache = ResponseCache(max_entries=2)
+        for text in ("a", "b", "c"):
+            cache.put(fingerprint(text), text)
+
+        assert cache.get(fingerprint("a")) is None
+        assert cache.get(fingerprint("c")) == "c"
+
+
+@pytest.fixture
+def chat_turns(monkeypatch):
+    """send_message wired to a counting fake cognitive loop and one session."""
+    from types import SimpleNamespace
+
+    from src.api.routes import chat
+    from src.api.schemas.chat import MessageRequest
+
+    calls = []
+
+    async def fake_invoke(state, graph, config):
+        calls.append(state)
+        return {
+            "thread_id": "thread_1",
+            "final_response": f"Done {len(calls)}",
+            "supervision_mode": "autonomous",
+            "belief_strength_for_action": 0.9,
+        }
+
+    monkeypatch.setattr(chat, "invoke_cognitive_loop", fake_invoke)
+    chat._response_cache.clear()
+    session = {"state": None, "thread_id": None, "message_count": 0, "birth_result": None}
+    app = SimpleNamespace(state=SimpleNamespace(graph=None, sessions={"s1": session}))
+    request = SimpleNamespace(app=app)
+
+    async def send(**extra):
+        body = {"session_id": "s1", "message": "yes", "thread_id": "thread_1", **extra}
+        return await chat.send_message(MessageRequest(**body), request)
+
+    return send, calls, session
+
+
+class TestSendMessageReplay:
+    """Test that send_message replays retried turns only."""
+
+    @pytest.mark.asyncio
+    async def test_retry_with_same_client_message_id_skips_loop(self, chat_turns):
+        """Should invoke the cognitive loop once for a retried client_message_id."""
+        send, calls, _ = chat_turns
+
+        first = await send(client_message_id="m1")
+        second = await send(client_message_id="m1")
+
+        assert len(calls) == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_identical_messages_without_id_both_run(self, chat_turns):
+        """Should run every turn when the client sends no client_message_id."""
+        send, calls, _ = chat_turns
+
+        first = await send()
+        second = await send()
+
+        assert len(calls) == 2
+        assert first.response == "Done 1"
+        assert second.response == "Done 2"
+
+    @pytest.mark.asyncio
+    async def test_new_client_message_id_runs_again(self, chat_turns):
+        """Should treat the same text under a new client_message_id as a new turn."""
+        send, calls, _ = chat_turns
+
+        await send(client_message_id="m1")
+        await send(client_message_id="m2")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_pending_message(self, chat_turns):
+        """Should leave a queued pending_message for the next real turn."""
+        send, calls, session = chat_turns
+
+        await send(client_message_id="m1")
+        session["pending_message"] = "queued"
+        await send(client_message_id="m1")
+
+        assert session["pending_message"] == "queued"
+        assert len(calls) == 1
@@ -0,0 +1,78 @@
+"""
+Session Store Tests
+====================
+
+Tests for the in-memory session store:
+- Idle TTL expiry, refreshed on access
+- LRU eviction when full
+- Expiry and eviction counters
+"""
+
+import pytest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the session store."""
+    from src.api.services import session_store
+
+    now = [1000.0]
+    monkeypatch.setattr(session_store.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestSessionStore:
+    """Test TTL and LRU behavior."""
+
+    def test_expires_idle_sessions(self, clock):
+        """Should drop a session once it has been idle past the TTL."""
+        from src.api.services.session_store import SessionStore
+
+        store = SessionStore(ttl_seconds=60)
+        store["s1"] = {"message_count": 0}
+
+        clock[0] += 59
+        assert store.get("s1") == {"message_count": 0}
+        clock[0] += 59
+        assert store.get("s1") is not None  # Access above refreshed the TTL
+        clock[0] += 61
+        assert store.get("s1") is None
+        assert len(store) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        """Should evict the least recently used session when full."""
+        from src.api.services.session_store import SessionStore
+
+        store = SessionStore(max_entries=2)
+        store["s1"] = {}
+        store["s2"] = {}
+        store.get("s1")
+        store["s3"] = {}
+
+        assert "s1" in store
+        assert "s2" not in store
+        assert "s3" in store
+
+    def test_counts_expired_and_evicted(self, clock):
+        """Should count TTL expiries and LRU evictions separately."""
+        from src.api.services.session_store import SessionStore
+
+        store = SessionStore(ttl_seconds=60, max_entries=2)
+        store["s1"] = {}
+        store["s2"] = {}
+        store["s3"] = {}
+        clock[0] += 61
+        store.get("s3")
+
+        assert store.evicted_count == 1
+        assert store.expired_count == 2
+
+    def test_pop(self, clock):
+        """Should remove and return a session, or the default if missing."""
+        from src.api.services.session_store import SessionStore
+
+        store = SessionStore()
+        store["s1"] = {"message_count": 3}
+
+        assert store.pop("s1") == {"message_count": 3}
+        assert store.pop("s1", None) is None
@@ -0,0 +1,120 @@
+"""
+Tasks Route Tests
+==================
+
+Tests for the in-memory task store including:
+- Listing order and pagination
+- Status/source filters kept in sync with status changes
+"""
+
+import pytest
+
+
+@pytest.fixture
+def tasks():
+    """Tasks module with empty stores."""
+    from src.api.routes import tasks as module
+
+    module._tasks.clear()
+    module._task_index.clear()
+    yield module
+    module._tasks.clear()
+    module._task_index.clear()
+
+
+async def _list(tasks, status=None, source=None, limit=20, offset=0):
+    return await tasks.list_tasks(status=status, source=source, limit=limit, offset=offset)
+
+
+class TestListTasks:
+    """Test list_tasks ordering, filters, and paging."""
+
+    @pytest.mark.asyncio
+    async def test_orders_by_priority_then_newest(self, tasks, monkeypatch):
+        """Should list higher priority first, newer first within a priority."""
+        stamps = iter(f"2026-01-01T00:00:0{i}" for i in range(4))
+        monkeypatch.setattr(tasks, "now_iso", lambda: next(stamps))
+        low = tasks.create_task("recon", "Low", priority=0.2)
+        high = tasks.create_task("recon", "High", priority=0.9)
+        mid_old = tasks.create_task("recon", "Mid old", priority=0.5)
+        mid_new = tasks.create_task("recon", "Mid new", priority=0.5)
+
+        result = await _list(tasks)
+
+        assert [t.task_id for t in result.tasks] == [high, mid_new, mid_old, low]
+        assert result.total == 4
+
+    @pytest.mark.asyncio
+    async def test_paginates(self, tasks):
+        """Should return offset/limit slices with has_more."""
+        for i in range(5):
+            tasks.create_task("recon", f"Task {i}", priority=i / 10)
+
+        first = await _list(tasks, limit=2)
+        last = await _list(tasks, limit=2, offset=4)
+
+        assert [t.summary for t in first.tasks] == ["Task 4", "Task 3"]
+        assert first.has_more is True
+        assert [t.summary for t in last.tasks] == ["Task 0"]
+        assert last.has_more is False
+        assert last.total == 5
+
+    @pytest.mark.asyncio
+    async def test_filters_follow_status_changes(self, tasks):
+        """Should filter by status and source after tasks change status."""
+        user_task = tasks.create_task("recon", "User", source="user")
+        system_task = tasks.create_task("recon", "System", source="system")
+        tasks.update_task_status(user_task, "running")
+        await tasks.pause_task(system_task)
+
+        running = await _list(tasks, status="running")
+        paused_or_running = await _list(tasks, status="paused,running")
+        system_pending = await _list(tasks, status="pending", source="system")
+
+        assert [t.task_id for t in running.tasks] == [user_task]
+        assert {t.task_id for t in paused_or_running.tasks} == {user_task, system_task}
+        assert system_pending.total == 0
+
+        await tasks.resume_task(system_task)
+        system_pending = await _list(tasks, status="pending", source="system")
+        assert [t.task_id for t in system_pending.tasks] == [system_task]
+
+    @pytest.mark.asyncio
+    async def test_reuses_summary_until_task_changes(self, tasks):
+        """Should return the cached TaskSummary until the task is updated."""
+        task_id = tasks.create_task("recon", "Match deposits")
+
+        first = (await _list(tasks)).tasks[0]
+        second = (await _list(tasks)).tasks[0]
+        tasks.update_task_status(task_id, "running", progress=0.5)
+        updated = (await _list(tasks)).tasks[0]
+
+        assert second is first
+        assert updated is not first
+        assert (updated.status, updated.progress) == ("running", 0.5)
+
+    @pytest.mark.asyncio
+    async def test_ties_keep_creation_and_id_order(self, tasks, monkeypatch):
+        """Should break priority and created_at ties by task_id, newest first."""
+        monkeypatch.setattr(tasks, "now_iso", lambda: "2026-01-01T00:00:00")
+        ids = [tasks.create_task("recon", f"Task {i}", priority=0.5) for i in range(4)]
+
+        result = await _list(tasks)
+
+        assert [t.task_id for t in result.tasks] == sorted(ids, reverse=True)
+
+
+class TestTaskTimeline:
+    """Test the timeline polling endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_returns_entries_in_order(self, tasks):
+        """Should return every timeline entry with its fields."""
+        task_id = tasks.create_task("recon", "Timeline", priority=0.5)
+        await tasks.pause_task(task_id)
+
+        timeline = await tasks.get_task_timeline(task_id)
+
+        events = [e.event for e in timeline.timeline]
+        assert events == ["Task created", "Task paused"]
+        assert timeline.model_dump()["timeline"][1]["details"] is None
@@ -0,0 +1,175 @@
+"""
+Trigger Cache Tests
+====================
+
+Tests for the per-org load_org_triggers cache:
+- Repeated loads hit the database once
+- Writes invalidate only the touched org
+"""
+
+import pytest
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Trigger cache backed by a counting fake loader."""
+    from src.scheduler import persistence, persistence_cache
+
+    calls: list[str] = []
+
+    async def fake_load(org_id, **filters):
+        calls.append(org_id)
+        return [{"trigger_id": f"{org_id}_t{len(calls)}", "org_id": org_id}]
+
+    monkeypatch.setattr(persistence, "load_org_triggers", fake_load)
+    persistence_cache.clear_trigger_cache()
+    yield persistence_cache, calls
+    persistence_cache.clear_trigger_cache()
+
+
+class TestTriggerCache:
+    """Test caching and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_loaded_triggers(self, cache):
+        """Should load an org once and return a fresh list each call."""
+        persistence_cache, calls = cache
+
+        first = await persistence_cache.cached_load_org_triggers("org_1")
+        second = await persistence_cache.cached_load_org_triggers("org_1")
+
+        assert calls == ["org_1"]
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_invalidates_only_touched_org(self, cache):
+        """Should reload an invalidated org and keep others cached."""
+        persistence_cache, calls = cache
+        await persistence_cache.cached_load_org_triggers("org_1")
+        await persistence_cache.cached_load_org_triggers("org_2")
+
+        persistence_cache.invalidate_org_triggers("org_1")
+        await persistence_cache.cached_load_org_triggers("org_1")
+        await persistence_cache.cached_load_org_triggers("org_2")
+
+        assert calls == ["org_1", "org_2", "org_1"]
+
+    @pytest.mark.asyncio
+    async def test_expires_after_ttl(self, cache, monkeypatch):
+        """Should reload once the TTL has passed."""
+        persistence_cache, calls = cache
+        now = [1000.0]
+        monkeypatch.setattr(persistence_cache.time, "monotonic", lambda: now[0])
+
+        await persistence_cache.cached_load_org_triggers("org_1")
+        now[0] += persistence_cache.ORG_TRIGGERS_TTL_SECONDS + 1
+        await persistence_cache.cached_load_org_triggers("org_1")
+
+        assert calls == ["org_1", "org_1"]
+
+    @pytest.mark.asyncio
+    async def test_caches_each_filter_combination(self, cache):
+        """Should cache filtered loads separately and invalidate them with the org."""
+        persistence_cache, calls = cache
+        await persistence_cache.cached_load_org_triggers("org_1")
+        await persistence_cache.cached_load_org_triggers("org_1", enabled=True)
+        await persistence_cache.cached_load_org_triggers("org_1", enabled=True)
+
+        persistence_cache.invalidate_org_triggers("org_1")
+        await persistence_cache.cached_load_org_triggers("org_1", enabled=True)
+
+        assert calls == ["org_1", "org_1", "org_1"]
+
+    @pytest.mark.asyncio
+    async def test_caches_active_count(self, cache, monkeypatch):
+        """Should count once per org until a write invalidates it."""
+        from src.scheduler import persistence
+
+        persistence_cache, _ = cache
+        counts: list[str] = []
+
+        async def fake_count(org_id):
+            counts.append(org_id)
+            return 3
+
+        monkeypatch.setattr(persistence, "count_active_triggers", fake_count)
+
+        assert await persistence_cache.cached_count_active_triggers("org_1") == 3
+        assert await persistence_cache.cached_count_active_triggers("org_1") == 3
+        persistence_cache.invalidate_org_triggers("org_1")
+        await persistence_cache.cached_count_active_triggers("org_1")
+
+        assert counts == ["org_1", "org_1"]
+
+    @pytest.mark.asyncio
+    async def test_active_count_from_cached_enabled_listing(self, cache, monkeypatch):
+        """Should answer from a cached enabled-only listing without counting."""
+        from src.scheduler import persistence
+
+        persistence_cache, _ = cache
+
+        async def fail_count(org_id):
+            raise AssertionError("should not query")
+
+        monkeypatch.setattr(persistence, "count_active_triggers", fail_count)
+        await persistence_cache.cached_load_org_triggers("org_1", enabled=True)
+
+        assert await persistence_cache.cached_count_active_triggers("org_1") == 1
+
+
+class TestListTriggersRoute:
+    """Test the list endpoint built on the cache."""
+
+    def test_lists_cached_triggers(self, monkeypatch):
+        """Should serialize constructed (unvalidated) trigger responses."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.api.auth import get_current_org
+        from src.api.routes import triggers
+
+        row = {
+            "trigger_id": "t1",
+            "org_id": "org_1",
+            "user_id": None,
+            "trigger_type": "time",
+            "action": "morning_check",
+            "config": {"hour": 9},
+            "action_context": {},
+            "description": "",
+            "enabled": True,
+            "last_fired": None,
+            "next_fire": None,
+            "fire_count": 0,
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "updated_at": "2024-01-01T00:00:00+00:00",
+            "created_by": "system",
+        }
+
+        async def fake_cached(org_id, **filters):
+            return [dict(row)]
+
+        monkeypatch.setattr(triggers, "cached_load_org_triggers", fake_cached)
+        app = FastAPI()
+        app.include_router(triggers.router, prefix="/triggers")
+        app.dependency_overrides[get_current_org] = lambda: "org_1"
+
+        response = TestClient(app).get("/triggers")
+
+        assert response.status_code == 200
+        assert response.json() == {"triggers": [row], "total": 1}
+
+
+class TestParseJsonField:
+    """Test JSONB column parsing for trigger rows."""
+
+    def test_parses_text_and_passes_dicts(self):
+        """Should parse JSON text, pass dicts through, and fall back to {}."""
+        from src.scheduler.persistence import _parse_json_field
+
+        assert _parse_json_field('{"hour": 9}') == {"hour": 9}
+        assert _parse_json_field({"hour": 9}) == {"hour": 9}
+        assert _parse_json_field("[1, 2]") == {}
+        assert _parse_json_field("{bad") == {}
+        assert _parse_json_field(None) == {}
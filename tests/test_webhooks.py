@@ -0,0 +1,380 @@
+"""
+Webhook Route Tests
+====================
+
+Tests for webhook task creation:
+- The response carries the new task_id
+- task:created is queued and published by the event batcher
+"""
+
+import pytest
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """Webhook routes with a fresh event bus and batcher."""
+    from fastapi import FastAPI
+
+    from src.api.routes import events, tasks, webhooks
+    from src.api.services.event_batcher import EventBatcher
+    from src.api.services.event_bus import EventBus
+
+    bus = EventBus()
+    batcher = EventBatcher(bus, max_wait=0.001)
+    monkeypatch.setattr(events, "_event_bus", bus)
+    monkeypatch.setattr(events, "event_batcher", batcher)
+    app = FastAPI()
+    app.include_router(webhooks.router, prefix="/webhooks")
+    yield app, bus, batcher
+    tasks._tasks.clear()
+    tasks._task_index.clear()
+
+
+class TestGenericWebhook:
+    """Test the generic webhook end to end."""
+
+    @pytest.mark.asyncio
+    async def test_creates_task_and_publishes_batched_event(self, app):
+        """Should return the task_id and publish task:created via the batcher."""
+        import httpx
+
+        asgi_app, bus, batcher = app
+        subscription = await bus.subscribe("org_1")
+
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            response = await http.post(
+                "/webhooks/generic",
+                json={"org_id": "org_1", "event_type": "invoice_received", "payload": {}},
+            )
+        await batcher.stop()
+
+        body = response.json()
+        (event,) = bus.read(subscription)
+        assert response.status_code == 200
+        assert body["accepted"] is True
+        assert event.type == "task:created"
+        assert event.data["task_id"] == body["task_id"]
+        assert event.data["type"] == "invoice_processing"
+
+    @pytest.mark.asyncio
+    async def test_rejects_org_over_pending_limit(self, app, monkeypatch):
+        """Should return 429 without creating a task when the org is at its limit."""
+        import httpx
+
+        from src.api.routes import events, tasks
+        from src.api.services.event_batcher import EventBatcher
+
+        asgi_app, bus, _ = app
+        monkeypatch.setattr(events, "event_batcher", EventBatcher(bus, max_pending_per_org=0))
+
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            response = await http.post(
+                "/webhooks/generic",
+                json={"org_id": "org_1", "event_type": "invoice_received", "payload": {}},
+            )
+
+        assert response.status_code == 429
+        assert response.json()["detail"]["error"]["code"] == "ORG_BUSY"
+        assert not tasks._tasks
+
+
+class TestEmailWebhookPayload:
+    """Test the email payload schema."""
+
+    def test_accepts_aliases_and_field_names(self):
+        """Should populate from both the from/to aliases and the field names."""
+        from src.api.schemas.webhooks import EmailWebhookPayload
+
+        common = {"subject": "s", "message_id": "m", "timestamp": "2024-01-01T00:00:00"}
+        by_alias = EmailWebhookPayload.model_validate({"from": "a@x", "to": "b@x", **common})
+        by_name = EmailWebhookPayload.model_validate(
+            {"from_address": "a@x", "to_address": "b@x", **common}
+        )
+
+        assert by_alias.from_address == by_name.from_address == "a@x"
+        assert by_alias.to_address == by_name.to_address == "b@x"
+
+    def test_ignores_raw_provider_payload(self):
+        """Should validate without keeping the provider's raw body."""
+        from src.api.schemas.webhooks import EmailWebhookPayload
+
+        payload = EmailWebhookPayload.model_validate_json(
+            b'{"from": "a@x", "to": "b@x", "subject": "s", "message_id": "m",'
+            b' "timestamp": "2024-01-01T00:00:00", "raw_payload": {"big": [1, 2, 3]}}'
+        )
+
+        assert payload.subject == "s"
+        assert "raw_payload" not in payload.model_dump()
+
+    def test_attachment_keeps_metadata_only(self):
+        """Should keep attachment metadata and drop inline content."""
+        from src.api.schemas.webhooks import EmailAttachment
+
+        attachment = EmailAttachment.model_validate(
+            {
+                "filename": "remit.pdf",
+                "content_type": "application/pdf",
+                "size_bytes": 20_000_000,
+                "storage_key": "raw/msg-1/remit.pdf",
+                "content_base64": "JVBERi0xLjQK",
+            }
+        )
+
+        assert attachment.storage_key == "raw/msg-1/remit.pdf"
+        assert "content_base64" not in attachment.model_dump()
+
+
+class TestExtractOrgIdFromEmail:
+    """Test org_id parsing from the inbound address."""
+
+    def test_plus_address_and_default(self):
+        """Should take the org from a +suffix and fall back to default."""
+        from src.api.routes.webhooks import _extract_org_id_from_email
+
+        assert _extract_org_id_from_email("lockbox+org123@aleq.ai") == "org123"
+        assert _extract_org_id_from_email("lockbox+org123@aleq.ai") == "org123"
+        assert _extract_org_id_from_email("lockbox@aleq.ai") == "default"
+
+
+class TestSignatureVerification:
+    """Test HMAC verification on the email and Slack webhooks."""
+
+    @pytest.fixture
+    def http(self, app):
+        from fastapi.testclient import TestClient
+
+        return TestClient(app[0])
+
+    def test_email_rejects_bad_signature_before_validation(self, http, monkeypatch):
+        """Should return 401 (not 422) for an invalid signature on an invalid body."""
+        monkeypatch.setenv("WEBHOOK_SIGNING_SECRET", "s3cret")
+
+        response = http.post(
+            "/webhooks/email", content=b"{}", headers={"X-Webhook-Signature": "deadbeef"}
+        )
+
+        assert response.status_code == 401
+        assert response.json()["detail"]["error"]["code"] == "INVALID_SIGNATURE"
+
+    def test_email_accepts_valid_signature(self, http, monkeypatch):
+        """Should accept a body signed with the shared secret."""
+        import hashlib
+        import hmac
+
+        monkeypatch.setenv("WEBHOOK_SIGNING_SECRET", "s3cret")
+        body = (
+            b'{"from": "a@x", "to": "lockbox@aleq.ai", "subject": "s",'
+            b' "message_id": "m", "timestamp": "2024-01-01T00:00:00"}'
+        )
+        signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+
+        response = http.post(
+            "/webhooks/email",
+            content=body,
+            headers={"X-Webhook-Signature": f"sha256={signature}"},
+        )
+
+        assert response.status_code == 200
+
+    def test_slack_rejects_stale_timestamp(self, http, monkeypatch):
+        """Should reject a correctly signed but replayed (old) request."""
+        import hashlib
+        import hmac
+
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "s3cret")
+        body = b'{"type": "url_verification", "challenge": "c"}'
+        timestamp = "1000"
+        base = b"v0:" + timestamp.encode() + b":" + body
+        signature = "v0=" + hmac.new(b"s3cret", base, hashlib.sha256).hexdigest()
+        headers = {"X-Slack-Signature": signature, "X-Slack-Request-Timestamp": timestamp}
+
+        response = http.post("/webhooks/slack", content=body, headers=headers)
+
+        assert response.status_code == 401
+
+    def test_slack_accepts_valid_signature(self, http, monkeypatch):
+        """Should accept a fresh request signed per Slack's v0 scheme."""
+        import hashlib
+        import hmac
+        import time
+
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "s3cret")
+        body = b'{"type": "url_verification", "challenge": "c"}'
+        timestamp = str(int(time.time()))
+        base = b"v0:" + timestamp.encode() + b":" + body
+        signature = "v0=" + hmac.new(b"s3cret", base, hashlib.sha256).hexdigest()
+        headers = {"X-Slack-Signature": signature, "X-Slack-Request-Timestamp": timestamp}
+
+        response = http.post("/webhooks/slack", content=body, headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["challenge"] == "c"
+
+
+class TestORJSONRouting:
+    """Test orjson parsing and rendering on the webhook router."""
+
+    def test_malformed_json_is_422(self, app):
+        """Should keep FastAPI's 422 for bodies orjson can't decode."""
+        from fastapi.testclient import TestClient
+
+        response = TestClient(app[0]).post(
+            "/webhooks/generic",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+
+    def test_invalid_body_reports_body_location(self, app):
+        """Should return FastAPI-style 422 errors located under body."""
+        from fastapi.testclient import TestClient
+
+        response = TestClient(app[0]).post("/webhooks/generic", json={"event_type": "x"})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "org_id"]
+
+    def test_health_rendered_with_orjson(self, app):
+        """Should render responses as compact orjson output."""
+        from fastapi.testclient import TestClient
+
+        response = TestClient(app[0]).get("/webhooks/health")
+
+        assert response.content == b'{"status":"healthy","endpoints":["email","slack","generic"]}'
+
+
+class TestSlackWebhook:
+    """Test Slack URL verification and command handling."""
+
+    def test_url_verification_returns_challenge(self, app):
+        """Should echo the challenge without creating a task."""
+        from fastapi.testclient import TestClient
+
+        from src.api.routes import tasks
+
+        response = TestClient(app[0]).post(
+            "/webhooks/slack", json={"type": "url_verification", "challenge": "abc"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["challenge"] == "abc"
+        assert not tasks._tasks
+
+    def test_invalid_command_payload_is_422(self, app):
+        """Should still reject payloads that fail full validation."""
+        from fastapi.testclient import TestClient
+
+        response = TestClient(app[0]).post("/webhooks/slack", json={"type": "bogus"})
+
+        assert response.status_code == 422
+
+    def test_slash_command_creates_task(self, app):
+        """Should validate the payload and create a Slack task."""
+        from fastapi.testclient import TestClient
+
+        response = TestClient(app[0]).post(
+            "/webhooks/slack",
+            json={"type": "slash_command", "command": "/aleq", "text": "hi", "team_id": "T1"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["task_id"]
+
+
+class TestSlackWebhookBatch:
+    """Test the batched Slack endpoint."""
+
+    def test_batch_creates_one_task_per_command(self, app):
+        """Should answer each event in order and skip tasks for url_verification."""
+        from fastapi.testclient import TestClient
+
+        from src.api.routes import tasks
+
+        events = [
+            {"type": "slash_command", "command": "/aleq", "text": "one", "team_id": "T1"},
+            {"type": "url_verification", "challenge": "abc"},
+            {"type": "app_mention", "event": {"text": "two"}, "team_id": "T2"},
+        ]
+        response = TestClient(app[0]).post("/webhooks/slack/batch", json={"events": events})
+
+        results = response.json()["results"]
+        assert response.status_code == 200
+        assert results[1]["challenge"] == "abc"
+        assert {results[0]["task_id"], results[2]["task_id"]} == set(tasks._tasks)
+
+    def test_invalid_event_rejects_whole_batch(self, app):
+        """Should 422 with the event index in loc and create no tasks."""
+        from fastapi.testclient import TestClient
+
+        from src.api.routes import tasks
+
+        events = [{"type": "slash_command", "text": "ok"}, {"type": "bogus"}]
+        response = TestClient(app[0]).post("/webhooks/slack/batch", json={"events": events})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][:3] == ["body", "events", 1]
+        assert not tasks._tasks
+
+    def test_batch_over_org_limit_creates_no_tasks(self, app):
+        """Should 429 up front when the batch would push an org past its limit."""
+        from fastapi.testclient import TestClient
+
+        from src.api.routes import tasks
+        from src.api.services.event_batcher import EVENT_ORG_MAX_PENDING
+
+        _, _, batcher = app
+        batcher._pending["T1"] = EVENT_ORG_MAX_PENDING - 2
+        events = [{"type": "slash_command", "text": str(i), "team_id": "T1"} for i in range(3)]
+
+        response = TestClient(app[0]).post("/webhooks/slack/batch", json={"events": events})
+
+        assert response.status_code == 429
+        assert not tasks._tasks
+
+    def test_batch_filling_org_limit_exactly_is_accepted(self, app):
+        """Should accept a batch that uses exactly the remaining capacity."""
+        from fastapi.testclient import TestClient
+
+        from src.api.services.event_batcher import EVENT_ORG_MAX_PENDING
+
+        _, _, batcher = app
+        batcher._pending["T1"] = EVENT_ORG_MAX_PENDING - 2
+        events = [{"type": "slash_command", "text": str(i), "team_id": "T1"} for i in range(2)]
+
+        response = TestClient(app[0]).post("/webhooks/slack/batch", json={"events": events})
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 2
+
+
+class TestBuildSlackTaskSummary:
+    """Test Slack summary truncation."""
+
+    def test_truncates_only_past_50_chars(self):
+        """Should keep 50-char text whole and truncate longer text with an ellipsis."""
+        from src.api.routes.webhooks import _build_slack_task_summary
+        from src.api.schemas.webhooks import SlackSlashCommand
+
+        payload = SlackSlashCommand(type="slash_command", command="/aleq")
+
+        assert _build_slack_task_summary(payload, "x" * 50) == f"Slack request: /aleq {'x' * 50}"
+        assert _build_slack_task_summary(payload, "x" * 51) == (
+            f"Slack request: /aleq {'x' * 50}..."
+        )
+
+    def test_app_mention_uses_event_text(self, app):
+        """Should dispatch app_mention to the event variant and summarize its text."""
+        from fastapi.testclient import TestClient
+
+        from src.api.routes import tasks
+
+        response = TestClient(app[0]).post(
+            "/webhooks/slack",
+            json={"type": "app_mention", "event": {"text": "close the books"}, "team_id": "T1"},
+        )
+
+        task = tasks._tasks[response.json()["task_id"]]
+        assert task.summary == "Slack request: @aleq close the books"